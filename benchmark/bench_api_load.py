@@ -0,0 +1,349 @@
+"""Load test the REST API with realistic mixes of requests and SDK callbacks.
+
+The Flask app runs against the benchmark database with a fake OmotesInterface, so no RabbitMQ or
+orchestrator is needed. For each scenario the throughput, the p50/p99 latency of the operations
+and the peak resident set size of the process are reported.
+
+Usage: PYTHONPATH=src python benchmark/bench_api_load.py [--scenario NAME ...] [--threads N]
+[--json FILE]
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import argparse
+import base64
+import functools
+import gc
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable
+from unittest.mock import patch
+
+from flask.testing import FlaskClient
+from omotes_sdk.omotes_interface import JobResult, JobStatusUpdate
+
+from omotes_rest.main import app
+from omotes_rest.postgres_interface import PostgresInterface
+from omotes_rest.rest_interface import RestInterface
+from omotes_rest.typed_app import current_app
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    latency_percentiles,
+    peak_rss_bytes,
+    reset_peak_rss,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+)
+from fake_omotes_interface import BENCHMARK_WORKFLOW_TYPE, FakeOmotesInterface
+
+Operation = Callable[[], bool]
+"""A single timed operation, returns whether it succeeded."""
+
+
+@dataclass
+class LoadResult:
+    """Result of a load scenario."""
+
+    scenario: str
+    operations: int
+    errors: int
+    duration_s: float
+    throughput_per_s: float
+    p50_ms: float
+    p99_ms: float
+    peak_rss_mb: float
+
+
+def create_job_body(esdl_size: int, job_name: str = "benchmark job") -> bytes:
+    """Create the JSON body to submit a job with a random ESDL, encoded as base64.
+
+    :param esdl_size: Size of the ESDL in bytes.
+    :param job_name: Name of the job.
+    :return: The JSON body.
+    """
+    esdl = os.urandom(esdl_size // 2).hex().encode("ascii")
+    input_esdl = base64.b64encode(esdl).decode("ascii")
+    return json.dumps(
+        {
+            "job_name": job_name,
+            "workflow_type": BENCHMARK_WORKFLOW_TYPE.workflow_type_name,
+            "user_name": "user 1",
+            "project_name": "project 1",
+            "input_esdl": input_esdl,
+            "input_params_dict": {},
+            "timeout_after_s": 3600,
+        }
+    ).encode("utf-8")
+
+
+class LoadTest:
+    """Runs load scenarios against the Flask app with a fake OmotesInterface."""
+
+    def __init__(self, postgres_if: PostgresInterface, threads: int):
+        """Create the RestInterface of the app with a fake OmotesInterface.
+
+        :param postgres_if: The PostgresInterface on the benchmark database.
+        :param threads: Number of threads sending requests and callbacks concurrently.
+        """
+        self.fake_omotes_if = FakeOmotesInterface()
+        with (
+            app.app_context(),
+            patch("omotes_rest.rest_interface.OmotesInterface", return_value=self.fake_omotes_if),
+        ):
+            current_app.rest_if = RestInterface()
+            current_app.rest_if.postgres_if = postgres_if
+            self.rest_if = current_app.rest_if
+        self.threads = threads
+        self._thread_local = threading.local()
+
+    def client(self) -> FlaskClient:
+        """Get the test client of the current thread.
+
+        :return: The test client.
+        """
+        if not hasattr(self._thread_local, "client"):
+            self._thread_local.client = app.test_client()
+        client: FlaskClient = self._thread_local.client
+        return client
+
+    def get(self, url: str) -> bool:
+        """Send a GET request.
+
+        :param url: Url of the request.
+        :return: True if the response has status 200.
+        """
+        return self.client().get(url).status_code == 200
+
+    def post(self, url: str, body: bytes) -> bool:
+        """Send a POST request with a JSON body.
+
+        :param url: Url of the request.
+        :param body: The JSON body.
+        :return: True if the response has a 2xx status.
+        """
+        response = self.client().post(url, data=body, content_type="application/json")
+        return 200 <= response.status_code < 300
+
+    def callback(self, send: Callable[[], None]) -> bool:
+        """Send a callback from the fake OmotesInterface to the RestInterface.
+
+        :param send: Function sending the callback.
+        :return: True.
+        """
+        send()
+        return True
+
+    def submit_jobs(self, number_of_jobs: int) -> list[uuid.UUID]:
+        """Submit jobs with a small ESDL through the API and wait until they are published.
+
+        :param number_of_jobs: Number of jobs to submit.
+        :return: The job ids.
+        """
+        body = create_job_body(1000)
+        job_ids = []
+        for _ in range(number_of_jobs):
+            response = self.client().post("/job/", data=body, content_type="application/json")
+            job_ids.append(uuid.UUID(response.json["job_id"]))  # type: ignore[index]
+        published_jobs = len(self.fake_omotes_if.submitted_job_ids)
+        self.rest_if.job_outbox_relay.notify()
+        self.fake_omotes_if.wait_for_submissions(published_jobs + number_of_jobs, timeout_s=60)
+        return job_ids
+
+    @staticmethod
+    def _timed(operation: Operation) -> tuple[float, bool]:
+        start = time.perf_counter()
+        try:
+            succeeded = operation()
+        except Exception:
+            succeeded = False
+        return time.perf_counter() - start, succeeded
+
+    def run(self, scenario: str, operations: list[Operation]) -> LoadResult:
+        """Run operations concurrently and measure them.
+
+        :param scenario: Name of the scenario.
+        :param operations: The operations, started in order.
+        :return: The result of the scenario.
+        """
+        gc.collect()
+        reset_peak_rss()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(self.threads) as executor:
+            timings = list(executor.map(self._timed, operations))
+        duration_s = time.perf_counter() - start
+
+        p50_ms, p99_ms = latency_percentiles([latency for latency, _ in timings])
+        return LoadResult(
+            scenario=scenario,
+            operations=len(timings),
+            errors=sum(not succeeded for _, succeeded in timings),
+            duration_s=duration_s,
+            throughput_per_s=len(timings) / duration_s,
+            p50_ms=p50_ms,
+            p99_ms=p99_ms,
+            peak_rss_mb=peak_rss_bytes() / 1024 / 1024,
+        )
+
+    def submit_scenarios(self) -> list[LoadResult]:
+        """Submit jobs with 1, 10 and 50 MB ESDLs."""
+        results = []
+        for size_mb, number_of_jobs in ((1, 40), (10, 8), (50, 2)):
+            body = create_job_body(size_mb * 1024 * 1024)
+            operation = functools.partial(self.post, "/job/", body)
+            results.append(self.run(f"submit {size_mb}MB ESDL", [operation] * number_of_jobs))
+        return results
+
+    def list_scenarios(self) -> list[LoadResult]:
+        """List all jobs and the jobs of a user and project.
+
+        The list endpoints are not paginated, so each request returns all matching jobs.
+        """
+        return [
+            self.run("list all jobs", [functools.partial(self.get, "/job/")] * 20),
+            self.run("list jobs of user", [functools.partial(self.get, "/job/user/user 1")] * 100),
+            self.run(
+                "list jobs of project",
+                [functools.partial(self.get, "/job/project/project 1")] * 50,
+            ),
+        ]
+
+    def status_polling_scenarios(self, job_ids: list[uuid.UUID]) -> list[LoadResult]:
+        """Poll the status of single jobs and of batches of 100 jobs."""
+        rng = random.Random(0)
+        single_operations: list[Operation] = [
+            functools.partial(self.get, f"/job/{rng.choice(job_ids)}/status") for _ in range(2000)
+        ]
+        batch_operations: list[Operation] = [
+            functools.partial(
+                self.post,
+                "/job/status",
+                json.dumps(
+                    {"job_ids": [str(job_id) for job_id in rng.sample(job_ids, 100)]}
+                ).encode("utf-8"),
+            )
+            for _ in range(200)
+        ]
+        return [
+            self.run("poll status of a job", single_operations),
+            self.run("poll status of 100 jobs", batch_operations),
+        ]
+
+    def progress_storm_scenario(self) -> list[LoadResult]:
+        """Send the status updates, 50 progress updates and a 100 KB result of 200 running jobs.
+
+        The callbacks are sent in rounds over all jobs, as an orchestrator running many jobs
+        concurrently would.
+        """
+        job_ids = self.submit_jobs(200)
+        output_esdl = "x" * 100 * 1024
+        operations: list[Operation] = []
+        for job_id in job_ids:
+            send = functools.partial(
+                self.fake_omotes_if.send_status_update, job_id, JobStatusUpdate.JobStatus.RUNNING
+            )
+            operations.append(functools.partial(self.callback, send))
+        for progress_round in range(1, 51):
+            for job_id in job_ids:
+                send = functools.partial(
+                    self.fake_omotes_if.send_progress_update,
+                    job_id,
+                    progress_round / 50,
+                    f"Step {progress_round}.",
+                )
+                operations.append(functools.partial(self.callback, send))
+        for job_id in job_ids:
+            send = functools.partial(
+                self.fake_omotes_if.send_result,
+                job_id,
+                JobResult.ResultType.SUCCEEDED,
+                output_esdl,
+                "Finished.",
+            )
+            operations.append(functools.partial(self.callback, send))
+        return [self.run("progress update storm", operations)]
+
+    def mixed_scenario(self, job_ids: list[uuid.UUID]) -> list[LoadResult]:
+        """Mix status polling, listing, job details, submits and progress updates."""
+        rng = random.Random(0)
+        running_job_ids = self.submit_jobs(50)
+        submit_body = create_job_body(1024 * 1024)
+        operations: list[Operation] = []
+        for _ in range(2000):
+            draw = rng.random()
+            if draw < 0.6:
+                operations.append(functools.partial(self.get, f"/job/{rng.choice(job_ids)}/status"))
+            elif draw < 0.7:
+                operations.append(functools.partial(self.get, "/job/user/user 1"))
+            elif draw < 0.75:
+                operations.append(functools.partial(self.get, f"/job/{rng.choice(job_ids)}"))
+            elif draw < 0.76:
+                operations.append(functools.partial(self.post, "/job/", submit_body))
+            else:
+                send = functools.partial(
+                    self.fake_omotes_if.send_progress_update,
+                    rng.choice(running_job_ids),
+                    rng.random(),
+                    "Running.",
+                )
+                operations.append(functools.partial(self.callback, send))
+        return [self.run("mixed", operations)]
+
+
+SCENARIOS = ["submit", "list", "status_polling", "progress_storm", "mixed"]
+
+
+def print_load_result(result: LoadResult) -> None:
+    """Print the result of a load scenario.
+
+    :param result: The result.
+    """
+    print(
+        f"{result.scenario:<25} {result.operations:>6} ops {result.errors:>4} errors"
+        f" {result.throughput_per_s:>9.1f} ops/s   p50 {result.p50_ms:>8.2f} ms"
+        f"   p99 {result.p99_ms:>8.2f} ms   peak RSS {result.peak_rss_mb:>7.1f} MB"
+    )
+
+
+def main() -> None:
+    """Run the load scenarios."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", action="append", choices=SCENARIOS, dest="scenarios")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--json", help="Write the results to this JSON file.")
+    args = parser.parse_args()
+
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        job_ids = insert_benchmark_jobs(postgres_if, 10000)
+        load_test = LoadTest(postgres_if, args.threads)
+        load_test.rest_if.job_outbox_relay.start()
+        scenario_functions: dict[str, Callable[[], list[LoadResult]]] = {
+            "submit": load_test.submit_scenarios,
+            "list": load_test.list_scenarios,
+            "status_polling": functools.partial(load_test.status_polling_scenarios, job_ids),
+            "progress_storm": load_test.progress_storm_scenario,
+            "mixed": functools.partial(load_test.mixed_scenario, job_ids),
+        }
+        results = []
+        for scenario in args.scenarios or SCENARIOS:
+            for result in scenario_functions[scenario]():
+                print_load_result(result)
+                results.append(result)
+        load_test.rest_if.job_outbox_relay.stop()
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([asdict(result) for result in results], file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Stress the callback handlers of the RestInterface with simulated jobs.
+
+Thousands of jobs are submitted to a RestInterface with a simulated OmotesInterface, which sends
+the status updates, progress updates and result of each job to the callback handlers. The
+callback-to-database latency per message kind, the message throughput and the peak resident set
+size of the process are reported.
+
+Usage: PYTHONPATH=src python benchmark/bench_callback_stress.py [--jobs N] [--progress-updates N]
+[--update-interval-s S] [--output-esdl-size BYTES] [--callback-threads N]
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import argparse
+import time
+from unittest.mock import patch
+
+from sqlalchemy import func, select
+
+from omotes_rest.apis.api_dataclasses import JobInput
+from omotes_rest.db_models.job_rest import JobRest, JobRestStatus
+from omotes_rest.rest_interface import RestInterface
+
+from bench_utils import (
+    latency_percentiles,
+    peak_rss_bytes,
+    reset_peak_rss,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+)
+from fake_omotes_interface import BENCHMARK_WORKFLOW_TYPE
+from omotes_simulator import SimulatedOmotesInterface, SimulatorConfig
+
+
+def main() -> None:
+    """Run the stress test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=2000)
+    parser.add_argument("--progress-updates", type=int, default=20)
+    parser.add_argument("--update-interval-s", type=float, default=0.5)
+    parser.add_argument("--output-esdl-size", type=int, default=1024 * 1024)
+    parser.add_argument("--callback-threads", type=int, default=4)
+    args = parser.parse_args()
+
+    simulator = SimulatedOmotesInterface(
+        SimulatorConfig(
+            progress_updates_per_job=args.progress_updates,
+            update_interval_s=args.update_interval_s,
+            output_esdl_size=args.output_esdl_size,
+            callback_threads=args.callback_threads,
+        )
+    )
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        with patch("omotes_rest.rest_interface.OmotesInterface", return_value=simulator):
+            rest_if = RestInterface()
+        rest_if.postgres_if = postgres_if
+        simulator.start()
+        rest_if.job_outbox_relay.start()
+
+        reset_peak_rss()
+        start = time.monotonic()
+        for i in range(args.jobs):
+            rest_if.submit_job(
+                JobInput(
+                    job_name=f"job {i}",
+                    workflow_type=BENCHMARK_WORKFLOW_TYPE.workflow_type_name,
+                    user_name=f"user {i % 10}",
+                    project_name=f"project {i % 5}",
+                    input_esdl="x" * 1000,
+                )
+            )
+        submit_duration_s = time.monotonic() - start
+        simulator.wait_for_submissions(args.jobs)
+        simulator.wait_until_finished()
+        duration_s = time.monotonic() - start
+        rest_if.job_outbox_relay.stop()
+        simulator.stop()
+
+        messages = sum(len(latencies) for latencies in simulator.latencies_s.values())
+        print(
+            f"{args.jobs} jobs submitted in {submit_duration_s:.1f} s, {messages} messages"
+            f" handled in {duration_s:.1f} s ({messages / duration_s:.1f} messages/s)"
+        )
+        for kind, latencies in simulator.latencies_s.items():
+            if latencies:
+                p50_ms, p99_ms = latency_percentiles(latencies)
+                print(
+                    f"{kind + ' callback-to-DB latency':<35} {len(latencies):>7} messages"
+                    f"   p50 {p50_ms:>8.2f} ms   p99 {p99_ms:>8.2f} ms"
+                    f"   max {max(latencies) * 1e3:>8.2f} ms"
+                )
+        print(f"peak RSS {peak_rss_bytes() / 1024 / 1024:.1f} MB")
+
+        with postgres_if.engine.connect() as conn:
+            succeeded_jobs = conn.scalar(
+                select(func.count())
+                .select_from(JobRest)
+                .where(JobRest.status == JobRestStatus.SUCCEEDED)
+            )
+        print(f"{succeeded_jobs} of {args.jobs} jobs succeeded in the database")
+        if simulator.failed_job_ids:
+            print(f"{len(simulator.failed_job_ids)} jobs failed in a callback handler")
+    finally:
+        simulator.stop()
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Compare the per-row dump cost of marshmallow schemas with the generated dump functions.
+
+Usage: PYTHONPATH=src python benchmark/bench_dump_functions.py
+"""
+
+import uuid
+from datetime import datetime, timezone
+from functools import partial
+from typing import Any
+
+from marshmallow import Schema
+
+from omotes_rest.apis.api_dataclasses import (
+    JobRestStatus,
+    JobResponse,
+    JobStatusBatchResponse,
+    JobStatusProgress,
+    JobSummary,
+)
+from omotes_rest.apis.dump_functions import compile_dump_function
+from omotes_rest.db_models.job_rest import JobRest
+
+from bench_utils import print_result, time_per_call
+
+
+def create_job() -> JobRest:
+    """Create a job with all fields set.
+
+    :return: The job.
+    """
+    now = datetime.now(timezone.utc)
+    job_fields: dict[str, Any] = {
+        "job_id": uuid.uuid4(),
+        "job_name": "job",
+        "workflow_type": "grow_optimizer_default",
+        "status": JobRestStatus.SUCCEEDED,
+        "progress_fraction": 1.0,
+        "progress_message": "Finished.",
+        "registered_at": now,
+        "submitted_at": now,
+        "running_at": now,
+        "stopped_at": now,
+        "timeout_after_s": 3600,
+        "user_name": "user",
+        "project_name": "project",
+        "input_params_dict": {"key": 1},
+        "input_esdl": "x" * 1000,
+        "output_esdl": "x" * 1000,
+        "logs": "Some logs.",
+        "esdl_feedback": {"general": []},
+        "job_priority": "medium",
+    }
+    return JobRest(**job_fields)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    number_of_rows = 1000
+    jobs = [create_job() for _ in range(number_of_rows)]
+    job_statuses = JobStatusBatchResponse(
+        jobs=[
+            JobStatusProgress(
+                job_id=job.job_id,
+                status=JobRestStatus.RUNNING,
+                progress_fraction=0.5,
+                progress_message="Running.",
+            )
+            for job in jobs
+        ],
+        unknown_job_ids=[],
+    )
+
+    cases: list[tuple[str, Schema, Any]] = [
+        ("JobSummary", JobSummary.Schema(many=True), jobs),
+        ("JobResponse", JobResponse.Schema(many=True), jobs),
+        ("JobStatusBatchResponse", JobStatusBatchResponse.Schema(), job_statuses),
+    ]
+    for name, schema, obj in cases:
+        dump_function = compile_dump_function(schema)
+        for dump_name, dump in (("marshmallow", schema.dump), ("generated", dump_function)):
+            median_us, min_us = time_per_call(partial(dump, obj), repeat=5, number=10)
+            print_result(
+                f"{name} {dump_name} (per row)",
+                median_us / number_of_rows,
+                min_us / number_of_rows,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Compare exporting the job history with retrieving the job list and then each job.
+
+The export streams the jobs in chunks through a server-side cursor and skips the ESDLs, so its
+memory use does not grow with the number of jobs.
+
+Usage: PYTHONPATH=src python benchmark/bench_job_export.py [--jobs N] [--esdl-size BYTES]
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import argparse
+import functools
+import gc
+import time
+from typing import Any, Callable
+
+from omotes_rest.apis.api_dataclasses import JobExportQuery
+from omotes_rest.config import JobExportConfig
+from omotes_rest.job_export import EXPORT_FORMATS, export_jobs
+from omotes_rest.postgres_interface import PostgresInterface
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    peak_rss_bytes,
+    reset_peak_rss,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+)
+
+
+def measure(name: str, function: Callable[[], int]) -> None:
+    """Run a function once and print its duration, peak memory growth and output size.
+
+    :param name: Name of the benchmark.
+    :param function: Function to run, returning the number of bytes it produced.
+    """
+    gc.collect()
+    reset_peak_rss()
+    baseline = peak_rss_bytes()
+    start = time.perf_counter()
+    size = function()
+    duration = time.perf_counter() - start
+    peak_growth = peak_rss_bytes() - baseline
+    print(
+        f"{name:<40} {duration:>8.2f} s   peak RSS +{peak_growth / 2**20:>7.1f} MiB"
+        f"   {size / 2**20:>8.1f} MiB output"
+    )
+
+
+def retrieve_each_job(postgres_if: PostgresInterface) -> int:
+    """Retrieve the job list and then each job, as clients did before the export.
+
+    :param postgres_if: Interface to the benchmark database.
+    :return: Total size of the ESDLs retrieved.
+    """
+    jobs: list[Any] = []
+    for summary in postgres_if.get_jobs():
+        jobs.append(postgres_if.get_job(summary.job_id))
+    return sum(len(job.input_esdl) + len(job.output_esdl or "") for job in jobs)
+
+
+def export(postgres_if: PostgresInterface, query: JobExportQuery) -> int:
+    """Export the jobs and discard the exported data.
+
+    :param postgres_if: Interface to the benchmark database.
+    :param query: Export query.
+    :return: Size of the exported data.
+    """
+    return sum(len(data) for data in export_jobs(postgres_if, query, JobExportConfig()))
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--jobs", type=int, default=20000)
+    parser.add_argument("--esdl-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        insert_benchmark_jobs(postgres_if, args.jobs, args.esdl_size)
+        print(f"{args.jobs} jobs with {args.esdl_size} B input and output ESDL")
+        measure("get_jobs + get_job per job", lambda: retrieve_each_job(postgres_if))
+        for export_format in EXPORT_FORMATS:
+            measure(
+                f"export {export_format}",
+                functools.partial(export, postgres_if, JobExportQuery(format=export_format)),
+            )
+        measure(
+            "export ndjson with ESDL",
+            lambda: export(postgres_if, JobExportQuery(include_esdl=True)),
+        )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
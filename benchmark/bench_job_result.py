@@ -0,0 +1,116 @@
+"""Measure the peak memory of storing large job results which arrive at the same time.
+
+The results are handled concurrently as in the executor threads of the SDK, once by writing
+them as statement parameters as before and once through `handle_on_job_finished`, which spills
+large results to a file within the in-flight budget and streams them to the database with COPY.
+
+Usage: PYTHONPATH=src python benchmark/bench_job_result.py [--results N] [--result-size BYTES]
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import argparse
+import gc
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+from unittest.mock import MagicMock, patch
+
+from omotes_sdk_protocol.job_pb2 import JobResult
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.job_partitions import new_job_id
+from omotes_rest.postgres_interface import PostgresInterface
+from omotes_rest.rest_interface import RestInterface
+
+from bench_utils import (
+    peak_rss_bytes,
+    reset_peak_rss,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+)
+
+
+def measure(
+    name: str,
+    postgres_if: PostgresInterface,
+    serialized_results: list[bytes],
+    handle: Callable[[MagicMock, JobResult], None],
+) -> None:
+    """Handle the results concurrently and print the duration and peak memory growth.
+
+    Each result is parsed in its thread before it is handled, as the SDK does, so the parsed
+    results are included in the peak memory growth.
+
+    :param name: Name of the benchmark.
+    :param postgres_if: Interface to the benchmark database.
+    :param serialized_results: Serialized job results to handle.
+    :param handle: Function handling the result of a job.
+    """
+    jobs = []
+    for _ in serialized_results:
+        job_id = new_job_id()
+        postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+        jobs.append(MagicMock(id=job_id))
+
+    def parse_and_handle(job: MagicMock, serialized_result: bytes) -> None:
+        handle(job, JobResult.FromString(serialized_result))
+
+    gc.collect()
+    reset_peak_rss()
+    baseline = peak_rss_bytes()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(serialized_results)) as executor:
+        list(executor.map(parse_and_handle, jobs, serialized_results))
+    duration = time.perf_counter() - start
+    peak_growth = peak_rss_bytes() - baseline
+    print(f"{name:<40} {duration:>8.2f} s   peak RSS +{peak_growth / 2**20:>7.1f} MiB")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--results", type=int, default=4)
+    parser.add_argument("--result-size", type=int, default=100 * 2**20)
+    args = parser.parse_args()
+
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        with (
+            patch("omotes_rest.rest_interface.OmotesInterface"),
+            patch("omotes_rest.rest_interface.PostgresInterface"),
+        ):
+            rest_if = RestInterface()
+        rest_if.postgres_if = postgres_if
+        serialized_results = [
+            JobResult(
+                result_type=JobResult.ResultType.SUCCEEDED,
+                output_esdl="x" * args.result_size,
+                logs="log line\n" * 1000,
+            ).SerializeToString()
+            for _ in range(args.results)
+        ]
+        print(
+            f"{args.results} results of {args.result_size / 2**20:.0f} MiB, in-flight budget"
+            f" {rest_if.job_result_config.in_flight_budget_bytes / 2**20:.0f} MiB"
+        )
+        measure(
+            "set_job_stopped with parameters",
+            postgres_if,
+            serialized_results,
+            lambda job, result: postgres_if.set_job_stopped(
+                job.id, JobRestStatus.SUCCEEDED, result.logs, result.output_esdl
+            ),
+        )
+        measure(
+            "handle_on_job_finished",
+            postgres_if,
+            serialized_results,
+            rest_if.handle_on_job_finished,
+        )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Compare memory and CPU per row of the job summary lists.
+
+Compares ORM instances serialized by marshmallow, as done before, with Core rows serialized by
+marshmallow and with `JobSummaryRecord` tuples serialized by `dump_job_summaries`.
+
+Usage: PYTHONPATH=src python benchmark/bench_job_summaries.py
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import tracemalloc
+from functools import partial
+from typing import Any, Callable
+
+from sqlalchemy import select
+from sqlalchemy.orm import load_only
+
+from omotes_rest.apis.api_dataclasses import JobSummary
+from omotes_rest.apis.job_summary import dump_job_summaries
+from omotes_rest.db_models.job_rest import JobRest
+from omotes_rest.postgres_interface import SELECT_JOB_SUMMARY_STMT, session_scope
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    print_result,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+    time_per_call,
+)
+
+NUMBER_OF_JOBS = 10000
+
+
+def get_jobs_as_orm_instances() -> list[JobRest]:
+    """Retrieve the job summaries as ORM instances, as done before the Core read path.
+
+    :return: List of jobs.
+    """
+    with session_scope(do_expunge=True) as session:
+        stmnt = select(JobRest).options(
+            load_only(
+                JobRest.job_id,
+                JobRest.job_name,
+                JobRest.workflow_type,
+                JobRest.status,
+                JobRest.progress_fraction,
+                JobRest.registered_at,
+                JobRest.running_at,
+                JobRest.stopped_at,
+                JobRest.user_name,
+                JobRest.project_name,
+            )
+        )
+        jobs = list(session.scalars(stmnt).all())
+    return jobs
+
+
+def measure_bytes_per_row(function: Callable[[], list[Any]]) -> float:
+    """Measure the memory held by the result of a function per row.
+
+    :param function: Function returning a list of rows.
+    :return: Allocated bytes per row of the returned list.
+    """
+    tracemalloc.start()
+    rows = function()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return allocated / len(rows)
+
+
+def fetch_and_serialize(
+    fetch_function: Callable[[], list[Any]], serialize: Callable[[list[Any]], Any]
+) -> Any:
+    """Fetch the job summaries and serialize them.
+
+    :param fetch_function: Function returning the job summaries.
+    :param serialize: Function serializing the job summaries.
+    :return: Serialized job summaries.
+    """
+    return serialize(fetch_function())
+
+
+def main() -> None:
+    """Run the benchmark."""
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        insert_benchmark_jobs(postgres_if, NUMBER_OF_JOBS)
+
+        def get_jobs_as_rows() -> list[Any]:
+            with postgres_if.read_scope() as connection:
+                return list(connection.execute(SELECT_JOB_SUMMARY_STMT).all())
+
+        fetch_functions: list[tuple[str, Callable[[], list[Any]]]] = [
+            ("ORM instances", get_jobs_as_orm_instances),
+            ("Core rows", get_jobs_as_rows),
+            ("JobSummaryRecord", postgres_if.get_jobs),
+        ]
+        for name, fetch_function in fetch_functions:
+            print(f"{name:<50} {measure_bytes_per_row(fetch_function):>10.1f} bytes per row")
+
+        schema = JobSummary.Schema(many=True)
+        serializers: list[tuple[str, Callable[[], list[Any]], Callable[[list[Any]], Any]]] = [
+            ("ORM instances + marshmallow", get_jobs_as_orm_instances, schema.dump),
+            ("Core rows + marshmallow", get_jobs_as_rows, schema.dump),
+            ("JobSummaryRecord + dump_job_summaries", postgres_if.get_jobs, dump_job_summaries),
+        ]
+        for name, fetch_function, serialize in serializers:
+            median_us, min_us = time_per_call(
+                partial(fetch_and_serialize, fetch_function, serialize), repeat=5, number=1
+            )
+            print_result(f"{name} (per row)", median_us / NUMBER_OF_JOBS, min_us / NUMBER_OF_JOBS)
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare Flask's default JSON provider with the orjson provider on the job endpoints.
+
+Usage: PYTHONPATH=src python benchmark/bench_json_provider.py
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+from unittest.mock import patch
+
+from flask.json.provider import DefaultJSONProvider
+
+from omotes_rest.json_provider import OrjsonProvider
+from omotes_rest.main import app
+from omotes_rest.rest_interface import RestInterface
+from omotes_rest.typed_app import current_app
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    print_result,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+    time_per_call,
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        insert_benchmark_jobs(postgres_if, 9999)
+        job_id = insert_benchmark_jobs(postgres_if, 1, esdl_size=1000000)[0]
+        with app.app_context(), patch("omotes_rest.rest_interface.OmotesInterface"):
+            current_app.rest_if = RestInterface()
+            current_app.rest_if.postgres_if = postgres_if
+        client = app.test_client()
+
+        for json_provider_class in (DefaultJSONProvider, OrjsonProvider):
+            app.json = json_provider_class(app)
+            name = json_provider_class.__name__
+            print_result(
+                f"GET /job/ 10000 jobs, {name}",
+                *time_per_call(lambda: client.get("/job/"), repeat=5, number=5),
+            )
+            print_result(
+                f"GET /job/<job_id> 1MB ESDL, {name}",
+                *time_per_call(lambda: client.get(f"/job/{job_id}"), repeat=5, number=20),
+            )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
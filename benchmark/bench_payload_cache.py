@@ -0,0 +1,53 @@
+"""Compare retrieving the output ESDL of a stopped job from the database and the payload caches.
+
+Usage: PYTHONPATH=src python benchmark/bench_payload_cache.py
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import tempfile
+from unittest.mock import patch
+
+from omotes_rest.bytes_lru_cache import BytesLRUCache, DiskBytesLRUCache
+from omotes_rest.rest_interface import RestInterface
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    print_result,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+    time_per_call,
+)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        job_id = insert_benchmark_jobs(postgres_if, 1, esdl_size=1000000)[0]
+        with patch("omotes_rest.rest_interface.OmotesInterface"):
+            rest_if = RestInterface()
+        rest_if.postgres_if = postgres_if
+
+        print_result(
+            "get_job_output_esdl 1MB from database",
+            *time_per_call(lambda: postgres_if.get_job_output_esdl(job_id), repeat=5, number=50),
+        )
+        with tempfile.TemporaryDirectory(dir="/dev/shm") as cache_dir:
+            for name, payload_cache in (
+                ("in-process cache", BytesLRUCache[str](256 * 1024 * 1024)),
+                ("/dev/shm cache", DiskBytesLRUCache(cache_dir, 256 * 1024 * 1024)),
+            ):
+                rest_if.payload_cache = payload_cache
+                print_result(
+                    f"get_job_output_esdl 1MB from {name}",
+                    *time_per_call(
+                        lambda: rest_if.get_job_output_esdl(job_id), repeat=5, number=50
+                    ),
+                )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
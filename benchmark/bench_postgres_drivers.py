@@ -0,0 +1,104 @@
+"""Compare the callback write path and large result retrieval of psycopg2 and psycopg 3.
+
+With psycopg 3 the progress updates of many jobs are written in pipeline mode, the hot
+statements are prepared on the server and large payloads are read in binary format.
+
+Usage: PYTHONPATH=src python benchmark/bench_postgres_drivers.py [--batch-size N]
+[--output-esdl-size BYTES] [--large-result-size BYTES]
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import argparse
+import itertools
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    print_result,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+    time_per_call,
+)
+
+DRIVERS = ("psycopg2", "psycopg")
+
+
+def benchmark_driver(
+    driver: str, batch_size: int, output_esdl_size: int, large_result_size: int
+) -> None:
+    """Run the benchmarks with a single driver.
+
+    :param driver: Database driver to connect with.
+    :param batch_size: Number of jobs of which the progress is written in a single batch.
+    :param output_esdl_size: Size of the output ESDL written when a job is stopped.
+    :param large_result_size: Size of the output ESDL which is retrieved.
+    """
+    postgres_if = start_benchmark_postgres_interface(driver)
+    try:
+        job_ids = insert_benchmark_jobs(postgres_if, batch_size + 1)
+        progress = itertools.count()
+        next_job_id = itertools.cycle(job_ids).__next__
+
+        def set_job_progress() -> None:
+            postgres_if.set_job_progress(next_job_id(), next(progress) / 1e6, "Running.")
+
+        def set_jobs_progress() -> None:
+            fraction = next(progress) / 1e6
+            postgres_if.set_jobs_progress(
+                {job_id: (fraction, "Running.") for job_id in job_ids[:batch_size]}
+            )
+
+        output_esdl = "x" * output_esdl_size
+
+        def set_job_stopped() -> None:
+            postgres_if.set_job_stopped(
+                next_job_id(), JobRestStatus.SUCCEEDED, logs="Logs.", output_esdl=output_esdl
+            )
+
+        print_result(
+            f"[{driver}] set_job_progress per update",
+            *time_per_call(set_job_progress, repeat=5, number=500),
+        )
+        median_us, min_us = time_per_call(set_jobs_progress, repeat=5, number=20)
+        print_result(
+            f"[{driver}] set_jobs_progress per update (x{batch_size})",
+            median_us / batch_size,
+            min_us / batch_size,
+        )
+        print_result(
+            f"[{driver}] set_job_stopped ({output_esdl_size} B ESDL)",
+            *time_per_call(set_job_stopped, repeat=5, number=50),
+        )
+
+        large_job_id = job_ids[-1]
+        postgres_if.set_job_stopped(
+            large_job_id,
+            JobRestStatus.SUCCEEDED,
+            output_esdl="<esdl/>\n" * (large_result_size // 8),
+        )
+        print_result(
+            f"[{driver}] get_job_output_esdl ({large_result_size} B)",
+            *time_per_call(
+                lambda: postgres_if.get_job_output_esdl(large_job_id), repeat=5, number=5
+            ),
+        )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--output-esdl-size", type=int, default=1024 * 1024)
+    parser.add_argument("--large-result-size", type=int, default=50 * 1024 * 1024)
+    args = parser.parse_args()
+
+    for driver in DRIVERS:
+        benchmark_driver(driver, args.batch_size, args.output_esdl_size, args.large_result_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare the per-call overhead of ORM session reads with the Core read path.
+
+Usage: PYTHONPATH=src python benchmark/bench_postgres_reads.py
+with the BENCHMARK_POSTGRES_* environment variables pointing to a database that may be used
+for benchmarking.
+"""
+
+import uuid
+
+from sqlalchemy import select
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.db_models.job_rest import JobRest
+from omotes_rest.postgres_interface import session_scope
+
+from bench_utils import (
+    insert_benchmark_jobs,
+    print_result,
+    start_benchmark_postgres_interface,
+    stop_benchmark_postgres_interface,
+    time_per_call,
+)
+
+
+def get_job_status_with_session(job_id: uuid.UUID) -> JobRestStatus | None:
+    """Retrieve the job status through a scoped ORM session, as done before the read path.
+
+    :param job_id: Job id.
+    :return: Current job status.
+    """
+    with session_scope(do_expunge=True) as session:
+        stmnt = select(JobRest.status).where(JobRest.job_id == job_id)
+        job_status: JobRestStatus | None = session.scalar(stmnt)
+    return job_status
+
+
+def main() -> None:
+    """Run the benchmark."""
+    postgres_if = start_benchmark_postgres_interface()
+    try:
+        job_ids = insert_benchmark_jobs(postgres_if, 1000)
+        job_id = job_ids[0]
+
+        print_result(
+            "get_job_status via ORM session",
+            *time_per_call(lambda: get_job_status_with_session(job_id), repeat=5, number=1000),
+        )
+        print_result(
+            "get_job_status via read_scope",
+            *time_per_call(lambda: postgres_if.get_job_status(job_id), repeat=5, number=1000),
+        )
+    finally:
+        stop_benchmark_postgres_interface(postgres_if)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+"""Measure the import time of the service and the startup time and memory use of its workers.
+
+The import time of the main modules is compared with a budget. Gunicorn is started with and
+without preloading the app in the arbiter, and for each mode the time until all workers are
+ready, the time to replace a killed worker and the memory use per worker are reported. The
+proportional set size (PSS) divides memory shared copy-on-write between the processes, the
+unique set size (USS) is the memory private to a worker.
+
+Usage: PYTHONPATH=src python benchmark/bench_startup.py [--workers N]
+No database or RabbitMQ is needed, the workers get a fake OmotesInterface.
+"""
+
+import argparse
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(BENCHMARK_DIR, "..", "src")
+
+IMPORT_TIME_BUDGET_MS = {
+    "omotes_rest": 100,
+    "omotes_rest.db_models.job_rest": 800,
+    "omotes_rest.main": 1500,
+}
+"""Maximum import time of the modules in a new interpreter in milliseconds."""
+
+
+def subprocess_env(**variables: str) -> dict[str, str]:
+    """Environment of the subprocesses, with the source directory on the Python path.
+
+    :param variables: Additional environment variables.
+    :return: The environment.
+    """
+    return {**os.environ, "PYTHONPATH": SRC_DIR, "LOG_LEVEL": "WARNING", **variables}
+
+
+def import_time_ms(module: str, repeat: int = 5) -> float:
+    """Measure the median import time of a module in a new interpreter.
+
+    :param module: Name of the module.
+    :param repeat: Number of measurements.
+    :return: Median import time in milliseconds.
+    """
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    durations = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            check=True,
+            env=subprocess_env(),
+            text=True,
+        )
+        durations.append(float(result.stdout.splitlines()[-1]) * 1000)
+    return statistics.median(durations)
+
+
+def free_port() -> int:
+    """Find a free TCP port on localhost.
+
+    :return: The port.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port: int = sock.getsockname()[1]
+        return port
+
+
+def child_pids(pid: int) -> list[int]:
+    """Find the child processes of a process.
+
+    :param pid: Process id of the parent.
+    :return: Process ids of the children.
+    """
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as file:
+                stat = file.read()
+        except OSError:
+            continue
+        if int(stat.rsplit(")", 1)[1].split()[1]) == pid:
+            children.append(int(entry))
+    return children
+
+
+def memory_kb(pid: int) -> dict[str, int]:
+    """Get the RSS, PSS and USS of a process.
+
+    :param pid: Process id.
+    :return: Memory use in kB by type.
+    """
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as file:
+        for line in file:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                values[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "uss": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def wait_for_ready_workers(ready_dir: str, number_of_workers: int, timeout_s: float) -> float:
+    """Wait until workers recorded that they are ready.
+
+    :param ready_dir: Directory in which the workers record their ready time.
+    :param number_of_workers: Number of workers to wait for.
+    :param timeout_s: Maximum time to wait.
+    :return: Time at which the last worker was ready.
+    """
+    deadline = time.monotonic() + timeout_s
+    while len(os.listdir(ready_dir)) < number_of_workers:
+        if time.monotonic() > deadline:
+            raise TimeoutError("Workers did not become ready.")
+        time.sleep(0.01)
+    ready_times = []
+    for name in os.listdir(ready_dir):
+        with open(os.path.join(ready_dir, name)) as file:
+            ready_times.append(float(file.read()))
+    return max(ready_times)
+
+
+def benchmark_gunicorn(number_of_workers: int, preload_app: bool) -> None:
+    """Start gunicorn and report the startup time and memory use of the workers.
+
+    :param number_of_workers: Number of workers.
+    :param preload_app: Whether the app is loaded in the arbiter before forking the workers.
+    """
+    port = free_port()
+    with tempfile.TemporaryDirectory() as ready_dir:
+        start = time.time()
+        arbiter = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "gunicorn",
+                "--config",
+                os.path.join(BENCHMARK_DIR, "gunicorn_benchmark.conf.py"),
+                "--bind",
+                f"127.0.0.1:{port}",
+                "omotes_rest.main:app",
+            ],
+            env=subprocess_env(
+                GUNICORN_WORKERS=str(number_of_workers),
+                GUNICORN_PRELOAD_APP=str(preload_app).lower(),
+                BENCHMARK_WORKER_READY_DIR=ready_dir,
+            ),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            startup_s = wait_for_ready_workers(ready_dir, number_of_workers, 60) - start
+            for _ in range(10 * number_of_workers):
+                urllib.request.urlopen(f"http://127.0.0.1:{port}/openapi.json").read()
+
+            workers = child_pids(arbiter.pid)
+            worker_memory = [memory_kb(pid) for pid in workers]
+            arbiter_memory = memory_kb(arbiter.pid)
+
+            killed_at = time.time()
+            os.kill(workers[0], signal.SIGKILL)
+            os.remove(os.path.join(ready_dir, str(workers[0])))
+            replace_s = wait_for_ready_workers(ready_dir, number_of_workers, 60) - killed_at
+        finally:
+            arbiter.terminate()
+            arbiter.wait()
+
+    def average_mb(memory_type: str) -> float:
+        return statistics.mean(memory[memory_type] for memory in worker_memory) / 1024
+
+    print(
+        f"preload_app={str(preload_app):<5}  {number_of_workers} workers ready in"
+        f" {startup_s:5.2f} s   replace worker {replace_s:5.2f} s   arbiter RSS"
+        f" {arbiter_memory['rss'] / 1024:6.1f} MB   per worker RSS {average_mb('rss'):6.1f} MB"
+        f"  PSS {average_mb('pss'):6.1f} MB  USS {average_mb('uss'):6.1f} MB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    for module, budget_ms in IMPORT_TIME_BUDGET_MS.items():
+        duration_ms = import_time_ms(module)
+        verdict = "ok" if duration_ms <= budget_ms else "OVER BUDGET"
+        print(f"import {module:<35} {duration_ms:7.1f} ms   budget {budget_ms:5} ms   {verdict}")
+
+    for preload_app in (False, True):
+        benchmark_gunicorn(args.workers, preload_app)
+
+
+if __name__ == "__main__":
+    main()
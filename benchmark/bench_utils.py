@@ -0,0 +1,170 @@
+import gc
+import resource
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from sqlalchemy import event, insert, text
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.config import PostgresConfig
+from omotes_rest.db_models.job_rest import (
+    Base,
+    job_rest_table,
+    job_state_table,
+    split_job_columns,
+)
+from omotes_rest.postgres_interface import PostgresInterface
+
+BENCHMARK_SCHEMA = "omotes_rest_benchmark"
+
+
+def start_benchmark_postgres_interface(driver: str | None = None) -> PostgresInterface:
+    """Start a PostgresInterface on an empty schema of the BENCHMARK_POSTGRES_* database.
+
+    :param driver: Database driver to connect with, defaults to the configured driver.
+    :return: The started PostgresInterface.
+    """
+    config = PostgresConfig(prefix="BENCHMARK_")
+    if driver:
+        config.driver = driver
+    postgres_if = PostgresInterface(config)
+    postgres_if.start()
+
+    def set_search_path(dbapi_connection: Any, _: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET search_path TO {BENCHMARK_SCHEMA}")
+        cursor.close()
+
+    for engine in (postgres_if.engine, postgres_if.read_engine):
+        event.listen(engine, "connect", set_search_path)
+        # Connections opened by start() are pooled without the search path.
+        engine.dispose()
+
+    with postgres_if.engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {BENCHMARK_SCHEMA}"))
+    Base.metadata.create_all(postgres_if.engine)
+    return postgres_if
+
+
+def stop_benchmark_postgres_interface(postgres_if: PostgresInterface) -> None:
+    """Drop the benchmark schema and stop the PostgresInterface.
+
+    :param postgres_if: The PostgresInterface to stop.
+    """
+    with postgres_if.engine.begin() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {BENCHMARK_SCHEMA} CASCADE"))
+    postgres_if.stop()
+
+
+def insert_benchmark_jobs(
+    postgres_if: PostgresInterface, number_of_jobs: int, esdl_size: int = 1000
+) -> list[uuid.UUID]:
+    """Insert succeeded jobs spread over 10 users and 5 projects.
+
+    :param postgres_if: The PostgresInterface to insert the jobs with.
+    :param number_of_jobs: Number of jobs to insert.
+    :param esdl_size: Size of the input and output ESDL of each job in characters.
+    :return: The job ids.
+    """
+    now = datetime.now()
+    esdl = "x" * esdl_size
+    job_ids = [uuid.uuid4() for _ in range(number_of_jobs)]
+    jobs = [
+        dict(
+            job_id=job_id,
+            job_name=f"job {i}",
+            workflow_type="grow_optimizer_default",
+            job_priority="medium",
+            status=JobRestStatus.SUCCEEDED,
+            progress_fraction=1.0,
+            progress_message="Finished.",
+            registered_at=now - timedelta(minutes=i + 2),
+            submitted_at=now - timedelta(minutes=i + 2),
+            running_at=now - timedelta(minutes=i + 1),
+            stopped_at=now - timedelta(minutes=i),
+            timeout_after_s=3600,
+            user_name=f"user {i % 10}",
+            project_name=f"project {i % 5}",
+            input_params_dict={"key": i},
+            input_esdl=esdl,
+            output_esdl=esdl,
+            logs="Some logs.",
+        )
+        for i, job_id in enumerate(job_ids)
+    ]
+    job_rest_rows, job_state_rows = zip(*map(split_job_columns, jobs))
+    with postgres_if.engine.begin() as conn:
+        conn.execute(insert(job_rest_table), list(job_rest_rows))
+        conn.execute(insert(job_state_table), list(job_state_rows))
+    with postgres_if.engine.connect() as conn:
+        conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM ANALYZE"))
+    return job_ids
+
+
+def time_per_call(function: Callable[[], Any], repeat: int, number: int) -> tuple[float, float]:
+    """Time a function and return the median and minimum duration per call.
+
+    :param function: Function to time.
+    :param repeat: Number of timed rounds.
+    :param number: Number of calls per round.
+    :return: Median and minimum duration per call in microseconds.
+    """
+    function()
+    durations = []
+    gc.collect()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        durations.append((time.perf_counter() - start) / number * 1e6)
+    return statistics.median(durations), min(durations)
+
+
+def print_result(name: str, median_us: float, min_us: float) -> None:
+    """Print a single benchmark result.
+
+    :param name: Name of the benchmark.
+    :param median_us: Median duration per call in microseconds.
+    :param min_us: Minimum duration per call in microseconds.
+    """
+    print(f"{name:<50} median {median_us:>10.1f} us   min {min_us:>10.1f} us")
+
+
+def reset_peak_rss() -> None:
+    """Reset the peak resident set size of this process, only supported on Linux."""
+    try:
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+    except OSError:
+        pass
+
+
+def peak_rss_bytes() -> int:
+    """Get the peak resident set size of this process since the last reset.
+
+    :return: Peak resident set size in bytes.
+    """
+    try:
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def latency_percentiles(latencies_s: list[float]) -> tuple[float, float]:
+    """Compute the p50 and p99 latency.
+
+    :param latencies_s: Latencies in seconds.
+    :return: p50 and p99 latency in milliseconds.
+    """
+    if len(latencies_s) < 2:
+        return latencies_s[0] * 1e3, latencies_s[0] * 1e3
+    percentiles = statistics.quantiles(latencies_s, n=100, method="inclusive")
+    return percentiles[49] * 1e3, percentiles[98] * 1e3
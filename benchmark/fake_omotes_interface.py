@@ -0,0 +1,195 @@
+import threading
+import uuid
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Callable, Optional
+
+from omotes_sdk.omotes_interface import Job, JobProgressUpdate, JobResult, JobStatusUpdate
+from omotes_sdk.queue_names import OmotesQueueNames
+from omotes_sdk.workflow_type import WorkflowType, WorkflowTypeManager
+from omotes_sdk_protocol.job_pb2 import JobSubmission
+
+BENCHMARK_WORKFLOW_TYPE = WorkflowType(
+    workflow_type_name="grow_optimizer_default",
+    workflow_type_description_name="Benchmark workflow without parameters",
+)
+
+
+@dataclass
+class FakeJob:
+    """A job connected to the FakeOmotesInterface with its callbacks."""
+
+    job: Job
+    callback_on_finished: Callable[[Job, JobResult], None]
+    callback_on_progress_update: Optional[Callable[[Job, JobProgressUpdate], None]]
+    callback_on_status_update: Optional[Callable[[Job, JobStatusUpdate], None]]
+    submission: Optional[JobSubmission] = None
+    """The published job submission, None until it is received."""
+
+
+class FakeBrokerInterface:
+    """Stand-in for the broker interface of the OmotesInterface which receives job submissions."""
+
+    def __init__(self, omotes_if: "FakeOmotesInterface"):
+        """Create the fake broker interface.
+
+        :param omotes_if: The fake interface receiving the job submissions.
+        """
+        self.omotes_if = omotes_if
+
+    def send_message_to(self, exchange_name: str, routing_key: str, message: bytes) -> None:
+        """Receive a message, only job submissions are supported.
+
+        :param exchange_name: Name of the exchange.
+        :param routing_key: Routing key of the message.
+        :param message: The serialized message.
+        """
+        if routing_key != OmotesQueueNames.job_submission_queue_name():
+            raise NotImplementedError(f"Unsupported routing key {routing_key}")
+        self.omotes_if.receive_job_submission(JobSubmission.FromString(message))
+
+
+class FakeOmotesInterface:
+    """Stand-in for the OmotesInterface which accepts jobs without RabbitMQ or an orchestrator.
+
+    Implements the part of the OmotesInterface used by the RestInterface. Updates and results of
+    the submitted jobs are sent to the RestInterface callbacks by calling the `send_*` methods.
+    """
+
+    jobs: dict[uuid.UUID, FakeJob]
+    """Connected and not deleted jobs by job id."""
+    submitted_job_ids: list[uuid.UUID]
+    """Ids of the jobs of which the job submission is received, in order."""
+    deleted_job_ids: list[uuid.UUID]
+    """Ids of the deleted jobs."""
+    broker_if: FakeBrokerInterface
+    """Receives the published job submissions."""
+
+    def __init__(self, workflow_types: list[WorkflowType] | None = None):
+        """Create the fake interface.
+
+        :param workflow_types: Available workflow types, by default a single workflow type
+            without parameters.
+        """
+        self.workflow_type_manager = WorkflowTypeManager(
+            workflow_types or [BENCHMARK_WORKFLOW_TYPE]
+        )
+        self.jobs = {}
+        self.submitted_job_ids = []
+        self.deleted_job_ids = []
+        self.broker_if = FakeBrokerInterface(self)
+        self._lock = threading.Condition()
+
+    def start(self) -> None:
+        """Start the interface, nothing to connect to."""
+
+    def stop(self) -> None:
+        """Stop the interface, nothing to disconnect from."""
+
+    def get_workflow_type_manager(self) -> WorkflowTypeManager:
+        """Get the available workflow types.
+
+        :return: The workflow type manager.
+        """
+        return self.workflow_type_manager
+
+    def connect_to_submitted_job(
+        self,
+        job: Job,
+        callback_on_finished: Callable[[Job, JobResult], None],
+        callback_on_progress_update: Optional[Callable[[Job, JobProgressUpdate], None]],
+        callback_on_status_update: Optional[Callable[[Job, JobStatusUpdate], None]],
+        auto_disconnect_on_result: bool,
+        auto_cleanup_after_ttl: Optional[timedelta] = None,
+        reconnect: bool = True,
+    ) -> None:
+        """Connect the callbacks of a job, like `OmotesInterface.connect_to_submitted_job`."""
+        with self._lock:
+            self.jobs[job.id] = FakeJob(
+                job=job,
+                callback_on_finished=callback_on_finished,
+                callback_on_progress_update=callback_on_progress_update,
+                callback_on_status_update=callback_on_status_update,
+            )
+
+    def receive_job_submission(self, submission: JobSubmission) -> None:
+        """Accept the job submission of a connected job.
+
+        :param submission: The job submission.
+        """
+        job_id = uuid.UUID(submission.uuid)
+        with self._lock:
+            self.jobs[job_id].submission = submission
+            self.submitted_job_ids.append(job_id)
+            self._lock.notify_all()
+
+    def wait_for_submissions(self, number_of_jobs: int, timeout_s: float | None = None) -> bool:
+        """Wait until a number of job submissions are received.
+
+        :param number_of_jobs: Number of job submissions to wait for.
+        :param timeout_s: Maximum time to wait in seconds, wait indefinitely if None.
+        :return: True if the job submissions are received, False on timeout.
+        """
+        with self._lock:
+            return self._lock.wait_for(
+                lambda: len(self.submitted_job_ids) >= number_of_jobs, timeout_s
+            )
+
+    def delete_job(self, job: Job) -> None:
+        """Delete a job.
+
+        :param job: The job to delete.
+        """
+        with self._lock:
+            self.jobs.pop(job.id, None)
+            self.deleted_job_ids.append(job.id)
+
+    def send_status_update(
+        self, job_id: uuid.UUID, status: JobStatusUpdate.JobStatus.ValueType
+    ) -> None:
+        """Send a status update of a job to its status callback.
+
+        :param job_id: Job id.
+        :param status: The new status.
+        """
+        fake_job = self.jobs[job_id]
+        if fake_job.callback_on_status_update:
+            fake_job.callback_on_status_update(
+                fake_job.job, JobStatusUpdate(uuid=str(job_id), status=status)
+            )
+
+    def send_progress_update(self, job_id: uuid.UUID, progress: float, message: str) -> None:
+        """Send a progress update of a job to its progress callback.
+
+        :param job_id: Job id.
+        :param progress: Progress fraction.
+        :param message: Progress message.
+        """
+        fake_job = self.jobs[job_id]
+        if fake_job.callback_on_progress_update:
+            fake_job.callback_on_progress_update(
+                fake_job.job,
+                JobProgressUpdate(uuid=str(job_id), progress=progress, message=message),
+            )
+
+    def send_result(
+        self,
+        job_id: uuid.UUID,
+        result_type: JobResult.ResultType.ValueType,
+        output_esdl: str | None = None,
+        logs: str = "",
+    ) -> None:
+        """Send the result of a job to its finished callback.
+
+        :param job_id: Job id.
+        :param result_type: Type of the result.
+        :param output_esdl: Output ESDL of the job.
+        :param logs: Logs of the job.
+        """
+        fake_job = self.jobs[job_id]
+        fake_job.callback_on_finished(
+            fake_job.job,
+            JobResult(
+                uuid=str(job_id), result_type=result_type, output_esdl=output_esdl, logs=logs
+            ),
+        )
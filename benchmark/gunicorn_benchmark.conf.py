@@ -0,0 +1,40 @@
+"""Gunicorn configuration of the startup benchmark.
+
+Uses the production configuration, but the workers get a fake OmotesInterface so no RabbitMQ is
+needed.
+"""
+
+import os
+import runpy
+import sys
+import time
+from unittest.mock import patch
+
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.sync import SyncWorker
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, BENCHMARK_DIR)
+
+production_config = runpy.run_path(os.path.join(BENCHMARK_DIR, "..", "src", "gunicorn.conf.py"))
+workers = production_config["workers"]
+preload_app = production_config["preload_app"]
+timeout = production_config["timeout"]
+loglevel = "warning"
+pre_fork = production_config["pre_fork"]
+
+
+def post_fork(server: Arbiter, worker: SyncWorker) -> None:
+    """Called just after a worker has been forked."""
+    from fake_omotes_interface import FakeOmotesInterface
+
+    with patch("omotes_rest.rest_interface.OmotesInterface", return_value=FakeOmotesInterface()):
+        production_config["post_fork"](server, worker)
+
+
+def post_worker_init(worker: SyncWorker) -> None:
+    """Called just after a worker has loaded the app, records when the worker is ready."""
+    ready_dir = os.environ.get("BENCHMARK_WORKER_READY_DIR")
+    if ready_dir:
+        with open(os.path.join(ready_dir, str(os.getpid())), "w") as file:
+            file.write(str(time.time()))
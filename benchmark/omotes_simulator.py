@@ -0,0 +1,172 @@
+import heapq
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from omotes_sdk.omotes_interface import Job, JobResult, JobStatusUpdate
+from omotes_sdk_protocol.job_pb2 import JobSubmission
+
+from fake_omotes_interface import FakeOmotesInterface
+
+
+@dataclass
+class SimulatorConfig:
+    """Configuration of the messages the SimulatedOmotesInterface sends for each job."""
+
+    start_delay_s: float = 0.1
+    """Delay between the submission of a job and its first status update."""
+    progress_updates_per_job: int = 10
+    """Number of progress updates sent while a job is running."""
+    update_interval_s: float = 0.1
+    """Delay between the handling of a message of a job and its next message."""
+    output_esdl_size: int = 1000
+    """Size of the output ESDL in the result of each job in bytes."""
+    result_type: JobResult.ResultType.ValueType = JobResult.ResultType.SUCCEEDED
+    """Type of the result of each job."""
+    callback_threads: int = 4
+    """Number of threads handling the callbacks, like the consumers of the SDK."""
+
+
+class SimulatedOmotesInterface(FakeOmotesInterface):
+    """Fake OmotesInterface which runs every submitted job as a stream of callbacks.
+
+    Each job is enqueued, started, sends its progress updates and finishes with a result, as
+    configured by the SimulatorConfig. The messages of a job are sent in order, the next message
+    is scheduled after the previous one is handled. The messages of different jobs are handled
+    concurrently by a pool of callback threads.
+
+    For each message the latency from the moment it is due until its callback has returned, so
+    the database is updated, is recorded per message kind. This includes the time a message
+    waits for a free callback thread.
+    """
+
+    MESSAGE_KINDS = ("status", "progress", "result")
+
+    config: SimulatorConfig
+    """Configuration of the simulated jobs."""
+    latencies_s: dict[str, list[float]]
+    """Callback-to-database latency of the handled messages by message kind."""
+    failed_job_ids: list[uuid.UUID]
+    """Ids of the jobs of which a callback raised an exception, no further messages are sent."""
+
+    def __init__(self, config: SimulatorConfig):
+        """Create the simulator, the jobs are run after `start`.
+
+        :param config: Configuration of the simulated jobs.
+        """
+        super().__init__()
+        self.config = config
+        self.latencies_s = {kind: [] for kind in self.MESSAGE_KINDS}
+        self.failed_job_ids = []
+        self._output_esdl = "x" * config.output_esdl_size
+        self._schedule: list[tuple[float, int, uuid.UUID, int]] = []
+        self._schedule_sequence = 0
+        self._active_job_ids: set[uuid.UUID] = set()
+        self._condition = threading.Condition()
+        self._stopping = False
+        self._dispatcher: threading.Thread | None = None
+        self._executor: ThreadPoolExecutor | None = None
+
+    def start(self) -> None:
+        """Start sending the messages of the submitted jobs."""
+        self._stopping = False
+        self._executor = ThreadPoolExecutor(self.config.callback_threads)
+        self._dispatcher = threading.Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def stop(self) -> None:
+        """Stop sending messages, messages which are being handled are finished first."""
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        if self._dispatcher:
+            self._dispatcher.join()
+        if self._executor:
+            self._executor.shutdown(wait=True)
+
+    def receive_job_submission(self, submission: JobSubmission) -> None:
+        """Accept the job submission of a connected job and schedule its first message.
+
+        :param submission: The job submission.
+        """
+        super().receive_job_submission(submission)
+        job_id = uuid.UUID(submission.uuid)
+        with self._condition:
+            self._active_job_ids.add(job_id)
+            self._schedule_message(job_id, 0, time.monotonic() + self.config.start_delay_s)
+
+    def delete_job(self, job: Job) -> None:
+        """Delete a job, its remaining messages are not sent.
+
+        :param job: The job to delete.
+        """
+        super().delete_job(job)
+        with self._condition:
+            self._active_job_ids.discard(job.id)
+            self._condition.notify_all()
+
+    def wait_until_finished(self, timeout_s: float | None = None) -> bool:
+        """Wait until all submitted jobs have sent their result or are deleted.
+
+        :param timeout_s: Maximum time to wait in seconds, wait indefinitely if None.
+        :return: True if all jobs are finished, False on timeout.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._active_job_ids, timeout_s)
+
+    def _schedule_message(self, job_id: uuid.UUID, step: int, due: float) -> None:
+        heapq.heappush(self._schedule, (due, self._schedule_sequence, job_id, step))
+        self._schedule_sequence += 1
+        self._condition.notify_all()
+
+    def _dispatch(self) -> None:
+        with self._condition:
+            while not self._stopping:
+                if not self._schedule:
+                    self._condition.wait()
+                    continue
+                due, _, job_id, step = self._schedule[0]
+                now = time.monotonic()
+                if due > now:
+                    self._condition.wait(due - now)
+                    continue
+                heapq.heappop(self._schedule)
+                assert self._executor
+                self._executor.submit(self._handle_message, job_id, step, due)
+
+    def _handle_message(self, job_id: uuid.UUID, step: int, due: float) -> None:
+        if job_id not in self.jobs:
+            return
+
+        last_progress_step = 1 + self.config.progress_updates_per_job
+        try:
+            if step == 0:
+                kind = "status"
+                self.send_status_update(job_id, JobStatusUpdate.JobStatus.ENQUEUED)
+            elif step == 1:
+                kind = "status"
+                self.send_status_update(job_id, JobStatusUpdate.JobStatus.RUNNING)
+            elif step <= last_progress_step:
+                kind = "progress"
+                progress = (step - 1) / self.config.progress_updates_per_job
+                self.send_progress_update(job_id, progress, f"Step {step - 1}.")
+            else:
+                kind = "result"
+                self.send_result(job_id, self.config.result_type, self._output_esdl, "Finished.")
+        except Exception:
+            with self._condition:
+                self.failed_job_ids.append(job_id)
+                self._active_job_ids.discard(job_id)
+                self._condition.notify_all()
+            return
+        now = time.monotonic()
+
+        with self._condition:
+            self.latencies_s[kind].append(now - due)
+            if kind == "result":
+                self._active_job_ids.discard(job_id)
+                self._condition.notify_all()
+            elif job_id in self._active_job_ids:
+                self._schedule_message(job_id, step + 1, now + self.config.update_interval_s)
@@ -5,4 +5,4 @@ if [[ "$OSTYPE" != "win32" && "$OSTYPE" != "msys" ]]; then
   . .venv/bin/activate
 fi
 
-python -m mypy ./src/omotes_rest ./unit_test/
+python -m mypy ./src/omotes_rest ./unit_test/ ./benchmark/
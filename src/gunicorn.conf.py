@@ -1,9 +1,29 @@
-from omotes_rest import main
+from gunicorn.arbiter import Arbiter
+from gunicorn.workers.sync import SyncWorker
+
+from omotes_rest.settings import EnvSettings
 
 bind = "0.0.0.0:9200"
-workers = 1
+workers = EnvSettings.gunicorn_workers()
 loglevel = "info"
 timeout = 300
 
+# Load the app once in the arbiter, the workers share its memory copy-on-write. Connections to
+# the database and RabbitMQ are created per worker in `post_fork`.
+preload_app = EnvSettings.gunicorn_preload_app()
+
+
 # Server Hooks
-post_fork = main.post_fork
+def pre_fork(server: Arbiter, worker: SyncWorker) -> None:
+    """Called just before a worker is forked."""
+    if preload_app:
+        from omotes_rest import main
+
+        main.pre_fork(server, worker)
+
+
+def post_fork(server: Arbiter, worker: SyncWorker) -> None:
+    """Called just after a worker has been forked."""
+    from omotes_rest import main
+
+    main.post_fork(server, worker)
@@ -154,3 +154,163 @@ class JobSummary:
     stopped_at: datetime | datetime
     user_name: str
     project_name: str
+
+
+@add_schema
+@dataclass
+class DurationPercentiles:
+    """Percentiles of a duration in seconds, None if there are no jobs with this duration."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+
+@add_schema
+@dataclass
+class JobStatsResponse:
+    """Response with aggregated statistics over all jobs."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    total_jobs: int
+    jobs_per_status: dict[str, int]
+    jobs_per_workflow_type: dict[str, int]
+    jobs_per_user: dict[str, int]
+    jobs_per_project: dict[str, int]
+    queue_wait_s: DurationPercentiles
+    """Duration between submission and the start of running."""
+    run_time_s: DurationPercentiles
+    """Duration between the start of running and stopping."""
+
+
+@add_schema
+@dataclass
+class JobStatusBatchInput:
+    """Input with the job ids of which to retrieve the status."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    job_ids: list[uuid.UUID] = field(
+        default_factory=list, metadata={"validate": validate.Length(min=1, max=1000)}
+    )
+
+
+@add_schema
+@dataclass
+class JobStatusProgress:
+    """Status and progress of a single job."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    job_id: uuid.UUID
+    status: JobRestStatus
+    progress_fraction: float
+    progress_message: str
+
+
+@add_schema
+@dataclass
+class JobStatusBatchResponse:
+    """Response with status and progress of multiple jobs."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    jobs: list[JobStatusProgress]
+    unknown_job_ids: list[uuid.UUID]
+
+
+@add_schema
+@dataclass
+class JobChangesQuery:
+    """Query of the changes of the jobs since a cursor, optionally of a single user or project."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    since: Optional[int] = None
+    user_name: Optional[str] = None
+    project_name: Optional[str] = None
+
+
+@add_schema
+@dataclass
+class JobChangesResponse:
+    """Response with the jobs created, updated or deleted since a cursor."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    jobs: list[JobSummary]
+    deleted_job_ids: list[uuid.UUID]
+    cursor: int
+
+
+@add_schema
+@dataclass
+class JobExportQuery:
+    """Query of the jobs to export, and the format of the export."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    format: str = field(
+        default="ndjson",
+        metadata={
+            "marshmallow_field": String(
+                load_default="ndjson",
+                validate=validate.OneOf(["ndjson", "parquet"])
+            )
+        }
+    )
+    include_esdl: bool = False
+    user_name: Optional[str] = None
+    project_name: Optional[str] = None
+    workflow_type: Optional[str] = None
+    status: Optional[JobRestStatus] = None
+    registered_after: Optional[datetime] = None
+    registered_before: Optional[datetime] = None
+
+
+@add_schema
+@dataclass
+class JobCloneInput:
+    """Input to clone a job: the input of the job with overrides, the input ESDL is reused."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    job_name: Optional[str] = None
+    user_name: Optional[str] = None
+    project_name: Optional[str] = None
+    input_params_dict: dict[str, Any] = field(default_factory=dict)
+    timeout_after_s: Optional[int] = None
+    job_priority: Optional[str] = field(
+        default=None,
+        metadata={
+            "marshmallow_field": String(
+                allow_none=True,
+                validate=validate.OneOf(["medium", "low", "high"])
+            )
+        }
+    )
+
+
+@add_schema
+@dataclass
+class JobSweepInput:
+    """Input to sweep the parameters of a job: a clone of the job per combination of values."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    job_id: uuid.UUID
+    parameter_grid: dict[str, list[Any]] = field(metadata={"validate": validate.Length(min=1)})
+    overrides: JobCloneInput = field(default_factory=JobCloneInput)
+
+
+@add_schema
+@dataclass
+class JobSweepResponse:
+    """Response with the jobs of a sweep, in the order of the combinations of the grid."""
+
+    Schema: ClassVar[Type[Schema]] = Schema
+
+    jobs: list[JobStatusResponse]
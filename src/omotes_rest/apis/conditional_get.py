@@ -0,0 +1,77 @@
+import functools
+from typing import Any, Callable
+
+from flask import request
+from flask_smorest import Blueprint
+from werkzeug.wrappers.response import Response as WerkzeugResponse
+
+from omotes_rest.apis.job_summary import JobVersion
+
+
+def is_not_modified(version: JobVersion) -> bool:
+    """Check if the response cached by the client, according to the request headers, is current.
+
+    As in RFC 9110, 'If-Modified-Since' is ignored when the request has an 'If-None-Match'.
+
+    :param version: Current version of the requested resource.
+    :return: True if the cached response is current.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(version.etag)
+    if request.if_modified_since and version.last_modified:
+        # HTTP dates only have a resolution of seconds.
+        return version.last_modified.replace(microsecond=0) <= request.if_modified_since
+    return False
+
+
+def set_validators(response: WerkzeugResponse, version: JobVersion) -> None:
+    """Set the headers with which the client can validate its cached response.
+
+    The entity tag is weak since the body differs per content encoding. The client has to
+    revalidate each time, so a response is never reused after the job has changed.
+
+    :param response: The response.
+    :param version: Version of the resource in the response.
+    """
+    response.set_etag(version.etag, weak=True)
+    if version.last_modified is not None:
+        response.last_modified = version.last_modified
+    response.cache_control.no_cache = True
+
+
+def conditional_get(
+    blueprint: Blueprint, get_version: Callable[..., JobVersion | None]
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator answering a conditional GET request with 304 if the resource did not change.
+
+    The version is retrieved before the view runs, so the version in the response is never
+    newer than its data. The decorator should be applied on top of the response decorator, as
+    the view has to return a response.
+
+    :param blueprint: The blueprint of the view, documenting the 304 response.
+    :param get_version: Function retrieving the current version cheaply, called with the
+        arguments of the route. It returns None if the resource does not exist.
+    :return: The decorator.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            version = get_version(**kwargs)
+            if version is None:
+                return func(*args, **kwargs)
+            if is_not_modified(version):
+                response = WerkzeugResponse(status=304)
+            else:
+                response = func(*args, **kwargs)
+                if response.status_code != 200:
+                    return response
+            set_validators(response, version)
+            return response
+
+        documented_wrapper: Callable[..., Any] = blueprint.alt_response(
+            304, description="Not modified since the response cached by the client."
+        )(wrapper)
+        return documented_wrapper
+
+    return decorator
@@ -1,9 +1,9 @@
 import base64
 import logging
 import uuid
+from typing import Iterator
 
-
-from flask import Response
+from flask import Response, abort, jsonify
 from flask_smorest import Blueprint
 from flask.views import MethodView
 
@@ -15,9 +15,25 @@ from omotes_rest.apis.api_dataclasses import (
     JobLogsResponse,
     JobSummary,
     JobDeleteResponse,
+    JobStatsResponse,
+    JobStatusBatchInput,
+    JobStatusBatchResponse,
+    JobChangesQuery,
+    JobChangesResponse,
+    JobExportQuery,
+    JobCloneInput,
+    JobSweepInput,
+    JobSweepResponse,
 )
+from omotes_rest.app_factory import compression
+from omotes_rest.apis.conditional_get import conditional_get
+from omotes_rest.apis.dump_functions import compile_dump_function, fast_response
+from omotes_rest.apis.job_summary import ExpiredChangeCursorException, dump_job_summaries
 from omotes_rest.db_models.job_rest import JobRest
+from omotes_rest.job_export import EXPORT_FORMATS, UnsupportedExportFormatException
+from omotes_rest.profiling import phase
 from omotes_rest.typed_app import current_app
+from omotes_rest.workflow_params import InvalidJobParametersException
 
 
 logger = logging.getLogger("omotes_rest")
@@ -30,31 +46,158 @@ api = Blueprint(
 )
 
 
+def job_result_key(job_id: uuid.UUID) -> str:
+    """Key of the compressed result response of a job."""
+    return f"job_result/{job_id}"
+
+
 @api.route("/")
 class JobAPI(MethodView):
     """Requests."""
 
     @api.arguments(JobInput.Schema())
-    @api.response(200, JobStatusResponse.Schema())
+    @fast_response(api, 202, JobStatusResponse.Schema())
+    @api.alt_response(400, description="Invalid input parameters for the workflow type.")
     def post(self, job_input: JobInput) -> JobStatusResponse:
-        """Start new job: 'input_params_dict' can have lists and (nested) dicts as values."""
-        esdlstr_bytes = job_input.input_esdl.encode("utf-8")
-        esdlstr_base64_bytes = base64.b64decode(esdlstr_bytes)
-        esdl_str = esdlstr_base64_bytes.decode("utf-8")
-        job_input.input_esdl = esdl_str
-        return current_app.rest_if.submit_job(job_input)
+        """Start new job: 'input_params_dict' can have lists and (nested) dicts as values.
 
+        The job is registered and submitted to Omotes in the background.
+        """
+        with phase("decode_esdl"):
+            esdlstr_bytes = job_input.input_esdl.encode("utf-8")
+            esdlstr_base64_bytes = base64.b64decode(esdlstr_bytes)
+            esdl_str = esdlstr_base64_bytes.decode("utf-8")
+            job_input.input_esdl = esdl_str
+        try:
+            return current_app.rest_if.submit_job(job_input)
+        except InvalidJobParametersException as e:
+            abort(400, description=str(e))
+
+    @conditional_get(api, lambda: current_app.rest_if.get_jobs_version())
     @api.response(200, JobSummary.Schema(many=True))
-    def get(self) -> list[JobRest]:
+    def get(self) -> Response:
         """Return a summary of all jobs."""
-        return current_app.rest_if.get_jobs()
+        jobs = current_app.rest_if.get_jobs()
+        with phase("serialize"):
+            return jsonify(dump_job_summaries(jobs))
+
+
+@api.route("/sweep")
+class JobSweepAPI(MethodView):
+    """Requests."""
+
+    @api.arguments(JobSweepInput.Schema())
+    @fast_response(api, 202, JobSweepResponse.Schema())
+    @api.alt_response(400, description="Invalid parameter grid or parameters for the workflow.")
+    @api.alt_response(404, description="Unknown job.")
+    def post(self, sweep_input: JobSweepInput) -> JobSweepResponse:
+        """Start a job per combination of the values in 'parameter_grid', reusing an input ESDL.
+
+        The jobs are clones of the job 'job_id', with the 'overrides' and the combination merged
+        into its 'input_params_dict'. The jobs are returned in the order of the combinations, the
+        last parameter of the grid varies fastest.
+        """
+        try:
+            jobs = current_app.rest_if.sweep_job(sweep_input)
+        except InvalidJobParametersException as e:
+            abort(400, description=str(e))
+        if jobs is None:
+            abort(404, description=f"Unknown job {sweep_input.job_id}.")
+        return JobSweepResponse(jobs=jobs)
+
+
+@api.route("/stats")
+class JobStatsAPI(MethodView):
+    """Requests."""
+
+    @fast_response(api, 200, JobStatsResponse.Schema())
+    def get(self) -> JobStatsResponse:
+        """Return job counts and queue wait and run time percentiles."""
+        return current_app.rest_if.get_job_stats()
+
+
+@api.route("/status")
+class JobStatusBatchAPI(MethodView):
+    """Requests."""
+
+    @api.arguments(JobStatusBatchInput.Schema())
+    @fast_response(api, 200, JobStatusBatchResponse.Schema())
+    def post(self, status_input: JobStatusBatchInput) -> JobStatusBatchResponse:
+        """Return status and progress of multiple jobs (at most 1000) in a single request."""
+        return current_app.rest_if.get_job_statuses(status_input.job_ids)
+
+
+@api.route("/changes")
+class JobChangesAPI(MethodView):
+    """Requests."""
+
+    @api.arguments(JobChangesQuery.Schema(), location="query")
+    @api.response(200, JobChangesResponse.Schema())
+    @api.alt_response(410, description="The cursor is expired, retrieve all jobs again.")
+    def get(self, query: JobChangesQuery) -> Response:
+        """Return the jobs created, updated or deleted since the cursor of an earlier response.
+
+        Without 'since' all jobs are returned. Pass the returned 'cursor' as 'since' of the next
+        request to only receive the changes, optionally of a single user and/or project.
+        """
+        try:
+            changes = current_app.rest_if.get_job_changes(
+                query.since, query.user_name, query.project_name
+            )
+        except ExpiredChangeCursorException as e:
+            abort(410, description=str(e))
+        with phase("serialize"):
+            return jsonify(
+                {
+                    "jobs": dump_job_summaries(changes.jobs),
+                    "deleted_job_ids": [str(job_id) for job_id in changes.deleted_job_ids],
+                    "cursor": changes.cursor,
+                }
+            )
+
+
+@api.route("/export")
+class JobExportAPI(MethodView):
+    """Requests."""
+
+    @api.arguments(JobExportQuery.Schema(), location="query")
+    @api.response(
+        200,
+        content_type="application/x-ndjson",
+        description="The jobs as newline delimited JSON, or as a Parquet file.",
+    )
+    @api.alt_response(400, description="The export format is not supported.")
+    def get(self, query: JobExportQuery) -> Response:
+        """Export the jobs with their input parameters and timing, streamed in chunks.
+
+        The jobs may be filtered by user, project, workflow type, status and registration time.
+        The ESDLs are only exported if 'include_esdl' is true.
+        """
+        try:
+            chunks = current_app.rest_if.export_jobs(query)
+        except UnsupportedExportFormatException as e:
+            abort(400, description=str(e))
+        # Run the query before the response is started, so an error is not a truncated export.
+        first_chunk = next(chunks, b"")
+
+        def stream() -> Iterator[bytes]:
+            yield first_chunk
+            yield from chunks
+
+        mimetype, _ = EXPORT_FORMATS[query.format]
+        return Response(
+            stream(),
+            mimetype=mimetype,
+            headers={"Content-Disposition": f"attachment; filename=jobs.{query.format}"},
+        )
 
 
 @api.route("/<string:job_id>")
 class JobFromIdAPI(MethodView):
     """Requests."""
 
-    @api.response(200, JobResponse.Schema())
+    @conditional_get(api, lambda job_id: current_app.rest_if.get_job_version(uuid.UUID(job_id)))
+    @fast_response(api, 200, JobResponse.Schema())
     def get(self, job_id: str) -> JobRest | None:
         """Return job details."""
         job = current_app.rest_if.get_job(uuid.UUID(job_id))
@@ -72,14 +215,39 @@ class JobFromIdAPI(MethodView):
     def delete(self, job_id: str) -> JobDeleteResponse:
         """Delete job: terminate if running, and delete time series data if present."""
         job_uuid = uuid.UUID(job_id)
-        return JobDeleteResponse(job_id=job_uuid, deleted=current_app.rest_if.delete_job(job_uuid))
+        deleted = current_app.rest_if.delete_job(job_uuid)
+        compression.delete_immutable_response(job_result_key(job_uuid))
+        return JobDeleteResponse(job_id=job_uuid, deleted=deleted)
+
+
+@api.route("/<string:job_id>/clone")
+class JobCloneAPI(MethodView):
+    """Requests."""
+
+    @api.arguments(JobCloneInput.Schema())
+    @fast_response(api, 202, JobStatusResponse.Schema())
+    @api.alt_response(400, description="Invalid input parameters for the workflow type.")
+    @api.alt_response(404, description="Unknown job.")
+    def post(self, clone_input: JobCloneInput, job_id: str) -> JobStatusResponse:
+        """Start a new job with the input of a job: 'input_params_dict' overrides its parameters.
+
+        The input ESDL of the job is reused, other fields which are not given are copied from it.
+        """
+        try:
+            response = current_app.rest_if.clone_job(uuid.UUID(job_id), clone_input)
+        except InvalidJobParametersException as e:
+            abort(400, description=str(e))
+        if response is None:
+            abort(404, description=f"Unknown job {job_id}.")
+        return response
 
 
 @api.route("/<string:job_id>/status")
 class JobStatusAPI(MethodView):
     """Requests."""
 
-    @api.response(200, JobStatusResponse.Schema())
+    @conditional_get(api, lambda job_id: current_app.rest_if.get_job_version(uuid.UUID(job_id)))
+    @fast_response(api, 200, JobStatusResponse.Schema())
     def get(self, job_id: str) -> JobStatusResponse | Response:
         """Return job status."""
         job_uuid = uuid.UUID(job_id)
@@ -93,25 +261,40 @@ class JobStatusAPI(MethodView):
         return result
 
 
+job_result_schema = JobResultResponse.Schema()
+dump_job_result = compile_dump_function(job_result_schema)
+
+
 @api.route("/<string:job_id>/result")
 class JobResultAPI(MethodView):
     """Requests."""
 
-    @api.response(200, JobResultResponse.Schema())
-    def get(self, job_id: str) -> JobResultResponse:
+    @fast_response(api, 200, job_result_schema)
+    def get(self, job_id: str) -> JobResultResponse | Response:
         """Return job result with output ESDL (can be None)."""
         job_uuid = uuid.UUID(job_id)
         output_esdl = current_app.rest_if.get_job_output_esdl(job_uuid)
-        if output_esdl:
-            output_esdl = base64.b64encode(bytes(output_esdl, "utf-8")).decode("utf-8")
-        return JobResultResponse(job_id=job_uuid, output_esdl=output_esdl)
+        if not output_esdl:
+            return JobResultResponse(job_id=job_uuid, output_esdl=output_esdl)
+
+        def create_response() -> Response:
+            assert output_esdl
+            output_esdl_base64 = base64.b64encode(bytes(output_esdl, "utf-8")).decode("utf-8")
+            return current_app.json.response(
+                dump_job_result(JobResultResponse(job_id=job_uuid, output_esdl=output_esdl_base64))
+            )
+
+        # The output ESDL never changes once it is written, so it is only compressed once. The
+        # compressed result may still be cached by other workers after the job is deleted, but it
+        # is only served once the output ESDL above confirmed that the job still exists.
+        return compression.immutable_json_response(job_result_key(job_uuid), create_response)
 
 
 @api.route("/<string:job_id>/logs")
 class JobLogsAPI(MethodView):
     """Requests."""
 
-    @api.response(200, JobLogsResponse.Schema())
+    @fast_response(api, 200, JobLogsResponse.Schema())
     def get(self, job_id: str) -> JobLogsResponse:
         """Return job logs."""
         job_uuid = uuid.UUID(job_id)
@@ -125,17 +308,27 @@ class JobLogsAPI(MethodView):
 class JobsByUserAPI(MethodView):
     """Requests."""
 
+    @conditional_get(
+        api, lambda user_name: current_app.rest_if.get_jobs_version(user_name=user_name)
+    )
     @api.response(200, JobSummary.Schema(many=True))
-    def get(self, user_name: str) -> list[JobRest]:
+    def get(self, user_name: str) -> Response:
         """Return all jobs from user."""
-        return current_app.rest_if.get_jobs_from_user(user_name)
+        jobs = current_app.rest_if.get_jobs_from_user(user_name)
+        with phase("serialize"):
+            return jsonify(dump_job_summaries(jobs))
 
 
 @api.route("/project/<string:project_name>")
 class JobByProjectAPI(MethodView):
     """Requests."""
 
+    @conditional_get(
+        api, lambda project_name: current_app.rest_if.get_jobs_version(project_name=project_name)
+    )
     @api.response(200, JobSummary.Schema(many=True))
-    def get(self, project_name: str) -> list[JobRest]:
+    def get(self, project_name: str) -> Response:
         """Return all jobs from project."""
-        return current_app.rest_if.get_jobs_from_project(project_name)
+        jobs = current_app.rest_if.get_jobs_from_project(project_name)
+        with phase("serialize"):
+            return jsonify(dump_job_summaries(jobs))
@@ -0,0 +1,106 @@
+import uuid
+from datetime import datetime
+from typing import Any, Iterable, NamedTuple
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+
+
+JOB_EXPORT_COLUMNS = (
+    "job_id",
+    "job_name",
+    "workflow_type",
+    "job_priority",
+    "status",
+    "user_name",
+    "project_name",
+    "timeout_after_s",
+    "registered_at",
+    "submitted_at",
+    "running_at",
+    "stopped_at",
+    "input_params_dict",
+)
+"""Columns of the exported jobs, in order. These are attributes of `JobRest`."""
+JOB_EXPORT_ESDL_COLUMNS = ("input_esdl", "output_esdl")
+"""Columns of the exported jobs if the ESDLs are included."""
+
+
+class JobSummaryRecord(NamedTuple):
+    """Job summary row as retrieved from the database.
+
+    A plain tuple without per instance attribute dict or ORM state, since job lists may hold
+    many thousands of these. The fields are in the order of the `JobSummary` dataclass, which
+    documents the serialized form.
+    """
+
+    job_id: uuid.UUID
+    job_name: str | None
+    workflow_type: str | None
+    status: JobRestStatus | None
+    progress_fraction: float | None
+    registered_at: datetime | None
+    running_at: datetime | None
+    stopped_at: datetime | None
+    user_name: str | None
+    project_name: str | None
+
+
+class JobChanges(NamedTuple):
+    """Jobs created, updated or deleted since a change cursor."""
+
+    jobs: list[JobSummaryRecord]
+    """Summaries of the created and updated jobs."""
+    deleted_job_ids: list[uuid.UUID]
+    """Ids of the deleted jobs."""
+    cursor: int
+    """Cursor from which to retrieve the next changes."""
+
+
+class JobVersion(NamedTuple):
+    """Version of a job or of a list of jobs, to validate a response cached by a client."""
+
+    etag: str
+    """Entity tag, changes whenever the job or list of jobs changes."""
+    last_modified: datetime | None
+    """Moment of the last change, None if it is not known. Without it, only the entity tag
+    validates a cached response."""
+
+
+class ExpiredChangeCursorException(Exception):
+    """Thrown when the changes since a cursor are no longer complete, as it is too old."""
+
+    ...  # pragma: no cover
+
+
+def dump_job_summaries(job_summaries: Iterable[JobSummaryRecord]) -> list[dict[str, Any]]:
+    """Serialize job summaries to the same JSON compatible form as `JobSummary.Schema`.
+
+    :param job_summaries: Job summaries to serialize.
+    :return: List with a dict per job summary.
+    """
+    return [
+        {
+            "job_id": str(job_id),
+            "job_name": job_name,
+            "workflow_type": workflow_type,
+            "status": None if status is None else status.name,
+            "progress_fraction": None if progress_fraction is None else float(progress_fraction),
+            "registered_at": None if registered_at is None else registered_at.isoformat(),
+            "running_at": None if running_at is None else running_at.isoformat(),
+            "stopped_at": None if stopped_at is None else stopped_at.isoformat(),
+            "user_name": user_name,
+            "project_name": project_name,
+        }
+        for (
+            job_id,
+            job_name,
+            workflow_type,
+            status,
+            progress_fraction,
+            registered_at,
+            running_at,
+            stopped_at,
+            user_name,
+            project_name,
+        ) in job_summaries
+    ]
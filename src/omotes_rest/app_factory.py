@@ -0,0 +1,53 @@
+import logging
+
+from flask import Flask
+from flask_cors import CORS
+from flask_dotenv import DotEnv
+from flask_smorest import Api
+from werkzeug.middleware.proxy_fix import ProxyFix
+from werkzeug.utils import import_string
+
+from omotes_rest.compression import Compression
+from omotes_rest.profiling import RequestProfiler
+
+api = Api()
+env = DotEnv()
+compression = Compression()
+request_profiler = RequestProfiler()
+
+
+def create_app(object_name: str) -> Flask:
+    """Create Flask app.
+
+    A flask application factory, as explained here:
+    http://flask.pocoo.org/docs/patterns/appfactories/
+
+    :param object_name: the python path of the config object, e.g.
+        influxdbgraphs.api.settings.ProdConfig
+    :return: The initalised Flask app.
+    """
+    logger = logging.getLogger("omotes_rest")
+    logger.info("Setting up app.")
+
+    app = Flask(__name__)
+    app.config.from_object(object_name)
+    app.json = import_string(app.config["JSON_PROVIDER"])(app)
+    app.wsgi_app = ProxyFix(app.wsgi_app)  # type: ignore[method-assign]
+
+    env.init_app(app)
+    api.init_app(app)
+    compression.init_app(app)
+    request_profiler.init_app(app)
+
+    # Register blueprints.
+    from omotes_rest.apis.job import api as job_api
+    from omotes_rest.apis.workflow import api as workflow_api
+
+    api.register_blueprint(job_api)
+    api.register_blueprint(workflow_api)
+
+    CORS(app, resources={r"/*": {"origins": "*"}})
+
+    logger.info("Finished setting up app.")
+
+    return app
@@ -0,0 +1,244 @@
+import fcntl
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+
+
+class BytesLRUCache(Generic[KeyT]):
+    """Least recently used cache of bytes values, bounded by the total size of the values."""
+
+    max_bytes: int
+    """Maximum total size of the cached values in bytes."""
+    size_bytes: int
+    """Current total size of the cached values in bytes."""
+    hits: int
+    """Number of lookups which found the value."""
+    misses: int
+    """Number of lookups which did not find the value."""
+    _entries: OrderedDict[KeyT, bytes]
+    _lock: threading.Lock
+
+    def __init__(self, max_bytes: int):
+        """Create the cache.
+
+        :param max_bytes: Maximum total size of the cached values in bytes.
+        """
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyT) -> bytes | None:
+        """Get a value and mark it as most recently used.
+
+        :param key: Key of the value.
+        :return: The value if cached, else None.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: KeyT, value: bytes) -> None:
+        """Cache a value and evict the least recently used values which no longer fit.
+
+        Values larger than the maximum size of the cache are not cached.
+
+        :param key: Key of the value.
+        :param value: The value.
+        """
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            old_value = self._entries.pop(key, None)
+            if old_value is not None:
+                self.size_bytes -= len(old_value)
+            self._entries[key] = value
+            self.size_bytes += len(value)
+            while self.size_bytes > self.max_bytes:
+                _, evicted_value = self._entries.popitem(last=False)
+                self.size_bytes -= len(evicted_value)
+
+    def delete(self, key: KeyT) -> None:
+        """Remove a value from the cache, if cached.
+
+        :param key: Key of the value.
+        """
+        with self._lock:
+            value = self._entries.pop(key, None)
+            if value is not None:
+                self.size_bytes -= len(value)
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+
+class DiskBytesLRUCache:
+    """Least recently used cache of bytes values stored as files in a directory.
+
+    Processes on the same machine, such as the gunicorn workers, share the cache by using the
+    same directory, so values deleted by one process are gone for all. With a directory on a
+    memory backed file system such as /dev/shm the values are kept in shared memory. The least
+    recently used values are found by the modification time of the files, which is updated when
+    a value is read.
+
+    The total size of the values is kept in an index file, which is locked while a value is
+    written or removed. The directory is only scanned when the total exceeds the maximum size,
+    and then the least recently used values are evicted until the total is below the low-water
+    mark, so a scan is not needed for every value cached.
+    """
+
+    directory: str
+    """Directory with a file per cached value."""
+    max_bytes: int
+    """Maximum total size of the cached values in bytes."""
+    low_water_bytes: int
+    """Total size of the cached values in bytes to evict down to when the maximum is exceeded."""
+    size_bytes: int
+    """Total size of the cached values in bytes at the last update by this process."""
+    hits: int
+    """Number of lookups by this process which found the value."""
+    misses: int
+    """Number of lookups by this process which did not find the value."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        """Create the cache and the directory if it does not exist.
+
+        :param directory: Directory with a file per cached value.
+        :param max_bytes: Maximum total size of the cached values in bytes.
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.low_water_bytes = max_bytes * 9 // 10
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._index_path = os.path.join(directory, ".size")
+        self._update_size(lambda: 0)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest())
+
+    def _update_size(self, change: Callable[[], int]) -> None:
+        """Change the cached values while holding the lock on the index and update the total.
+
+        The change is always made. The total is computed by scanning the directory if the index
+        is new or empty, e.g. when it was removed, or the total exceeds the maximum size, which
+        also evicts the least recently used values.
+
+        :param change: Function changing the cached values, returning the change in total size.
+        """
+        index_descriptor = os.open(self._index_path, os.O_RDWR | os.O_CREAT, 0o644)
+        with os.fdopen(index_descriptor, "r+") as index:
+            fcntl.flock(index, fcntl.LOCK_EX)
+            text = index.read()
+            size_change = change()
+            size_bytes = int(text) + size_change if text else None
+            if size_bytes is None or size_bytes > self.max_bytes:
+                size_bytes = self._evict()
+            index.seek(0)
+            index.truncate()
+            index.write(str(size_bytes))
+        self.size_bytes = size_bytes
+
+    def get(self, key: str) -> bytes | None:
+        """Get a value and mark it as most recently used.
+
+        :param key: Key of the value.
+        :return: The value if cached, else None.
+        """
+        path = self._path(key)
+        try:
+            with open(path, "rb") as file:
+                value = file.read()
+            os.utime(path)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Cache a value and evict the least recently used values which no longer fit.
+
+        The file is written under a temporary name and then renamed, so other processes never
+        read a partially written value. Values larger than the maximum size of the cache are not
+        cached.
+
+        :param key: Key of the value.
+        :param value: The value.
+        """
+        if len(value) > self.max_bytes:
+            return
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=".")
+        with os.fdopen(file_descriptor, "wb") as file:
+            file.write(value)
+        path = self._path(key)
+
+        def replace() -> int:
+            old_size = _file_size(path)
+            os.replace(temp_path, path)
+            return len(value) - old_size
+
+        self._update_size(replace)
+
+    def delete(self, key: str) -> None:
+        """Remove a value from the cache, if cached.
+
+        :param key: Key of the value.
+        """
+        path = self._path(key)
+
+        def remove() -> int:
+            size = _file_size(path)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                return 0
+            return -size
+
+        self._update_size(remove)
+
+    def _evict(self) -> int:
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.startswith("."):
+                continue
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+        size_bytes = sum(size for _, size, _ in files)
+        if size_bytes <= self.max_bytes:
+            return size_bytes
+        for _, size, path in sorted(files):
+            if size_bytes <= self.low_water_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size_bytes -= size
+        return size_bytes
+
+
+def _file_size(path: str) -> int:
+    try:
+        return os.stat(path).st_size
+    except FileNotFoundError:
+        return 0
@@ -0,0 +1,166 @@
+import gzip
+import logging
+from typing import Callable
+
+from flask import Flask, Response, request
+
+from omotes_rest.bytes_lru_cache import BytesLRUCache
+from omotes_rest.settings import EnvSettings
+
+logger = logging.getLogger("omotes_rest")
+
+Compressor = Callable[[bytes], bytes]
+
+COMPRESSIBLE_MIMETYPES = {
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "text/css",
+    "text/html",
+    "text/plain",
+}
+"""Mimetypes of responses which are compressed."""
+
+ENCODINGS: dict[str, tuple[Compressor, Compressor]] = {}
+"""Supported content encodings in order of preference, with a compressor for responses which
+are compressed per request and a (slower, stronger) compressor for responses which are compressed
+once and cached. Brotli and zstd are only supported if the `brotli` and `zstandard` packages are
+installed."""
+
+try:
+    import zstandard
+
+    ENCODINGS["zstd"] = (
+        lambda data: zstandard.ZstdCompressor(level=3).compress(data),
+        lambda data: zstandard.ZstdCompressor(level=12).compress(data),
+    )
+except ImportError:
+    pass
+
+try:
+    import brotli
+
+    ENCODINGS["br"] = (
+        lambda data: brotli.compress(data, quality=5),
+        lambda data: brotli.compress(data, quality=9),
+    )
+except ImportError:
+    pass
+
+ENCODINGS["gzip"] = (
+    lambda data: gzip.compress(data, compresslevel=6, mtime=0),
+    lambda data: gzip.compress(data, compresslevel=9, mtime=0),
+)
+
+
+class Compression:
+    """Compress responses with the best content encoding accepted by the client.
+
+    Responses smaller than the minimum size are not compressed. The compressed data of immutable
+    responses, such as job results, is cached so these are compressed only once.
+    """
+
+    min_size_bytes: int
+    """Responses smaller than this are sent uncompressed."""
+    encodings: dict[str, tuple[Compressor, Compressor]]
+    """Enabled content encodings in order of preference."""
+    precompressed_cache: BytesLRUCache[tuple[str, str]]
+    """Compressed data of immutable responses by key and content encoding."""
+
+    def __init__(self) -> None:
+        """Create the compression extension, the settings are read in `init_app`."""
+        self.min_size_bytes = 0
+        self.encodings = {}
+        self.precompressed_cache = BytesLRUCache(0)
+
+    def init_app(self, app: Flask) -> None:
+        """Read the compression settings and compress the responses of the app.
+
+        :param app: The Flask app.
+        """
+        if not EnvSettings.compression_enabled():
+            logger.info("Response compression is disabled.")
+            return
+
+        self.min_size_bytes = EnvSettings.compression_min_size_bytes()
+        self.encodings = ENCODINGS
+        self.precompressed_cache = BytesLRUCache(EnvSettings.compression_cache_max_bytes())
+        app.after_request(self.compress_response)
+        logger.info(f"Compressing responses with encodings {', '.join(self.encodings)}.")
+
+    def negotiate_encoding(self) -> str | None:
+        """Select the content encoding for the current request.
+
+        :return: The best content encoding accepted by the client, None if the response should
+            not be compressed.
+        """
+        if not self.encodings:
+            return None
+        encoding: str | None = request.accept_encodings.best_match(self.encodings)
+        return encoding
+
+    def _is_compressible(self, response: Response) -> bool:
+        return (
+            200 <= response.status_code < 300
+            and response.status_code != 204
+            and not response.direct_passthrough
+            and not response.is_streamed
+            and "Content-Encoding" not in response.headers
+            and response.mimetype in COMPRESSIBLE_MIMETYPES
+            and (response.content_length or 0) >= self.min_size_bytes
+        )
+
+    @staticmethod
+    def _set_compressed_data(response: Response, encoding: str, data: bytes) -> None:
+        response.set_data(data)
+        response.headers["Content-Encoding"] = encoding
+
+    def compress_response(self, response: Response) -> Response:
+        """Compress a response if it is large enough and the client accepts compression.
+
+        :param response: The response.
+        :return: The (compressed) response.
+        """
+        if self._is_compressible(response):
+            response.vary.add("Accept-Encoding")
+            encoding = self.negotiate_encoding()
+            if encoding:
+                compress, _ = self.encodings[encoding]
+                self._set_compressed_data(response, encoding, compress(response.get_data()))
+        return response
+
+    def immutable_json_response(
+        self, key: str, create_response: Callable[[], Response]
+    ) -> Response:
+        """Return a JSON response which is compressed once and then served from the cache.
+
+        :param key: Key of the response, the response for a key should never change.
+        :param create_response: Function creating the uncompressed response, only called if the
+            compressed data is not cached. It should return a JSON response with status 200.
+        :return: The (compressed) response.
+        """
+        encoding = self.negotiate_encoding()
+        if encoding:
+            compressed_data = self.precompressed_cache.get((key, encoding))
+            if compressed_data is not None:
+                response = Response(compressed_data, mimetype="application/json")
+                response.vary.add("Accept-Encoding")
+                response.headers["Content-Encoding"] = encoding
+                return response
+
+        response = create_response()
+        if encoding and self._is_compressible(response):
+            _, compress = self.encodings[encoding]
+            compressed_data = compress(response.get_data())
+            self.precompressed_cache.put((key, encoding), compressed_data)
+            response.vary.add("Accept-Encoding")
+            self._set_compressed_data(response, encoding, compressed_data)
+        return response
+
+    def delete_immutable_response(self, key: str) -> None:
+        """Remove the compressed data of an immutable response from the cache, if cached.
+
+        :param key: Key of the response.
+        """
+        for encoding in self.encodings:
+            self.precompressed_cache.delete((key, encoding))
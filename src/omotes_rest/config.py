@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 
 class PostgresConfig:
@@ -9,10 +10,22 @@ class PostgresConfig:
     database: str
     username: str | None
     password: str | None
+    driver: str
+    prepare_threshold: int | None
+    pool_size: int
+    """Maximum number of connections of the pool for writes, per gunicorn worker."""
+    read_pool_size: int
+    """Maximum number of connections of the pool for read-only queries, per gunicorn worker."""
+    max_overflow: int
+    """Connections each pool may open temporarily beyond its size under a burst."""
 
     def __init__(self, prefix: str = ""):
         """Create the POSTGRES configuration and retrieve values from env vars.
 
+        Unless set explicitly, the pool sizes divide `POSTGRES_MAX_CONNECTIONS`, the connections of
+        the service as a whole, over the gunicorn workers: an eighth for the overflow of each pool,
+        then a third of the rest for reads and the rest for writes.
+
         :param prefix: Prefix to the name environment variables.
         """
         self.host = os.environ.get(f"{prefix}POSTGRES_HOST", "localhost")
@@ -20,3 +33,222 @@ class PostgresConfig:
         self.database = os.environ.get(f"{prefix}POSTGRES_DATABASE", "public")
         self.username = os.environ.get(f"{prefix}POSTGRES_USERNAME")
         self.password = os.environ.get(f"{prefix}POSTGRES_PASSWORD")
+        self.driver = os.environ.get(f"{prefix}POSTGRES_DRIVER", "psycopg2")
+        prepare_threshold = os.environ.get(f"{prefix}POSTGRES_PREPARE_THRESHOLD", "2")
+        self.prepare_threshold = int(prepare_threshold) if prepare_threshold else None
+
+        max_connections = int(os.environ.get(f"{prefix}POSTGRES_MAX_CONNECTIONS", "40"))
+        workers = int(os.environ.get("GUNICORN_WORKERS", "1"))
+        connections_per_worker = max(2, max_connections // workers)
+        max_overflow = os.environ.get(f"{prefix}POSTGRES_MAX_OVERFLOW")
+        self.max_overflow = int(max_overflow) if max_overflow else connections_per_worker // 8
+        pooled_connections = max(2, connections_per_worker - 2 * self.max_overflow)
+        read_pool_size = os.environ.get(f"{prefix}POSTGRES_READ_POOL_SIZE")
+        self.read_pool_size = (
+            int(read_pool_size) if read_pool_size else max(1, pooled_connections // 3)
+        )
+        pool_size = os.environ.get(f"{prefix}POSTGRES_POOL_SIZE")
+        self.pool_size = (
+            int(pool_size) if pool_size else max(1, pooled_connections - self.read_pool_size)
+        )
+
+
+class ResultCacheConfig:
+    """Retrieve result cache configuration from environment variables."""
+
+    enabled: bool
+    ttl_s: int
+    eviction_interval_s: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the result cache configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.enabled = os.environ.get(f"{prefix}RESULT_CACHE_ENABLED", "false").lower() == "true"
+        self.ttl_s = int(os.environ.get(f"{prefix}RESULT_CACHE_TTL_S", "86400"))
+        self.eviction_interval_s = int(
+            os.environ.get(f"{prefix}RESULT_CACHE_EVICTION_INTERVAL_S", "3600")
+        )
+
+
+class PayloadCacheConfig:
+    """Retrieve configuration of the cache of stopped job payloads from environment variables."""
+
+    max_bytes: int
+    directory: str | None
+
+    def __init__(self, prefix: str = ""):
+        """Create the payload cache configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.max_bytes = int(
+            os.environ.get(f"{prefix}PAYLOAD_CACHE_MAX_BYTES", str(256 * 1024 * 1024))
+        )
+        self.directory = os.environ.get(f"{prefix}PAYLOAD_CACHE_DIR") or None
+
+
+class ProfilingConfig:
+    """Retrieve request profiling configuration from environment variables."""
+
+    sample_rate: float
+    admin_token: str | None
+    directory: str
+    max_profiles: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the profiling configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.sample_rate = float(os.environ.get(f"{prefix}PROFILING_SAMPLE_RATE", "0"))
+        self.admin_token = os.environ.get(f"{prefix}PROFILING_ADMIN_TOKEN") or None
+        self.directory = os.environ.get(f"{prefix}PROFILING_DIR") or os.path.join(
+            tempfile.gettempdir(), "omotes_rest_profiles"
+        )
+        self.max_profiles = int(os.environ.get(f"{prefix}PROFILING_MAX_PROFILES", "100"))
+
+
+class QueryTimingConfig:
+    """Retrieve configuration of the SQL statement timing from environment variables."""
+
+    enabled: bool
+    slow_query_threshold_ms: float
+    window_s: float
+
+    def __init__(self, prefix: str = ""):
+        """Create the query timing configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.enabled = os.environ.get(f"{prefix}SQL_TIMING_ENABLED", "true").lower() == "true"
+        self.slow_query_threshold_ms = float(
+            os.environ.get(f"{prefix}SQL_SLOW_QUERY_THRESHOLD_MS", "1000")
+        )
+        self.window_s = float(os.environ.get(f"{prefix}SQL_TIMING_WINDOW_S", "600"))
+
+
+class JobOutboxConfig:
+    """Retrieve configuration of the relay of the job outbox from environment variables."""
+
+    batch_size: int
+    poll_interval_s: float
+    max_attempts: int
+    retry_backoff_s: float
+    max_retry_backoff_s: float
+
+    def __init__(self, prefix: str = ""):
+        """Create the job outbox configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.batch_size = int(os.environ.get(f"{prefix}JOB_OUTBOX_BATCH_SIZE", "50"))
+        self.poll_interval_s = float(os.environ.get(f"{prefix}JOB_OUTBOX_POLL_INTERVAL_S", "1"))
+        self.max_attempts = int(os.environ.get(f"{prefix}JOB_OUTBOX_MAX_ATTEMPTS", "10"))
+        self.retry_backoff_s = float(os.environ.get(f"{prefix}JOB_OUTBOX_RETRY_BACKOFF_S", "1"))
+        self.max_retry_backoff_s = float(
+            os.environ.get(f"{prefix}JOB_OUTBOX_MAX_RETRY_BACKOFF_S", "300")
+        )
+
+
+class JobPartitionConfig:
+    """Retrieve configuration of the monthly partitions of the job tables from environment vars."""
+
+    months_ahead: int
+    retention_months: int
+    drop_expired: bool
+    maintenance_interval_s: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the job partition configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.months_ahead = int(os.environ.get(f"{prefix}JOB_PARTITIONS_MONTHS_AHEAD", "3"))
+        self.retention_months = int(os.environ.get(f"{prefix}JOB_PARTITIONS_RETENTION_MONTHS", "0"))
+        self.drop_expired = (
+            os.environ.get(f"{prefix}JOB_PARTITIONS_DROP_EXPIRED", "false").lower() == "true"
+        )
+        self.maintenance_interval_s = int(
+            os.environ.get(f"{prefix}JOB_PARTITIONS_MAINTENANCE_INTERVAL_S", "3600")
+        )
+
+
+class JobProgressConfig:
+    """Retrieve configuration of the batched writes of job progress updates from env vars."""
+
+    flush_interval_s: float
+
+    def __init__(self, prefix: str = ""):
+        """Create the job progress configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.flush_interval_s = float(
+            os.environ.get(f"{prefix}JOB_PROGRESS_FLUSH_INTERVAL_S", "0.2")
+        )
+
+
+class JobChangesConfig:
+    """Retrieve configuration of the job changes feed from environment variables."""
+
+    settle_s: float
+    tombstone_retention_s: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the job changes configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.settle_s = float(os.environ.get(f"{prefix}JOB_CHANGES_SETTLE_S", "5"))
+        self.tombstone_retention_s = int(
+            os.environ.get(f"{prefix}JOB_CHANGES_TOMBSTONE_RETENTION_S", "2592000")
+        )
+
+
+class JobExportConfig:
+    """Retrieve configuration of the export of jobs from environment variables."""
+
+    chunk_size: int
+    esdl_chunk_size: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the job export configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.chunk_size = int(os.environ.get(f"{prefix}JOB_EXPORT_CHUNK_SIZE", "1000"))
+        self.esdl_chunk_size = int(os.environ.get(f"{prefix}JOB_EXPORT_ESDL_CHUNK_SIZE", "10"))
+
+
+class JobSweepConfig:
+    """Retrieve configuration of parameter sweeps from environment variables."""
+
+    max_jobs: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the parameter sweep configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.max_jobs = int(os.environ.get(f"{prefix}JOB_SWEEP_MAX_JOBS", "1000"))
+
+
+class JobResultConfig:
+    """Retrieve configuration of the handling of job results from environment variables."""
+
+    spill_threshold_bytes: int
+    in_flight_budget_bytes: int
+
+    def __init__(self, prefix: str = ""):
+        """Create the job result configuration and retrieve values from env vars.
+
+        :param prefix: Prefix to the name environment variables.
+        """
+        self.spill_threshold_bytes = int(
+            os.environ.get(f"{prefix}JOB_RESULT_SPILL_THRESHOLD_BYTES", "8388608")
+        )
+        self.in_flight_budget_bytes = int(
+            os.environ.get(f"{prefix}JOB_RESULT_IN_FLIGHT_BUDGET_BYTES", "536870912")
+        )
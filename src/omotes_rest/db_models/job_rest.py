@@ -1,58 +1,290 @@
 import uuid
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Optional
 
 import sqlalchemy as db
-from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Mapped, column_property
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.functions import GenericFunction
 
 from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.job_partitions import DEFAULT_PARTITION_SUFFIX
 
 Base = declarative_base()
 
 
+class ClockTimestamp(GenericFunction[datetime]):
+    """The current time of the database, `func.clock_timestamp()`.
+
+    Unlike `now()`, which is the start time of the transaction, it is the time at which the
+    statement runs. SQLite, which is used by some unit tests, has no such function and uses
+    `CURRENT_TIMESTAMP` instead.
+    """
+
+    name = "clock_timestamp"
+    type = db.DateTime(timezone=True)
+    inherit_cache = True
+
+
+@compiles(ClockTimestamp, "sqlite")
+def _compile_clock_timestamp_sqlite(
+    element: ClockTimestamp, compiler: SQLCompiler, **kw: Any
+) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+JOB_SUMMARY_COLUMNS = (
+    "job_id",
+    "job_name",
+    "workflow_type",
+    "registered_at",
+    "user_name",
+    "project_name",
+)
+"""Columns of a job summary in the job_rest table, included in the user and project indexes for
+index-only scans. The other columns of a job summary are in the job_state table."""
+
+JOB_STATE_FILLFACTOR = 50
+"""Percentage of each page of the job_state table filled by inserts. The free space lets an
+update write the new row version on the same page, which is required for a HOT update. It is
+set on each partition, as a partitioned table has no storage of its own."""
+
+job_rest_table = db.Table(
+    "job_rest",
+    Base.metadata,
+    db.Column("job_id", UUID(as_uuid=True), primary_key=True),
+    db.Column("job_name", db.String, nullable=False),
+    db.Column("workflow_type", db.String),
+    db.Column("job_priority", db.String),
+    db.Column("registered_at", db.DateTime(timezone=True), primary_key=True),
+    db.Column("timeout_after_s", db.Integer),
+    db.Column("user_name", db.String, nullable=False),
+    db.Column("project_name", db.String, nullable=False),
+    db.Column("input_params_dict", db.JSON),
+    db.Column("input_esdl", db.String, nullable=False),
+    db.Column("output_esdl", db.String),
+    db.Column("logs", db.String),
+    db.Column("esdl_feedback", db.JSON),
+    db.Column("result_hash", db.String),
+    db.Column("cached_from_job_id", UUID(as_uuid=True)),
+    db.Index(
+        "ix_job_rest_result_hash",
+        "result_hash",
+        postgresql_where=db.text("result_hash IS NOT NULL"),
+    ),
+    db.Index(
+        "ix_job_rest_user_name",
+        "user_name",
+        postgresql_include=[c for c in JOB_SUMMARY_COLUMNS if c != "user_name"],
+    ),
+    db.Index(
+        "ix_job_rest_project_name",
+        "project_name",
+        postgresql_include=[c for c in JOB_SUMMARY_COLUMNS if c != "project_name"],
+    ),
+    db.Index("ix_job_rest_registered_at", "registered_at"),
+    postgresql_partition_by="RANGE (registered_at)",
+)
+"""Input and result of the jobs, which are written once when the job is registered and once
+when it stops.
+
+The table is partitioned by month on the registration time, see `omotes_rest.job_partitions`."""
+
+job_state_table = db.Table(
+    "job_state",
+    Base.metadata,
+    db.Column("job_id", UUID(as_uuid=True), primary_key=True),
+    db.Column("registered_at", db.DateTime(timezone=True), primary_key=True),
+    db.Column("status", db.Enum(JobRestStatus), nullable=False),
+    db.Column("progress_fraction", db.Float, nullable=False),
+    db.Column("progress_message", db.String, nullable=False),
+    db.Column("submitted_at", db.DateTime(timezone=True)),
+    db.Column("running_at", db.DateTime(timezone=True)),
+    db.Column("stopped_at", db.DateTime(timezone=True)),
+    db.Column(
+        "updated_at",
+        db.DateTime(timezone=True),
+        nullable=False,
+        server_default=db.func.clock_timestamp(),
+    ),
+    db.ForeignKeyConstraint(
+        ["job_id", "registered_at"],
+        ["job_rest.job_id", "job_rest.registered_at"],
+        ondelete="CASCADE",
+    ),
+    db.Index("ix_job_state_status", "status"),
+    db.Index("ix_job_state_updated_at", "updated_at", postgresql_using="brin"),
+    postgresql_partition_by="RANGE (registered_at)",
+)
+"""Status and progress of the jobs, which are updated on every status and progress update.
+
+The rows are narrow and the progress columns are not indexed, so a progress update is a HOT
+update that neither copies the large input and output of the job nor touches any index. The
+updated_at column is changed by every update, its BRIN index does not prevent HOT updates from
+PostgreSQL 16, the minimum supported version. The table is partitioned like the job_rest table,
+so a month of jobs is detached from both at once."""
+
+for table, storage_parameters in (
+    (job_rest_table, ""),
+    (job_state_table, f" WITH (fillfactor = {JOB_STATE_FILLFACTOR})"),
+):
+    db.event.listen(
+        table,
+        "after_create",
+        db.DDL(
+            f"CREATE TABLE %(fullname)s_{DEFAULT_PARTITION_SUFFIX} PARTITION OF %(fullname)s "
+            f"DEFAULT{storage_parameters}"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
+def split_job_columns(job: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Split the column values of a job into those of the job_rest and the job_state table.
+
+    :param job: Column values of a job by column name.
+    :return: The column values of the job_rest table and of the job_state table, both with the
+        job id.
+    """
+    job_rest_values = {name: value for name, value in job.items() if name in job_rest_table.c}
+    job_state_values = {name: value for name, value in job.items() if name in job_state_table.c}
+    return job_rest_values, job_state_values
+
+
 @dataclass
-class JobRest(Base):
-    """SQL table definition for an Omotes job."""
+class JobState(Base):
+    """SQL table definition for the status and progress of an Omotes job."""
 
-    __tablename__ = "job_rest"
+    __table__ = job_state_table
 
-    progress_fraction: Mapped[float]
+    job_id: Mapped[uuid.UUID] = column_property(job_state_table.c.job_id)
+    """OMOTES identifier for the job."""
+    registered_at: Mapped[datetime] = column_property(job_state_table.c.registered_at)
+    """Time at which the job is registered, the partition key."""
+    status: Mapped[JobRestStatus] = column_property(job_state_table.c.status)
+    """Last received status of the job."""
+    progress_fraction: Mapped[float] = column_property(job_state_table.c.progress_fraction)
     """Last received progress (fraction) of the job."""
-    job_id: uuid.UUID = db.Column(UUID(as_uuid=True), primary_key=True)  # type: ignore [misc]
+    progress_message: Mapped[str] = column_property(job_state_table.c.progress_message)
+    """Last received progress message of the job."""
+    submitted_at: Mapped[datetime] = column_property(job_state_table.c.submitted_at)
+    """Time at which the job is submitted to Celery."""
+    running_at: Mapped[datetime] = column_property(job_state_table.c.running_at)
+    """Time at which a Celery worker has started the task for this job."""
+    stopped_at: Mapped[datetime] = column_property(job_state_table.c.stopped_at)
+    """Time at which the job stopped: due to finish, error or cancel."""
+    updated_at: Mapped[datetime] = column_property(job_state_table.c.updated_at)
+    """Time (of the database) at which the job was last registered or updated."""
+
+
+@dataclass
+class JobRest(Base):
+    """SQL definition for an Omotes job, mapped to the job_rest table joined with its job_state.
+
+    Reads through this class join both tables. Inserts and updates of instances write to both
+    tables, statements which update or delete rows must use `job_rest_table` or `JobState`.
+    """
+
+    __table__ = db.join(job_rest_table, job_state_table)
+
+    job_id: Mapped[uuid.UUID] = column_property(job_rest_table.c.job_id, job_state_table.c.job_id)
     """OMOTES identifier for the job."""
-    job_name: str = db.Column(db.String, nullable=False)
+    job_name: Mapped[str] = column_property(job_rest_table.c.job_name)
     """Job name/description."""
-    workflow_type: str = db.Column(db.String)
+    workflow_type: Mapped[str] = column_property(job_rest_table.c.workflow_type)
     """Name of the workflow this job runs."""
-    job_priority: str = db.Column(db.String)
+    job_priority: Mapped[str] = column_property(job_rest_table.c.job_priority)
     """Priority of this run."""
-    status: JobRestStatus = db.Column(db.Enum(JobRestStatus), nullable=False)
+    status: Mapped[JobRestStatus] = column_property(job_state_table.c.status)
     """Last received status of the job."""
-    progress_message: str = db.Column(db.String, nullable=False)
+    progress_fraction: Mapped[float] = column_property(job_state_table.c.progress_fraction)
     """Last received progress (fraction) of the job."""
-    registered_at: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+    progress_message: Mapped[str] = column_property(job_state_table.c.progress_message)
+    """Last received progress message of the job."""
+    registered_at: Mapped[datetime] = column_property(
+        job_rest_table.c.registered_at, job_state_table.c.registered_at
+    )
     """Time at which the job is registered."""
-    submitted_at: datetime = db.Column(db.DateTime(timezone=True))
+    submitted_at: Mapped[datetime] = column_property(job_state_table.c.submitted_at)
     """Time at which the job is submitted to Celery."""
-    running_at: datetime = db.Column(db.DateTime(timezone=True))
+    running_at: Mapped[datetime] = column_property(job_state_table.c.running_at)
     """Time at which a Celery worker has started the task for this job."""
-    stopped_at: datetime = db.Column(db.DateTime(timezone=True))
+    stopped_at: Mapped[datetime] = column_property(job_state_table.c.stopped_at)
     """Time at which the job stopped: due to finish, error or cancel."""
-    timeout_after_s: int = db.Column(db.Integer)
+    updated_at: Mapped[datetime] = column_property(job_state_table.c.updated_at)
+    """Time (of the database) at which the job was last registered or updated."""
+    timeout_after_s: Mapped[int] = column_property(job_rest_table.c.timeout_after_s)
     """Duration the job may run for before being cancelled due to timing out."""
-    user_name: str = db.Column(db.String, nullable=False)
+    user_name: Mapped[str] = column_property(job_rest_table.c.user_name)
     """User name of job submitter."""
-    project_name: str = db.Column(db.String, nullable=False)
+    project_name: Mapped[str] = column_property(job_rest_table.c.project_name)
     """Project name that the job belongs to."""
-    input_params_dict: dict = db.Column(db.JSON)
+    input_params_dict: Mapped[dict] = column_property(job_rest_table.c.input_params_dict)
     """Dictionary of 'non-ESDL' input parameters."""
-    input_esdl: str = db.Column(db.String, nullable=False)
+    input_esdl: Mapped[str] = column_property(job_rest_table.c.input_esdl)
     """Input ESDL as base64 encoded string."""
-    output_esdl: str = db.Column(db.String)
+    output_esdl: Mapped[str] = column_property(job_rest_table.c.output_esdl)
     """Output ESDL as base64 encoded string."""
-    logs: str = db.Column(db.String)
+    logs: Mapped[str] = column_property(job_rest_table.c.logs)
     """Logs as string."""
-    esdl_feedback: str = db.Column(db.JSON)
+    esdl_feedback: Mapped[str] = column_property(job_rest_table.c.esdl_feedback)
     """Dictionary of ESDL feedback messages per object id."""
+    result_hash: Mapped[Optional[str]] = column_property(job_rest_table.c.result_hash)
+    """Hash of the workflow type, parameters and input ESDL, set if the result cache is enabled."""
+    cached_from_job_id: Mapped[uuid.UUID] = column_property(job_rest_table.c.cached_from_job_id)
+    """Job from which the result is reused, set if this job was answered by the result cache."""
+
+
+@dataclass
+class JobOutbox(Base):
+    """SQL table definition for a job submission which is not yet published to Omotes.
+
+    The entry is inserted in the same transaction as the job and removed once the job submission
+    is published, so a registered job is never lost when publishing fails.
+    """
+
+    __tablename__ = "job_outbox"
+    __table_args__ = (
+        db.ForeignKeyConstraint(
+            ["job_id", "registered_at"],
+            ["job_rest.job_id", "job_rest.registered_at"],
+            ondelete="CASCADE",
+        ),
+        db.Index("ix_job_outbox_next_attempt_at", "next_attempt_at"),
+    )
+
+    job_id: uuid.UUID = db.Column(UUID(as_uuid=True), primary_key=True)  # type: ignore [misc]
+    """Job to submit to Omotes."""
+    registered_at: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+    """Time at which the job is registered, to find the partition of the job."""
+    created_at: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+    """Time at which the job is added to the outbox."""
+    next_attempt_at: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+    """Time from which the job submission may be published (again)."""
+    attempts: int = db.Column(db.Integer, nullable=False, default=0)
+    """Number of failed attempts to publish the job submission."""
+    last_error: Optional[str] = db.Column(db.String)  # type: ignore [misc]
+    """Error of the last failed attempt to publish the job submission."""
+
+
+@dataclass
+class JobTombstone(Base):
+    """SQL table definition for a deleted job, to include the deletion in the job changes.
+
+    Tombstones are removed once they are older than the retention of the job change cursors.
+    """
+
+    __tablename__ = "job_tombstone"
+    __table_args__ = (db.Index("ix_job_tombstone_deleted_at", "deleted_at"),)
+
+    job_id: uuid.UUID = db.Column(UUID(as_uuid=True), primary_key=True)  # type: ignore [misc]
+    """The deleted job."""
+    user_name: str = db.Column(db.String, nullable=False)
+    """User name of the submitter of the deleted job."""
+    project_name: str = db.Column(db.String, nullable=False)
+    """Project name that the deleted job belonged to."""
+    deleted_at: datetime = db.Column(db.DateTime(timezone=True), nullable=False)
+    """Time (of the database) at which the job was deleted."""
@@ -0,0 +1,222 @@
+import argparse
+import importlib.util
+import sys
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+import orjson
+
+from omotes_rest.apis.api_dataclasses import JobExportQuery, JobRestStatus
+from omotes_rest.apis.job_summary import JOB_EXPORT_COLUMNS, JOB_EXPORT_ESDL_COLUMNS
+from omotes_rest.config import JobExportConfig, PostgresConfig
+from omotes_rest.postgres_interface import PostgresInterface
+
+ExportWriter = Callable[[Sequence[str], Iterable[Sequence[Sequence[Any]]]], Iterator[bytes]]
+
+
+def _dump_value(value: Any) -> Any:
+    if isinstance(value, JobRestStatus):
+        return value.name
+    return value
+
+
+def write_ndjson(
+    columns: Sequence[str], chunks: Iterable[Sequence[Sequence[Any]]]
+) -> Iterator[bytes]:
+    """Write jobs as newline delimited JSON, a JSON object per line.
+
+    Values are serialized as in the other job responses, the input parameters as nested JSON.
+
+    :param columns: Names of the columns.
+    :param chunks: Chunks of rows with the columns.
+    :return: Iterator over the data, a part per chunk.
+    """
+    for rows in chunks:
+        yield b"".join(
+            orjson.dumps(
+                {column: _dump_value(value) for column, value in zip(columns, row)},
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+            for row in rows
+        )
+
+
+def _parquet_values(column: str, values: Sequence[Any]) -> list[Any]:
+    if column == "job_id":
+        return [str(value) for value in values]
+    if column == "status":
+        return [None if value is None else value.name for value in values]
+    if column == "input_params_dict":
+        # The structure of the input parameters differs per workflow type, so these are stored
+        # as JSON text.
+        return [None if value is None else orjson.dumps(value).decode() for value in values]
+    return list(values)
+
+
+class _ChunkSink:
+    """Writable file which keeps the written data until it is taken."""
+
+    def __init__(self) -> None:
+        """Create the empty sink."""
+        self.parts: list[bytes] = []
+        self.position = 0
+        self.closed = False
+
+    def write(self, data: bytes) -> int:
+        """Keep the data.
+
+        :param data: Written data.
+        :return: Number of bytes written.
+        """
+        self.parts.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        """Get the number of bytes written in total.
+
+        :return: The position in the file.
+        """
+        return self.position
+
+    def flush(self) -> None:
+        """Nothing to flush, the data is kept until it is taken."""
+
+    def close(self) -> None:
+        """Close the file, the data which is not yet taken can still be taken."""
+        self.closed = True
+
+    def take(self) -> bytes:
+        """Take the data written since the previous take.
+
+        :return: The data.
+        """
+        data = b"".join(self.parts)
+        self.parts = []
+        return data
+
+
+def write_parquet(
+    columns: Sequence[str], chunks: Iterable[Sequence[Sequence[Any]]]
+) -> Iterator[bytes]:
+    """Write jobs as a Parquet file, with a row group per chunk.
+
+    :param columns: Names of the columns.
+    :param chunks: Chunks of rows with the columns.
+    :return: Iterator over the data, a part per chunk and a last part with the footer.
+    """
+    # pyarrow takes a significant time and memory to import, so only on the first export.
+    import pyarrow
+    import pyarrow.parquet
+
+    timestamp = pyarrow.timestamp("us", tz="UTC")
+    types = {"timeout_after_s": pyarrow.int64()} | {
+        column: timestamp
+        for column in ("registered_at", "submitted_at", "running_at", "stopped_at")
+    }
+    schema = pyarrow.schema([(column, types.get(column, pyarrow.string())) for column in columns])
+    sink = _ChunkSink()
+    with pyarrow.parquet.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for rows in chunks:
+            if not rows:
+                continue
+            values_per_column = zip(*rows)
+            writer.write_batch(
+                pyarrow.record_batch(
+                    [
+                        pyarrow.array(_parquet_values(column, values), type=field.type)
+                        for column, values, field in zip(columns, values_per_column, schema)
+                    ],
+                    schema=schema,
+                )
+            )
+            yield sink.take()
+    yield sink.take()
+
+
+EXPORT_FORMATS: dict[str, tuple[str, ExportWriter]] = {
+    "ndjson": ("application/x-ndjson", write_ndjson),
+}
+"""Supported export formats with their mimetype and writer. Parquet is only supported if the
+`pyarrow` package is installed."""
+
+if importlib.util.find_spec("pyarrow"):
+    EXPORT_FORMATS["parquet"] = ("application/vnd.apache.parquet", write_parquet)
+
+
+class UnsupportedExportFormatException(Exception):
+    """Thrown when jobs are exported in a format which is not supported."""
+
+    ...  # pragma: no cover
+
+
+def export_jobs(
+    postgres_if: PostgresInterface, query: JobExportQuery, config: JobExportConfig
+) -> Iterator[bytes]:
+    """Export jobs in the requested format, reading and writing a chunk of jobs at a time.
+
+    The ESDL columns are only exported if requested, in smaller chunks.
+
+    :param postgres_if: Interface to the database with the jobs.
+    :param query: Filters on the jobs to export and the format.
+    :param config: Export configuration.
+    :return: Iterator over the exported data.
+    :raises UnsupportedExportFormatException: If the format is not supported.
+    """
+    if query.format not in EXPORT_FORMATS:
+        raise UnsupportedExportFormatException(
+            f"Export format '{query.format}' is not supported, the 'pyarrow' package is needed"
+            f" for parquet."
+        )
+    _, write = EXPORT_FORMATS[query.format]
+    columns: tuple[str, ...] = JOB_EXPORT_COLUMNS
+    chunk_size = config.chunk_size
+    if query.include_esdl:
+        columns += JOB_EXPORT_ESDL_COLUMNS
+        chunk_size = config.esdl_chunk_size
+    return write(columns, postgres_if.get_job_export_chunks(query, columns, chunk_size))
+
+
+def main(args: Sequence[str] | None = None) -> None:
+    """Export jobs from the database configured by the POSTGRES_* environment variables.
+
+    :param args: Command line arguments, defaults to those of the process.
+    """
+    parser = argparse.ArgumentParser(description="Export the history of the OMOTES jobs.")
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="ndjson")
+    parser.add_argument("--output", help="File to write to, defaults to standard output.")
+    parser.add_argument("--include-esdl", action="store_true", help="Export the ESDLs too.")
+    parser.add_argument("--user-name")
+    parser.add_argument("--project-name")
+    parser.add_argument("--workflow-type")
+    parser.add_argument("--status", choices=[status.name for status in JobRestStatus])
+    parser.add_argument("--registered-after", type=datetime.fromisoformat)
+    parser.add_argument("--registered-before", type=datetime.fromisoformat)
+    parsed = parser.parse_args(args)
+
+    query = JobExportQuery(
+        format=parsed.format,
+        include_esdl=parsed.include_esdl,
+        user_name=parsed.user_name,
+        project_name=parsed.project_name,
+        workflow_type=parsed.workflow_type,
+        status=None if parsed.status is None else JobRestStatus[parsed.status],
+        registered_after=parsed.registered_after,
+        registered_before=parsed.registered_before,
+    )
+    postgres_if = PostgresInterface(PostgresConfig())
+    postgres_if.start()
+    try:
+        output = open(parsed.output, "wb") if parsed.output else sys.stdout.buffer
+        try:
+            for data in export_jobs(postgres_if, query, JobExportConfig()):
+                output.write(data)
+        finally:
+            if parsed.output:
+                output.close()
+    finally:
+        postgres_if.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger("omotes_rest")
+
+
+class JobOutboxRelay:
+    """Background thread which publishes the job submissions in the outbox in batches.
+
+    A batch is relayed each poll interval, or immediately when notified of a new job in this
+    process. As long as full batches are relayed the next batch is relayed without waiting.
+    """
+
+    batch_size: int
+    """Maximum number of outbox entries relayed in a batch."""
+    poll_interval_s: float
+    """Time between batches when the outbox is (nearly) empty."""
+
+    def __init__(self, relay_batch: Callable[[], int], batch_size: int, poll_interval_s: float):
+        """Create the relay.
+
+        :param relay_batch: Function relaying a batch, returns the number of outbox entries in
+            the batch.
+        :param batch_size: Maximum number of outbox entries relayed in a batch.
+        :param poll_interval_s: Time between batches when the outbox is (nearly) empty.
+        """
+        self.batch_size = batch_size
+        self.poll_interval_s = poll_interval_s
+        self._relay_batch = relay_batch
+        self._wake_up = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start relaying in a background thread."""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="job_outbox_relay", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop relaying, a batch which is being relayed is finished first."""
+        self._stopping.set()
+        self._wake_up.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def notify(self) -> None:
+        """Relay the next batch without waiting for the poll interval."""
+        self._wake_up.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake_up.clear()
+            try:
+                relayed = self._relay_batch()
+            except Exception:
+                logger.exception("Error while relaying the job outbox")
+                relayed = 0
+            if relayed < self.batch_size:
+                self._wake_up.wait(self.poll_interval_s)
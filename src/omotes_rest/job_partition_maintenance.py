@@ -0,0 +1,49 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger("omotes_rest")
+
+
+class JobPartitionMaintainer:
+    """Background thread which maintains the monthly partitions of the job tables periodically.
+
+    The maintenance takes locks on the partitioned tables, so it runs outside the requests which
+    register jobs and a slow maintenance never delays a job submission.
+    """
+
+    interval_s: float
+    """Time between the maintenance runs."""
+
+    def __init__(self, maintain: Callable[[], None], interval_s: float):
+        """Create the maintainer.
+
+        :param maintain: Function maintaining the job partitions.
+        :param interval_s: Time between the maintenance runs.
+        """
+        self.interval_s = interval_s
+        self._maintain = maintain
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start maintaining in a background thread, the first run is after one interval."""
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="job_partition_maintainer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop maintaining, a maintenance run which is in progress is finished first."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.interval_s):
+            try:
+                self._maintain()
+            except Exception:
+                logger.exception("Error while maintaining the job partitions")
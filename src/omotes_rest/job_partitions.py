@@ -0,0 +1,97 @@
+import os
+import re
+import uuid
+from datetime import datetime, timedelta, timezone
+
+PARTITIONED_JOB_TABLES = ("job_rest", "job_state")
+"""Tables which are partitioned by month on the registration time of the jobs. The job_state
+table references the job_rest table, so its partitions are detached before those of job_rest."""
+DEFAULT_PARTITION_SUFFIX = "default"
+"""Suffix of the default partition, which holds the jobs registered in a month without a
+partition."""
+
+_PARTITION_NAME_PATTERN = re.compile(
+    rf"^(?P<table>{'|'.join(PARTITIONED_JOB_TABLES)})_"
+    rf"(p(?P<year>\d{{4}})_(?P<month>\d{{2}})|{DEFAULT_PARTITION_SUFFIX})$"
+)
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def new_job_id(registered_at: datetime | None = None) -> uuid.UUID:
+    """Create a time-ordered job id (UUID version 7) which encodes its registration time.
+
+    The registration time of a job is derived from its id, so a query for a job by its id can
+    be bounded to the partition of the job.
+
+    :param registered_at: Registration time of the job, defaults to now.
+    :return: The job id.
+    """
+    if registered_at is None:
+        registered_at = datetime.now(timezone.utc)
+    unix_ms = int(registered_at.timestamp() * 1000) & 0xFFFF_FFFF_FFFF
+    random_bits = int.from_bytes(os.urandom(10), "big")
+    return uuid.UUID(
+        int=unix_ms << 80
+        | 0x7 << 76
+        | (random_bits >> 68) << 64
+        | 0b10 << 62
+        | random_bits & 0x3FFF_FFFF_FFFF_FFFF
+    )
+
+
+def job_id_registered_at(job_id: uuid.UUID) -> datetime | None:
+    """Get the registration time encoded in a job id.
+
+    :param job_id: The job id.
+    :return: The registration time with millisecond precision, or None if the job id is not a
+        UUID version 7 and does not encode its registration time.
+    """
+    if job_id.version != 7:
+        return None
+    return _UNIX_EPOCH + timedelta(milliseconds=job_id.int >> 80)
+
+
+def month_start(moment: datetime) -> datetime:
+    """Get the start of the month (in UTC) of a moment.
+
+    :param moment: The moment, in local time if it has no timezone.
+    :return: The first moment of the month in UTC.
+    """
+    moment = moment.astimezone(timezone.utc)
+    return datetime(moment.year, moment.month, 1, tzinfo=timezone.utc)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    """Add a number of months to the start of a month.
+
+    :param month: Start of a month in UTC.
+    :param months: Number of months to add, may be negative.
+    :return: Start of the resulting month in UTC.
+    """
+    month_index = month.year * 12 + month.month - 1 + months
+    return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def partition_name(table: str, month: datetime) -> str:
+    """Get the name of the partition of a table with the jobs registered in a month.
+
+    :param table: Name of the partitioned table.
+    :param month: Start of the month in UTC.
+    :return: Name of the partition.
+    """
+    return f"{table}_p{month:%Y_%m}"
+
+
+def parse_partition_name(name: str) -> tuple[str, datetime | None] | None:
+    """Parse the name of a partition of a partitioned job table.
+
+    :param name: Name of a table.
+    :return: The name of the partitioned table and the start of the month of the partition, None
+        for the default partition. None if the table is not a partition.
+    """
+    match = _PARTITION_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    if match["year"] is None:
+        return match["table"], None
+    return match["table"], datetime(int(match["year"]), int(match["month"]), 1, tzinfo=timezone.utc)
@@ -0,0 +1,86 @@
+import logging
+import threading
+import uuid
+from typing import Callable
+
+logger = logging.getLogger("omotes_rest")
+
+
+class JobProgressWriter:
+    """Background thread which writes the progress updates of jobs in batches.
+
+    Progress updates arrive in bursts from the callbacks of the running jobs. Only the latest
+    progress of each job is kept until the next batch is written, each flush interval.
+    """
+
+    flush_interval_s: float
+    """Time between the batches of progress updates."""
+
+    def __init__(
+        self,
+        write_batch: Callable[[dict[uuid.UUID, tuple[float, str]]], None],
+        flush_interval_s: float,
+    ):
+        """Create the writer.
+
+        :param write_batch: Function writing a batch, the progress fraction and progress message
+            per job id.
+        :param flush_interval_s: Time between the batches of progress updates.
+        """
+        self.flush_interval_s = flush_interval_s
+        self._write_batch = write_batch
+        self._pending: dict[uuid.UUID, tuple[float, str]] = {}
+        self._pending_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start writing in a background thread."""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="job_progress_writer", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop writing in the background and write the pending progress updates."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def put(self, job_id: uuid.UUID, progress_fraction: float, progress_message: str) -> None:
+        """Add a progress update to the next batch, replacing a pending update of the job.
+
+        :param job_id: Job id.
+        :param progress_fraction: New progress fraction.
+        :param progress_message: New progress message.
+        """
+        with self._pending_lock:
+            self._pending[job_id] = (progress_fraction, progress_message)
+
+    def flush(self) -> None:
+        """Write the pending progress updates.
+
+        Batches are written one at a time, so a later progress update of a job is never
+        overwritten by an earlier one. If the batch fails, its updates are kept for the next batch
+        unless a later update of the job arrived in the meantime.
+        """
+        with self._write_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                self._write_batch(batch)
+            except Exception:
+                with self._pending_lock:
+                    self._pending = batch | self._pending
+                raise
+
+    def _run(self) -> None:
+        while not self._stopping.wait(self.flush_interval_s):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Error while writing the job progress updates")
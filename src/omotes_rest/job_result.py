@@ -0,0 +1,91 @@
+import threading
+from contextlib import contextmanager
+from typing import BinaryIO, Generator
+
+from omotes_sdk_protocol.job_pb2 import JobResult
+
+SPILL_CHUNK_SIZE = 1024 * 1024
+"""Number of characters of a job result which are encoded and written to the file at a time."""
+
+
+class InFlightBytesBudget:
+    """Limit on the size of the job results which are held in memory at the same time.
+
+    Job results are handled in the threads of the SDK, a thread which would exceed the budget
+    waits until other results are handled. The result is not acknowledged while waiting, so the
+    consumption of results slows down instead of the service running out of memory. A result
+    larger than the budget is handled when no other result is in flight.
+    """
+
+    max_bytes: int
+    """Maximum total size of the results in flight."""
+
+    def __init__(self, max_bytes: int):
+        """Create the budget.
+
+        :param max_bytes: Maximum total size of the results in flight.
+        """
+        self.max_bytes = max_bytes
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        """Total size of the results in flight."""
+        return self._in_flight
+
+    @contextmanager
+    def reserve(self, size: int) -> Generator[None, None, None]:
+        """Reserve part of the budget within this scope, waiting until it is available.
+
+        :param size: Size of the result in bytes.
+        """
+        with self._condition:
+            while self._in_flight and self._in_flight + size > self.max_bytes:
+                self._condition.wait()
+            self._in_flight += size
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= size
+                self._condition.notify_all()
+
+
+def job_result_size(result: JobResult) -> int:
+    """Get the size of the output ESDL and logs of a job result, in characters.
+
+    `ByteSize` serializes the message with the upb implementation of protobuf, which costs more
+    memory than the result itself. Each value is retrieved and released in turn instead.
+
+    :param result: JobResult protobuf message.
+    :return: The size, equal to the number of bytes for ASCII values.
+    """
+    return len(result.output_esdl) + len(result.logs)
+
+
+def _write_copy_value(file: BinaryIO, value: str) -> None:
+    for start in range(0, len(value), SPILL_CHUNK_SIZE):
+        chunk = value[start : start + SPILL_CHUNK_SIZE]
+        file.write(
+            chunk.replace("\\", "\\\\")
+            .replace("\n", "\\n")
+            .replace("\r", "\\r")
+            .replace("\t", "\\t")
+            .encode("utf-8")
+        )
+
+
+def spill_job_result(result: JobResult, file: BinaryIO) -> None:
+    """Write the output ESDL and logs of a job result to a file, as a row in COPY text format.
+
+    The values are encoded a chunk at a time, so only the value itself is held in memory and not
+    also its encoded form. Each value is released before the next is retrieved from the result.
+
+    :param result: JobResult protobuf message.
+    :param file: Binary file to write to.
+    """
+    _write_copy_value(file, result.output_esdl)
+    file.write(b"\t")
+    _write_copy_value(file, result.logs)
+    file.write(b"\n")
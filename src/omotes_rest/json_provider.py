@@ -0,0 +1,85 @@
+import dataclasses
+import decimal
+import typing
+import uuid
+from datetime import date
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+
+
+def default(obj: typing.Any) -> typing.Any:
+    """Convert a value which orjson does not serialize natively, e.g. a `Decimal`.
+
+    Subclasses of the natively serialized types end up here as well.
+
+    :param obj: The value to convert.
+    :raises TypeError: If the value cannot be serialized.
+    :return: A value which orjson serializes.
+    """
+    if isinstance(obj, date):
+        return obj.isoformat()
+    if isinstance(obj, (decimal.Decimal, uuid.UUID)):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider which serializes with orjson instead of the built-in `json` library.
+
+    UUIDs, datetimes, dates, enums and dataclasses are serialized natively by orjson, decimals
+    are converted by `default`. Datetimes are serialized to ISO 8601
+    strings, and enums to their value. Keys are sorted and output is only indented in debug mode,
+    the same as Flask's default provider.
+    """
+
+    sort_keys = True
+    """Sort the keys in any serialized dicts."""
+    compact: bool | None = None
+    """If True, or None out of debug mode, the response output will not be indented."""
+    mimetype = "application/json"
+    """The mimetype set in `response`."""
+
+    def _options(self, indent: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def dumps(self, obj: typing.Any, **kwargs: typing.Any) -> str:
+        """Serialize data as JSON to a string.
+
+        :param obj: The data to serialize.
+        :param kwargs: Ignored, only there for compatibility with the `JSONProvider` interface.
+        :return: The JSON string.
+        """
+        return orjson.dumps(obj, default=default, option=self._options()).decode("utf-8")
+
+    def loads(self, s: str | bytes, **kwargs: typing.Any) -> typing.Any:
+        """Deserialize data as JSON from a string or bytes.
+
+        :param s: Text or UTF-8 bytes.
+        :param kwargs: Ignored, only there for compatibility with the `JSONProvider` interface.
+        :return: The deserialized data.
+        """
+        return orjson.loads(s)
+
+    def response(self, *args: typing.Any, **kwargs: typing.Any) -> Response:
+        """Serialize the given arguments as JSON and return a response with it.
+
+        Either positional or keyword arguments can be given, not both.
+
+        :param args: A single value to serialize, or multiple values to treat as a list.
+        :param kwargs: Treat as a dict to serialize.
+        :return: The JSON response.
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        data = orjson.dumps(obj, default=default, option=self._options(indent))
+        response: Response = self._app.response_class(data + b"\n", mimetype=self.mimetype)
+        return response
@@ -1,4 +1,4 @@
-import json
+import gc
 import logging
 from os import PathLike
 from time import strftime
@@ -9,7 +9,7 @@ from werkzeug.wrappers.response import Response as WerkzeugResponse
 from gunicorn.arbiter import Arbiter
 from gunicorn.workers.sync import SyncWorker
 
-from omotes_rest import create_app
+from omotes_rest.app_factory import create_app
 from omotes_rest.rest_interface import RestInterface
 from omotes_rest.settings import EnvSettings
 from omotes_rest.typed_app import current_app
@@ -57,7 +57,7 @@ def serve_static(path: PathLike | str) -> FlaskResponse:
 def handle_exception(e: HTTPException) -> WerkzeugResponse:
     """Return JSON instead of HTML for HTTP errors."""
     response = e.get_response()
-    data = json.dumps(
+    data = app.json.dumps(
         {
             "code": e.code,
             "name": e.name,
@@ -78,7 +78,16 @@ def handle_exception(e: HTTPException) -> WerkzeugResponse:
 def handle_500(e: Exception) -> tuple[str, int]:
     """Handle exceptions."""
     logger.exception(f"Unhandled exception occurred {str(e)}")
-    return json.dumps({"message": "Internal Server Error"}), 500
+    return app.json.dumps({"message": "Internal Server Error"}), 500
+
+
+def pre_fork(_: Arbiter, __: SyncWorker) -> None:
+    """Called just before a worker is forked.
+
+    Freezes the objects of the preloaded app, so the garbage collector of the worker does not
+    touch them and the memory pages with these objects stay shared with the arbiter.
+    """
+    gc.freeze()
 
 
 def post_fork(_: Arbiter, __: SyncWorker) -> None:
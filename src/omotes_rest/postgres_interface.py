@@ -1,37 +1,173 @@
 import uuid
 from contextlib import contextmanager
-from datetime import datetime
-from typing import Generator
+from datetime import datetime, timedelta, timezone
+from typing import Any, BinaryIO, Callable, Generator, Iterable, Iterator, Sequence
 
-from sqlalchemy import select, update, delete, create_engine, orm
-from sqlalchemy.orm.strategy_options import load_only
-from sqlalchemy.orm import Session as SQLSession
-from sqlalchemy.engine import Engine, URL
+from sqlalchemy import (
+    ColumnElement,
+    text,
+    select,
+    update,
+    delete,
+    insert,
+    literal,
+    create_engine,
+    event,
+    orm,
+    or_,
+    func,
+    tuple_,
+    any_,
+    bindparam,
+    cast,
+    extract,
+    BigInteger,
+    Float,
+    LargeBinary,
+    Text,
+    column,
+    table as table_clause,
+)
+from sqlalchemy.dialects.postgresql import array, ARRAY, UUID
+from sqlalchemy.orm import Session as SQLSession, load_only
+from sqlalchemy.engine import Connection, Engine, ExecutionContext, Row, URL
+from sqlalchemy.exc import DBAPIError
 
 import logging
-from omotes_rest.apis.api_dataclasses import JobRestStatus, JobInput
-from omotes_rest.db_models.job_rest import JobRest
-from omotes_rest.config import PostgresConfig
+from omotes_rest.apis.api_dataclasses import (
+    JobRestStatus,
+    JobExportQuery,
+    JobInput,
+    JobStatsResponse,
+    DurationPercentiles,
+    JobStatusProgress,
+)
+from omotes_rest.apis.job_summary import (
+    ExpiredChangeCursorException,
+    JobChanges,
+    JobSummaryRecord,
+    JobVersion,
+)
+from omotes_rest.db_models.job_rest import (
+    JOB_STATE_FILLFACTOR,
+    JobOutbox,
+    JobRest,
+    JobState,
+    JobTombstone,
+    job_rest_table,
+    job_state_table,
+)
+from omotes_rest.job_partitions import (
+    PARTITIONED_JOB_TABLES,
+    add_months,
+    job_id_registered_at,
+    month_start,
+    parse_partition_name,
+    partition_name,
+)
+from omotes_rest.config import (
+    JobChangesConfig,
+    JobOutboxConfig,
+    PostgresConfig,
+    QueryTimingConfig,
+)
+from omotes_rest.query_timing import QueryTimer
 
 logger = logging.getLogger("omotes_rest")
 
 session_factory = orm.sessionmaker()
 Session = orm.scoped_session(session_factory)
 
-SELECT_JOB_SUMMARY_STMT = select(JobRest).options(
-    load_only(
-        JobRest.job_id,
-        JobRest.job_name,
-        JobRest.workflow_type,
-        JobRest.status,
-        JobRest.progress_fraction,
-        JobRest.registered_at,
-        JobRest.running_at,
-        JobRest.stopped_at,
-        JobRest.user_name,
-        JobRest.project_name,
-    )
+SELECT_JOB_SUMMARY_STMT = select(
+    JobRest.job_id,
+    JobRest.job_name,
+    JobRest.workflow_type,
+    JobRest.status,
+    JobRest.progress_fraction,
+    JobRest.registered_at,
+    JobRest.running_at,
+    JobRest.stopped_at,
+    JobRest.user_name,
+    JobRest.project_name,
+)
+
+JOB_SUBMISSION_COLUMNS = (
+    JobRest.job_id,
+    JobRest.registered_at,
+    JobRest.job_name,
+    JobRest.workflow_type,
+    JobRest.job_priority,
+    JobRest.timeout_after_s,
+    JobRest.input_params_dict,
+    JobRest.input_esdl,
+)
+"""Columns of a job which are needed to publish its job submission from the outbox."""
+
+
+JOB_STATS_PERCENTILES = (0.5, 0.9, 0.99)
+"""Percentiles of the durations in the job statistics."""
+JOB_PARTITIONS_LOCK_ID = 0x6A6F625F70617274
+"""Key of the advisory lock which serializes the maintenance of the job partitions."""
+UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+"""Start of the Unix time, the origin of the job change cursors."""
+BINARY_RESULTS = "binary_results"
+"""Execution option to transfer the results of a statement in binary format, which is only
+supported by the psycopg driver and ignored by psycopg2."""
+MIN_SERVER_VERSION = (16,)
+"""Minimum version of PostgreSQL, from which updates of the BRIN indexed job_state.updated_at
+column are HOT updates."""
+RESULT_COPY_CHUNK_SIZE = 1024 * 1024
+"""Number of bytes of a spilled job result which are sent to the database at a time."""
+job_result_upload = table_clause(
+    "job_result_upload", column("output_esdl", Text), column("logs", Text)
 )
+"""Temporary table to which a large job result is copied, within a single transaction."""
+
+
+def job_time_bounds(
+    job_ids: Iterable[uuid.UUID], *registered_at_columns: ColumnElement[datetime]
+) -> list[ColumnElement[bool]]:
+    """Bound the registration time of jobs by the registration time encoded in their ids.
+
+    With these bounds the planner skips the partitions which cannot contain the jobs.
+
+    :param job_ids: Ids of the jobs.
+    :param registered_at_columns: Registration time columns to bound.
+    :return: The bounds, none if a job id does not encode its registration time.
+    """
+    registration_times = []
+    for job_id in job_ids:
+        registered_at = job_id_registered_at(job_id)
+        if registered_at is None:
+            return []
+        registration_times.append(registered_at)
+    if not registration_times:
+        return []
+    earliest = min(registration_times)
+    latest = max(registration_times)
+    return [
+        bound
+        for column in registered_at_columns
+        for bound in (column >= earliest, column <= latest)
+    ]
+
+
+def change_cursor(moment: datetime) -> int:
+    """Convert a moment to a job change cursor.
+
+    :param moment: Timezone aware moment.
+    :return: The cursor, microseconds since the start of the Unix time.
+    """
+    return (moment - UNIX_EPOCH) // timedelta(microseconds=1)
+
+
+def change_cursor_time(cursor: int) -> datetime:
+    """Convert a job change cursor to the moment it represents.
+
+    :param cursor: The cursor, microseconds since the start of the Unix time.
+    :return: The moment in UTC.
+    """
+    return UNIX_EPOCH + timedelta(microseconds=cursor)
 
 
 @contextmanager
@@ -60,6 +196,64 @@ def session_scope(do_expunge: bool = False) -> Generator[SQLSession, None, None]
         Session.remove()
 
 
+@contextmanager
+def pipeline_scope(session: SQLSession) -> Generator[None, None, None]:
+    """Send the statements executed within this scope in pipeline mode.
+
+    In pipeline mode the statements are sent without waiting for the result of the previous
+    statement, so the statements cost a single round trip to the database. Only the psycopg
+    driver supports pipeline mode, with psycopg2 the statements are executed one by one.
+
+    :param session: Session whose connection sends the statements.
+    """
+    pipeline = getattr(session.connection().connection.driver_connection, "pipeline", None)
+    if pipeline is None:
+        yield
+    else:
+        with pipeline():
+            yield
+
+
+def copy_from_file(session: SQLSession, statement: str, file: BinaryIO, chunk_size: int) -> None:
+    """Execute a `COPY ... FROM STDIN` statement with the data in a file, a chunk at a time.
+
+    :param session: Session whose connection executes the statement.
+    :param statement: The COPY statement.
+    :param file: Binary file with the data in the format of the statement.
+    :param chunk_size: Number of bytes sent to the database at a time.
+    """
+    driver_connection: Any = session.connection().connection.driver_connection
+    cursor = driver_connection.cursor()
+    try:
+        if hasattr(cursor, "copy"):
+            with cursor.copy(statement) as copy:
+                while data := file.read(chunk_size):
+                    copy.write(data)
+        else:
+            cursor.copy_expert(statement, file, size=chunk_size)
+    finally:
+        cursor.close()
+
+
+def execute_binary_results(
+    cursor: Any, statement: str, parameters: Any, context: ExecutionContext
+) -> bool:
+    """Execute a statement with the `BINARY_RESULTS` option so its results are in binary format.
+
+    Used as `do_execute` event of engines with the psycopg driver.
+
+    :param cursor: DBAPI cursor to execute the statement with.
+    :param statement: The compiled statement.
+    :param parameters: Parameters of the statement.
+    :param context: Execution context with the execution options of the statement.
+    :return: True if the statement is executed, False to execute the statement as usual.
+    """
+    if not context.execution_options.get(BINARY_RESULTS):
+        return False
+    cursor.execute(statement, parameters, binary=True)
+    return True
+
+
 def initialize_db(application_name: str, config: PostgresConfig) -> Engine:
     """Initialize the database connection by creating the engine.
 
@@ -68,6 +262,23 @@ def initialize_db(application_name: str, config: PostgresConfig) -> Engine:
     :param application_name: Identifier for the connection to the SQL database.
     :param config: Configuration on how to connect to the SQL database.
     """
+    engine = create_db_engine(application_name, config)
+
+    # Bind the global session to the actual engine.
+    Session.configure(bind=engine)
+
+    return engine
+
+
+def create_db_engine(
+    application_name: str, config: PostgresConfig, **engine_options: Any
+) -> Engine:
+    """Create an engine with its own connection pool to the database.
+
+    :param application_name: Identifier for the connection to the SQL database.
+    :param config: Configuration on how to connect to the SQL database.
+    :param engine_options: Options passed to `create_engine` which override the defaults.
+    """
     logger.info(
         "Connecting to PostgresDB at %s:%s as user %s to db %s",
         config.host,
@@ -78,7 +289,7 @@ def initialize_db(application_name: str, config: PostgresConfig) -> Engine:
 
     try:
         url = URL.create(
-            "postgresql+psycopg2",
+            f"postgresql+{config.driver}",
             username=config.username,
             password=config.password,
             host=config.host,
@@ -86,22 +297,25 @@ def initialize_db(application_name: str, config: PostgresConfig) -> Engine:
             database=config.database,
         )
 
-        engine = create_engine(
-            url,
-            pool_size=20,
-            max_overflow=5,
+        options: dict[str, Any] = dict(
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
             echo=False,
             connect_args={
                 "application_name": application_name,
                 "options": "-c lock_timeout=30000 -c statement_timeout=300000",  # 5 minutes
             },
         )
+        if config.driver == "psycopg":
+            # Statements executed this many times on a connection are prepared on the server.
+            options["connect_args"]["prepare_threshold"] = config.prepare_threshold
+        options.update(engine_options)
+        engine = create_engine(url, **options)
+        if config.driver == "psycopg":
+            event.listen(engine, "do_execute", execute_binary_results)
     except Exception as e:
         logger.error(e)
 
-    # Bind the global session to the actual engine.
-    Session.configure(bind=engine)
-
     return engine
 
 
@@ -116,30 +330,87 @@ class PostgresInterface:
     """Configuration on how to connect to the database."""
     engine: Engine
     """Engine for starting connections to the database."""
+    read_engine: Engine
+    """Engine with a separate connection pool for read-only queries in autocommit mode."""
+    query_timer: QueryTimer
+    """Timing of the statements per method of this interface."""
+    job_changes_config: JobChangesConfig
+    """Configuration of the job changes feed."""
 
     def __init__(self, postgres_config: PostgresConfig) -> None:
         """Create the PostgreSQL interface."""
         self.db_config = postgres_config
+        self.query_timer = QueryTimer(QueryTimingConfig(), __file__)
+        self.job_changes_config = JobChangesConfig()
 
     def start(self) -> None:
         """Start the interface and connect to the database."""
         self.engine = initialize_db("omotes_rest", self.db_config)
+        self.read_engine = create_db_engine(
+            "omotes_rest_read",
+            self.db_config,
+            pool_size=self.db_config.read_pool_size,
+            isolation_level="AUTOCOMMIT",
+        )
+        self.query_timer.attach(self.engine)
+        self.query_timer.attach(self.read_engine)
+        self._check_server_version()
+
+    def _check_server_version(self) -> None:
+        """Warn if the version of PostgreSQL is older than the minimum supported version."""
+        try:
+            with self.engine.connect() as connection:
+                server_version = connection.dialect.server_version_info
+        except DBAPIError:
+            logger.warning("Could not connect to PostgresDB to check its version", exc_info=True)
+            return
+        if server_version is not None and server_version < MIN_SERVER_VERSION:
+            logger.warning(
+                "PostgreSQL %s is older than the minimum version %s, job progress updates are "
+                "no HOT updates and rewrite the job state and its indexes",
+                ".".join(map(str, server_version)),
+                ".".join(map(str, MIN_SERVER_VERSION)),
+            )
 
     def stop(self) -> None:
         """Stop the interface and dispose of any connections."""
         if self.engine:
             self.engine.dispose()
+        if self.read_engine:
+            self.read_engine.dispose()
+
+    @contextmanager
+    def read_scope(self) -> Generator[Connection, None, None]:
+        """Provide a connection for read-only queries.
 
-    def put_new_job(self, job_id: uuid.UUID, job_input: JobInput) -> None:
-        """Insert a new job into the database.
+        Compared to `session_scope` this skips the ORM session and identity map, and as the
+        connection is in autocommit mode no transaction is started or committed. Results are
+        returned as Core rows.
+
+        :return: A single SQL connection.
+        """
+        with self.read_engine.connect() as connection:
+            yield connection
+
+    def put_new_job(
+        self, job_id: uuid.UUID, job_input: JobInput, result_hash: str | None = None
+    ) -> None:
+        """Insert a new job and its job submission in the outbox into the database.
+
+        Both are inserted in a single transaction, the job submission is published to Omotes
+        afterwards by `relay_job_outbox`.
 
         Note: Assumption is that the job_id is unique and has not yet been added to the database.
 
-        :param job_id: Unique identifier of the job.
+        :param job_id: Unique identifier of the job. The registration time of the job is the time
+            encoded in the job id, if any.
         :param job_input: Received input for the job.
+        :param result_hash: Optional hash of the job input to find this job in the result cache.
         """
         if not job_input.job_priority:
             raise RuntimeError(f"Error: job priority is 'None' for job '{job_input.job_name}'.")
+        now = datetime.now()
+        registered_at = job_id_registered_at(job_id) or now
         with session_scope(do_expunge=False) as session:
             new_job = JobRest(
                 job_id=job_id,
@@ -149,28 +420,565 @@ class PostgresInterface:
                 status=JobRestStatus.REGISTERED,
                 progress_fraction=0,
                 progress_message="Job registered.",
-                registered_at=datetime.now(),
+                registered_at=registered_at,
                 timeout_after_s=job_input.timeout_after_s,
                 user_name=job_input.user_name,
                 project_name=job_input.project_name,
                 input_params_dict=job_input.input_params_dict,
                 input_esdl=job_input.input_esdl,
+                result_hash=result_hash,
             )
             session.add(new_job)
+            session.flush()
+            session.add(
+                JobOutbox(
+                    job_id=job_id,
+                    registered_at=registered_at,
+                    created_at=now,
+                    next_attempt_at=now,
+                    attempts=0,
+                )
+            )
         logger.debug("Job %s is submitted as new job in database", job_id)
 
+    def relay_job_outbox(
+        self, config: JobOutboxConfig, publish_job: Callable[[JobRest], None]
+    ) -> int:
+        """Publish a batch of job submissions from the outbox of which the next attempt is due.
+
+        The outbox entries are locked until the transaction is committed and entries locked by
+        another transaction are skipped, so multiple relays (e.g. one per worker) never publish
+        the same entry concurrently. Only the outbox rows are locked, and the submission columns
+        of the jobs are loaded one job at a time, so the input ESDLs of the whole batch are never
+        held in memory at once and the output ESDLs and logs are not loaded at all. An entry is
+        removed once its job is published. A failed attempt is retried with an exponential
+        backoff until the maximum number of attempts, after which the job is stopped with status
+        ERROR.
+
+        :param config: Configuration of the batch size and retries.
+        :param publish_job: Function publishing the job submission of a job to Omotes.
+        :return: Number of outbox entries in the batch, published or not.
+        """
+        with session_scope() as session:
+            stmnt = (
+                select(JobOutbox)
+                .where(JobOutbox.next_attempt_at <= datetime.now())
+                .order_by(JobOutbox.next_attempt_at)
+                .limit(config.batch_size)
+                .with_for_update(skip_locked=True)
+            )
+            batch = session.scalars(stmnt).all()
+            failed_jobs: list[tuple[uuid.UUID, str]] = []
+            for outbox_entry in batch:
+                job = session.scalar(
+                    select(JobRest)
+                    .options(load_only(*JOB_SUBMISSION_COLUMNS, raiseload=True))
+                    .where(
+                        JobRest.job_id == outbox_entry.job_id,
+                        JobRest.registered_at == outbox_entry.registered_at,
+                    )
+                )
+                if job is None:
+                    session.delete(outbox_entry)
+                    continue
+                # Publishing is at-least-once: the entry is only removed when the transaction is
+                # committed, after the whole batch is published. If the commit fails or the
+                # process stops before it, the entry is published again by the next relay with
+                # the same job id. The job submission is then received twice by Omotes, and the
+                # status updates and result of both are written to the same job.
+                try:
+                    publish_job(job)
+                except Exception as e:
+                    outbox_entry.attempts += 1
+                    outbox_entry.last_error = str(e)
+                    if outbox_entry.attempts >= config.max_attempts:
+                        logger.error(
+                            "Job %s could not be submitted after %s attempts: %s",
+                            job.job_id,
+                            outbox_entry.attempts,
+                            e,
+                        )
+                        session.delete(outbox_entry)
+                        failed_jobs.append(
+                            (job.job_id, f"Job could not be submitted to Omotes: {e}")
+                        )
+                    else:
+                        backoff_s = min(
+                            config.retry_backoff_s * 2 ** (outbox_entry.attempts - 1),
+                            config.max_retry_backoff_s,
+                        )
+                        logger.warning(
+                            "Job %s could not be submitted (attempt %s), retrying in %s s: %s",
+                            job.job_id,
+                            outbox_entry.attempts,
+                            backoff_s,
+                            e,
+                        )
+                        outbox_entry.next_attempt_at = datetime.now() + timedelta(seconds=backoff_s)
+                else:
+                    session.delete(outbox_entry)
+                session.expunge(job)
+            # Publishing the batch takes time, the failed jobs are stopped just before the commit
+            # so their update time is not older than the cursor of the job changes by then.
+            session.flush()
+            for job_id, logs in failed_jobs:
+                self._update_job_stopped(session, job_id, JobRestStatus.ERROR, {"logs": logs})
+        if batch:
+            logger.debug("Relayed a batch of %s jobs from the outbox", len(batch))
+        return len(batch)
+
+    def get_cached_result_job_id(
+        self, result_hash: str, stopped_after: datetime
+    ) -> uuid.UUID | None:
+        """Find the most recent succeeded job with the same input hash.
+
+        :param result_hash: Hash of the job input.
+        :param stopped_after: Only consider jobs which stopped after this time.
+        :return: Job id of the cached result if available.
+        """
+        logger.debug("Looking up cached result for hash '%s'", result_hash)
+        with self.read_scope() as connection:
+            stmnt = (
+                select(JobRest.job_id)
+                .where(
+                    JobRest.result_hash == result_hash,
+                    JobRest.status == JobRestStatus.SUCCEEDED,
+                    JobRest.stopped_at > stopped_after,
+                )
+                .order_by(JobRest.stopped_at.desc())
+                .limit(1)
+            )
+            cached_job_id: uuid.UUID | None = connection.scalar(stmnt)
+        return cached_job_id
+
+    def get_job_clone_source(self, job_id: uuid.UUID) -> JobInput | None:
+        """Retrieve the input of a job to clone, without its input ESDL.
+
+        :param job_id: Job id.
+        :return: Input of the job with an empty input ESDL, None if the job does not exist.
+        """
+        logger.debug("Retrieving job input to clone job with id '%s'", job_id)
+        with self.read_scope() as connection:
+            stmnt = select(
+                job_rest_table.c.job_name,
+                job_rest_table.c.workflow_type,
+                job_rest_table.c.user_name,
+                job_rest_table.c.project_name,
+                job_rest_table.c.input_params_dict,
+                job_rest_table.c.timeout_after_s,
+                job_rest_table.c.job_priority,
+            ).where(
+                job_rest_table.c.job_id == job_id,
+                *job_time_bounds([job_id], job_rest_table.c.registered_at),
+            )
+            row = connection.execute(stmnt).first()
+        if row is None:
+            return None
+        return JobInput(
+            job_name=row.job_name,
+            workflow_type=row.workflow_type,
+            user_name=row.user_name,
+            project_name=row.project_name,
+            input_esdl="",
+            input_params_dict=row.input_params_dict or {},
+            timeout_after_s=row.timeout_after_s,
+            job_priority=row.job_priority,
+        )
+
+    def get_stored_esdl_result_hashes(
+        self, job_id: uuid.UUID, result_hash_prefixes: list[bytes]
+    ) -> list[str]:
+        """Complete result hashes with the input ESDL of a job, without retrieving the ESDL.
+
+        The hashes are computed by the database in the same way as `compute_result_hash`.
+
+        :param job_id: Job id of which the input ESDL is hashed.
+        :param result_hash_prefixes: Encoded job input before the input ESDL per result hash, as
+            returned by `result_hash_prefix`.
+        :return: The result hash per prefix, empty if the job does not exist.
+        """
+        esdl = (
+            select(func.convert_to(job_rest_table.c.input_esdl, "UTF8").label("data"))
+            .where(
+                job_rest_table.c.job_id == job_id,
+                *job_time_bounds([job_id], job_rest_table.c.registered_at),
+            )
+            .subquery()
+        )
+        prefixes = (
+            func.unnest(literal(result_hash_prefixes, ARRAY(LargeBinary)))
+            .table_valued("prefix", with_ordinality="ordinality")
+            .render_derived()
+        )
+        esdl_length = func.int8send(cast(func.octet_length(esdl.c.data), BigInteger))
+        stmnt = (
+            select(
+                func.encode(
+                    func.sha256(prefixes.c.prefix.op("||")(esdl_length).op("||")(esdl.c.data)),
+                    "hex",
+                )
+            )
+            .select_from(esdl)
+            .join(prefixes, literal(True))
+            .order_by(prefixes.c.ordinality)
+        )
+        with self.read_scope() as connection:
+            return list(connection.scalars(stmnt))
+
+    def put_cloned_jobs(
+        self,
+        source_job_id: uuid.UUID,
+        clones: Sequence[tuple[uuid.UUID, JobInput, str | None]],
+    ) -> bool:
+        """Insert new jobs with the input ESDL of an existing job, and their job submissions.
+
+        The input ESDL is copied within the database, so it never passes through this service.
+        All jobs and job submissions are inserted in a single transaction.
+
+        :param source_job_id: Job id of the job of which the input ESDL is reused.
+        :param clones: Job id, input and optional result hash per new job. The input ESDL of the
+            job input is ignored.
+        :return: True if the jobs were inserted or False if the source job does not exist.
+        """
+        now = datetime.now()
+        source = job_rest_table.c
+        rows = []
+        for job_id, job_input, result_hash in clones:
+            if not job_input.job_priority:
+                raise RuntimeError(f"Error: job priority is 'None' for job '{job_input.job_name}'.")
+            rows.append(
+                dict(
+                    new_job_id=job_id,
+                    new_job_name=job_input.job_name,
+                    new_workflow_type=job_input.workflow_type,
+                    new_job_priority=job_input.job_priority,
+                    new_registered_at=job_id_registered_at(job_id) or now,
+                    new_timeout_after_s=job_input.timeout_after_s,
+                    new_user_name=job_input.user_name,
+                    new_project_name=job_input.project_name,
+                    new_input_params_dict=job_input.input_params_dict,
+                    new_result_hash=result_hash,
+                )
+            )
+        source_bounds = job_time_bounds([source_job_id], source.registered_at)
+        with session_scope() as session:
+            # Lock the source job, so it is not deleted before its input ESDL is copied.
+            source_exists = session.execute(
+                select(source.job_id)
+                .where(source.job_id == source_job_id, *source_bounds)
+                .with_for_update(key_share=True)
+            ).first()
+            if source_exists is None:
+                return False
+            session.execute(
+                insert(job_rest_table).from_select(
+                    [
+                        source.job_id,
+                        source.job_name,
+                        source.workflow_type,
+                        source.job_priority,
+                        source.registered_at,
+                        source.timeout_after_s,
+                        source.user_name,
+                        source.project_name,
+                        source.input_params_dict,
+                        source.input_esdl,
+                        source.result_hash,
+                    ],
+                    select(
+                        bindparam("new_job_id", type_=source.job_id.type),
+                        bindparam("new_job_name", type_=source.job_name.type),
+                        bindparam("new_workflow_type", type_=source.workflow_type.type),
+                        bindparam("new_job_priority", type_=source.job_priority.type),
+                        bindparam("new_registered_at", type_=source.registered_at.type),
+                        bindparam("new_timeout_after_s", type_=source.timeout_after_s.type),
+                        bindparam("new_user_name", type_=source.user_name.type),
+                        bindparam("new_project_name", type_=source.project_name.type),
+                        bindparam("new_input_params_dict", type_=source.input_params_dict.type),
+                        source.input_esdl,
+                        bindparam("new_result_hash", type_=source.result_hash.type),
+                    ).where(source.job_id == source_job_id, *source_bounds),
+                ),
+                rows,
+            )
+            session.execute(
+                insert(job_state_table),
+                [
+                    dict(
+                        job_id=row["new_job_id"],
+                        registered_at=row["new_registered_at"],
+                        status=JobRestStatus.REGISTERED,
+                        progress_fraction=0,
+                        progress_message="Job registered.",
+                    )
+                    for row in rows
+                ],
+            )
+            session.execute(
+                insert(JobOutbox),
+                [
+                    dict(
+                        job_id=row["new_job_id"],
+                        registered_at=row["new_registered_at"],
+                        created_at=now,
+                        next_attempt_at=now,
+                        attempts=0,
+                    )
+                    for row in rows
+                ],
+            )
+        logger.debug("Jobs cloned from job %s are submitted in database", source_job_id)
+        return True
+
+    def put_new_cached_job(
+        self, job_id: uuid.UUID, job_input: JobInput, cached_job_id: uuid.UUID
+    ) -> bool:
+        """Insert a new, already succeeded, job which reuses the result of a cached job.
+
+        The input ESDL, output ESDL, logs and ESDL feedback are copied within the database so the
+        (large) result never passes through this service. The input ESDL of the cached job is
+        identical, as the result hash of both jobs is the same. The result is copied rather than
+        read through `cached_from_job_id`, as the cached job may be deleted or its partition
+        detached while the new job is still kept.
+
+        :param job_id: Unique identifier of the new job. The registration time of the job is the
+            time encoded in the job id, if any.
+        :param job_input: Received input for the job.
+        :param cached_job_id: Job id of the succeeded job of which the result is reused.
+        :return: True if the job was inserted or False if the cached job no longer exists.
+        """
+        if not job_input.job_priority:
+            raise RuntimeError(f"Error: job priority is 'None' for job '{job_input.job_name}'.")
+        now = datetime.now()
+        registered_at = job_id_registered_at(job_id) or now
+        cached_job = job_rest_table.c
+        with session_scope() as session:
+            stmnt = insert(job_rest_table).from_select(
+                [
+                    cached_job.job_id,
+                    cached_job.job_name,
+                    cached_job.workflow_type,
+                    cached_job.job_priority,
+                    cached_job.registered_at,
+                    cached_job.timeout_after_s,
+                    cached_job.user_name,
+                    cached_job.project_name,
+                    cached_job.input_params_dict,
+                    cached_job.input_esdl,
+                    cached_job.output_esdl,
+                    cached_job.logs,
+                    cached_job.esdl_feedback,
+                    cached_job.cached_from_job_id,
+                ],
+                select(
+                    literal(job_id, cached_job.job_id.type),
+                    literal(job_input.job_name),
+                    literal(job_input.workflow_type),
+                    literal(job_input.job_priority),
+                    literal(registered_at, cached_job.registered_at.type),
+                    literal(job_input.timeout_after_s),
+                    literal(job_input.user_name),
+                    literal(job_input.project_name),
+                    literal(job_input.input_params_dict, cached_job.input_params_dict.type),
+                    cached_job.input_esdl,
+                    cached_job.output_esdl,
+                    cached_job.logs,
+                    cached_job.esdl_feedback,
+                    cached_job.job_id,
+                ).where(
+                    cached_job.job_id == cached_job_id,
+                    *job_time_bounds([cached_job_id], cached_job.registered_at),
+                ),
+            )
+            job_inserted = session.execute(stmnt).rowcount > 0
+            if job_inserted:
+                session.execute(
+                    insert(JobState).values(
+                        job_id=job_id,
+                        registered_at=registered_at,
+                        status=JobRestStatus.SUCCEEDED,
+                        progress_fraction=1.0,
+                        progress_message=f"Job result reused from job {cached_job_id}.",
+                        submitted_at=now,
+                        running_at=now,
+                        stopped_at=now,
+                    )
+                )
+        logger.debug(
+            "Job %s is submitted as cached job of job %s in database: %s",
+            job_id,
+            cached_job_id,
+            job_inserted,
+        )
+        return job_inserted
+
+    def evict_result_cache(self, stopped_before: datetime) -> int:
+        """Remove stopped jobs from the result cache if they are expired or did not succeed.
+
+        :param stopped_before: Succeeded jobs which stopped before this time are expired.
+        :return: Number of jobs removed from the result cache.
+        """
+        with session_scope() as session:
+            stmnt = (
+                update(job_rest_table)
+                .where(
+                    job_rest_table.c.job_id == JobState.job_id,
+                    job_rest_table.c.registered_at == JobState.registered_at,
+                    job_rest_table.c.result_hash.is_not(None),
+                    JobState.stopped_at.is_not(None),
+                    or_(
+                        JobState.status != JobRestStatus.SUCCEEDED,
+                        JobState.stopped_at <= stopped_before,
+                    ),
+                )
+                .values(result_hash=None)
+            )
+            evicted = session.execute(stmnt).rowcount
+        logger.debug("Evicted %s jobs from the result cache", evicted)
+        return evicted
+
+    def _job_partitions(self, session: SQLSession) -> list[tuple[str, str]]:
+        """List the partitions of the partitioned job tables.
+
+        :param session: Session in which to query the catalog.
+        :return: The name of the partitioned table and of the partition for each partition.
+        """
+        stmnt = text(
+            "SELECT parent.relname, child.relname FROM pg_inherits "
+            "JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.oid = ANY(ARRAY[to_regclass('job_rest'), to_regclass('job_state')])"
+        )
+        return [(table, partition) for table, partition in session.execute(stmnt)]
+
+    def create_job_partitions(self, first_month: datetime, last_month: datetime) -> list[str]:
+        """Create the monthly partitions of the job tables which do not exist yet.
+
+        Each partition is created in a savepoint, so a partition which cannot be created, e.g.
+        because jobs of its month are already in the default partition, is logged and skipped.
+        Concurrent calls, e.g. from multiple workers, wait for each other.
+
+        :param first_month: A moment in the first month to create partitions for.
+        :param last_month: A moment in the last month to create partitions for.
+        :return: Names of the created partitions.
+        """
+        if self.engine.dialect.name != "postgresql":
+            return []
+        created: list[str] = []
+        with session_scope() as session:
+            session.execute(select(func.pg_advisory_xact_lock(JOB_PARTITIONS_LOCK_ID)))
+            existing = {partition for _, partition in self._job_partitions(session)}
+            month = month_start(first_month)
+            while month <= month_start(last_month):
+                for table in PARTITIONED_JOB_TABLES:
+                    name = partition_name(table, month)
+                    if name in existing:
+                        continue
+                    storage_parameters = (
+                        f" WITH (fillfactor = {JOB_STATE_FILLFACTOR})"
+                        if table == job_state_table.name
+                        else ""
+                    )
+                    try:
+                        with session.begin_nested():
+                            session.execute(
+                                text(
+                                    f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES "
+                                    f"FROM ('{month.isoformat()}') "
+                                    f"TO ('{add_months(month, 1).isoformat()}')"
+                                    f"{storage_parameters}"
+                                )
+                            )
+                    except DBAPIError as e:
+                        logger.error("Could not create job partition %s: %s", name, e.orig)
+                    else:
+                        created.append(name)
+                month = add_months(month, 1)
+        if created:
+            logger.info("Created job partitions %s", ", ".join(created))
+        return created
+
+    def detach_job_partitions(self, before: datetime, drop: bool = False) -> list[str]:
+        """Detach the monthly partitions of the job tables of the months which ended before a time.
+
+        This removes the jobs of those months without deleting them row by row. A detached
+        partition remains as a separate table, e.g. to archive it, unless it is dropped. Detaching
+        briefly locks the job tables. A month with a job that is still in the outbox is logged and
+        skipped.
+
+        :param before: Partitions of months which ended at or before this time are detached.
+        :param drop: Drop the partitions after detaching them.
+        :return: Names of the detached partitions.
+        """
+        if self.engine.dialect.name != "postgresql":
+            return []
+        before = before.astimezone(timezone.utc)
+        partitions_per_month: dict[datetime, dict[str, str]] = {}
+        detached: list[str] = []
+        with session_scope() as session:
+            session.execute(select(func.pg_advisory_xact_lock(JOB_PARTITIONS_LOCK_ID)))
+            for table, partition in self._job_partitions(session):
+                parsed = parse_partition_name(partition)
+                if parsed and parsed[1] and add_months(parsed[1], 1) <= before:
+                    partitions_per_month.setdefault(parsed[1], {})[table] = partition
+
+            for month, partitions in sorted(partitions_per_month.items()):
+                # The job_state partition references the job_rest partition, so it is detached
+                # first and its foreign key to the job_rest table is removed.
+                month_partitions = [
+                    (table, partitions[table])
+                    for table in reversed(PARTITIONED_JOB_TABLES)
+                    if table in partitions
+                ]
+                try:
+                    with session.begin_nested():
+                        for table, partition in month_partitions:
+                            session.execute(
+                                text(f"ALTER TABLE {table} DETACH PARTITION {partition}")
+                            )
+                            foreign_keys = session.scalars(
+                                text(
+                                    "SELECT conname FROM pg_constraint "
+                                    "WHERE conrelid = to_regclass(:partition) AND contype = 'f'"
+                                ),
+                                {"partition": partition},
+                            ).all()
+                            for foreign_key in foreign_keys:
+                                session.execute(
+                                    text(f'ALTER TABLE {partition} DROP CONSTRAINT "{foreign_key}"')
+                                )
+                        if drop:
+                            for _, partition in month_partitions:
+                                session.execute(text(f"DROP TABLE {partition}"))
+                except DBAPIError as e:
+                    logger.error(
+                        "Could not detach job partitions of %s: %s", f"{month:%Y-%m}", e.orig
+                    )
+                else:
+                    detached.extend(partition for _, partition in month_partitions)
+        if detached:
+            logger.info(
+                "%s job partitions %s", "Dropped" if drop else "Detached", ", ".join(detached)
+            )
+        return detached
+
     def set_job_registered(self, job_id: uuid.UUID) -> None:
         """Set the status of the job to 'REGISTERED'.
 
+        The registration time is set when the job is inserted and is not changed.
+
         :param job_id: Job id.
         """
         logger.debug("For job '%s' received new status REGISTERED")
 
         with session_scope() as session:
             stmnt = (
-                update(JobRest)
-                .where(JobRest.job_id == job_id)
-                .values(status=JobRestStatus.REGISTERED, registered_at=datetime.now())
+                update(JobState)
+                .where(
+                    JobState.job_id == job_id,
+                    *job_time_bounds([job_id], job_state_table.c.registered_at),
+                )
+                .values(status=JobRestStatus.REGISTERED, updated_at=func.clock_timestamp())
             )
             session.execute(stmnt)
 
@@ -183,9 +991,16 @@ class PostgresInterface:
 
         with session_scope() as session:
             stmnt = (
-                update(JobRest)
-                .where(JobRest.job_id == job_id)
-                .values(status=JobRestStatus.ENQUEUED, submitted_at=datetime.now())
+                update(JobState)
+                .where(
+                    JobState.job_id == job_id,
+                    *job_time_bounds([job_id], job_state_table.c.registered_at),
+                )
+                .values(
+                    status=JobRestStatus.ENQUEUED,
+                    submitted_at=datetime.now(),
+                    updated_at=func.clock_timestamp(),
+                )
             )
             session.execute(stmnt)
 
@@ -198,9 +1013,16 @@ class PostgresInterface:
 
         with session_scope() as session:
             stmnt = (
-                update(JobRest)
-                .where(JobRest.job_id == job_id)
-                .values(status=JobRestStatus.RUNNING, running_at=datetime.now())
+                update(JobState)
+                .where(
+                    JobState.job_id == job_id,
+                    *job_time_bounds([job_id], job_state_table.c.registered_at),
+                )
+                .values(
+                    status=JobRestStatus.RUNNING,
+                    running_at=datetime.now(),
+                    updated_at=func.clock_timestamp(),
+                )
             )
             session.execute(stmnt)
 
@@ -222,19 +1044,91 @@ class PostgresInterface:
         """
         logger.debug("For job '%s' received new status '%s'", job_id, new_status)
 
+        with session_scope() as session, pipeline_scope(session):
+            self._update_job_stopped(
+                session,
+                job_id,
+                new_status,
+                dict(logs=logs, output_esdl=output_esdl, esdl_feedback=esdl_feedback),
+            )
+
+    def set_job_stopped_with_result_file(
+        self,
+        job_id: uuid.UUID,
+        new_status: JobRestStatus,
+        result_file: BinaryIO,
+        esdl_feedback: dict[str, list] | None = None,
+    ) -> None:
+        """Set the job to stopped with supplied status and a large result spilled to a file.
+
+        The output ESDL and logs are streamed from the file into a temporary table with COPY, a
+        chunk at a time, and copied to the job within the database. The result is never held in
+        memory as a whole by this service, unlike the statement parameters of `set_job_stopped`.
+
+        :param job_id: Job id.
+        :param new_status: JobRestStatus.
+        :param result_file: Binary file with the output ESDL and logs, as written by
+            `spill_job_result`.
+        :param esdl_feedback: optional esdl feedback messages per esdl object id.
+        """
+        logger.debug("For job '%s' received new status '%s' with large result", job_id, new_status)
+
         with session_scope() as session:
-            stmnt = (
-                update(JobRest)
-                .where(JobRest.job_id == job_id)
-                .values(
-                    status=new_status,
-                    stopped_at=datetime.now(),
-                    logs=logs,
-                    output_esdl=output_esdl,
-                    esdl_feedback=esdl_feedback,
+            session.execute(
+                text(
+                    f"CREATE TEMPORARY TABLE {job_result_upload.name}"
+                    f" (output_esdl text, logs text) ON COMMIT DROP"
                 )
             )
-            session.execute(stmnt)
+            copy_from_file(
+                session,
+                f"COPY {job_result_upload.name} (output_esdl, logs) FROM STDIN",
+                result_file,
+                RESULT_COPY_CHUNK_SIZE,
+            )
+            self._update_job_stopped(
+                session,
+                job_id,
+                new_status,
+                dict(
+                    logs=select(job_result_upload.c.logs).scalar_subquery(),
+                    output_esdl=select(job_result_upload.c.output_esdl).scalar_subquery(),
+                    esdl_feedback=esdl_feedback,
+                ),
+            )
+
+    @staticmethod
+    def _update_job_stopped(
+        session: SQLSession, job_id: uuid.UUID, new_status: JobRestStatus, result: dict[str, Any]
+    ) -> None:
+        """Store the result of a stopped job and then update its state.
+
+        The update time of the job is the time of the database when its state is updated, rather
+        than the start of the transaction, so storing a large result does not make the update
+        older than the cursor of the job changes by the time it is committed. It must therefore
+        be the last statement of the transaction.
+
+        :param session: Session in which the job is updated.
+        :param job_id: Job id.
+        :param new_status: JobRestStatus.
+        :param result: Values of the result columns of the job.
+        """
+        session.execute(
+            update(job_rest_table)
+            .where(
+                job_rest_table.c.job_id == job_id,
+                *job_time_bounds([job_id], job_rest_table.c.registered_at),
+            )
+            .values(**result)
+        )
+        session.execute(
+            update(job_state_table)
+            .where(
+                job_state_table.c.job_id == job_id,
+                *job_time_bounds([job_id], job_state_table.c.registered_at),
+            )
+            .values(status=new_status, stopped_at=datetime.now(), updated_at=func.clock_timestamp())
+        )
 
     def set_job_progress(
         self, job_id: uuid.UUID, progress_fraction: float, progress_message: str
@@ -253,12 +1147,43 @@ class PostgresInterface:
         )
         with session_scope() as session:
             stmnt = (
-                update(JobRest)
-                .where(JobRest.job_id == job_id)
-                .values(progress_fraction=progress_fraction, progress_message=progress_message)
+                update(JobState)
+                .where(
+                    JobState.job_id == job_id,
+                    *job_time_bounds([job_id], job_state_table.c.registered_at),
+                )
+                .values(
+                    progress_fraction=progress_fraction,
+                    progress_message=progress_message,
+                    updated_at=func.clock_timestamp(),
+                )
             )
             session.execute(stmnt)
 
+    def set_jobs_progress(self, jobs_progress: dict[uuid.UUID, tuple[float, str]]) -> None:
+        """Set the progress of many jobs at once.
+
+        The progress of each job is updated with a separate statement, all statements are sent in
+        pipeline mode and committed in a single transaction.
+
+        :param jobs_progress: New progress fraction and progress message per job id.
+        """
+        logger.debug("Received new progress for %s jobs", len(jobs_progress))
+        with session_scope() as session, pipeline_scope(session):
+            for job_id, (progress_fraction, progress_message) in jobs_progress.items():
+                session.execute(
+                    update(job_state_table)
+                    .where(
+                        job_state_table.c.job_id == job_id,
+                        *job_time_bounds([job_id], job_state_table.c.registered_at),
+                    )
+                    .values(
+                        progress_fraction=progress_fraction,
+                        progress_message=progress_message,
+                        updated_at=func.clock_timestamp(),
+                    )
+                )
+
     def get_job_status(self, job_id: uuid.UUID) -> JobRestStatus | None:
         """Retrieve the current job status.
 
@@ -266,11 +1191,35 @@ class PostgresInterface:
         :return: Current job status.
         """
         logger.debug("Retrieving job status for job with id '%s'", job_id)
-        with session_scope(do_expunge=True) as session:
-            stmnt = select(JobRest.status).where(JobRest.job_id == job_id)
-            job_status = session.scalar(stmnt)
+        with self.read_scope() as connection:
+            stmnt = select(JobState.status).where(
+                JobState.job_id == job_id,
+                *job_time_bounds([job_id], job_state_table.c.registered_at),
+            )
+            job_status = connection.scalar(stmnt)
         return job_status
 
+    def get_job_statuses(self, job_ids: list[uuid.UUID]) -> list[JobStatusProgress]:
+        """Retrieve the current status and progress of multiple jobs in a single query.
+
+        :param job_ids: Job ids.
+        :return: Status and progress of the jobs that are available in the database.
+        """
+        logger.debug("Retrieving job status for %s jobs", len(job_ids))
+        with self.read_scope() as connection:
+            stmnt = select(
+                JobState.job_id,
+                JobState.status,
+                JobState.progress_fraction,
+                JobState.progress_message,
+            ).where(
+                JobState.job_id
+                == any_(bindparam("job_ids", job_ids, type_=ARRAY(UUID(as_uuid=True)))),
+                *job_time_bounds(job_ids, job_state_table.c.registered_at),
+            )
+            job_statuses = [JobStatusProgress(*row) for row in connection.execute(stmnt)]
+        return job_statuses
+
     def get_job(self, job_id: uuid.UUID) -> JobRest | None:
         """Retrieve the job info from the database.
 
@@ -279,13 +1228,21 @@ class PostgresInterface:
         """
         logger.debug("Retrieving job data for job with id '%s'", job_id)
         with session_scope(do_expunge=True) as session:
-            stmnt = select(JobRest).where(JobRest.job_id == job_id)
+            stmnt = select(JobRest).where(
+                JobRest.job_id == job_id,
+                *job_time_bounds(
+                    [job_id], job_rest_table.c.registered_at, job_state_table.c.registered_at
+                ),
+            )
             job = session.scalar(stmnt)
         return job
 
     def delete_job(self, job_id: uuid.UUID) -> bool:
         """Remove the job from the database.
 
+        A tombstone of the job is kept to include the deletion in the job changes, and expired
+        tombstones are removed.
+
         :param job_id: Job id.
         :return: True if the job was removed or False if the job was not in the database.
         """
@@ -294,34 +1251,207 @@ class PostgresInterface:
         job_to_delete = self.get_job(job_id)
         with session_scope() as session:
             if job_to_delete:
-                stmnt = delete(JobRest).where(JobRest.job_id == job_id)
+                # The job state and outbox entry are deleted by the foreign key cascade.
+                stmnt = delete(job_rest_table).where(
+                    job_rest_table.c.job_id == job_id,
+                    *job_time_bounds([job_id], job_rest_table.c.registered_at),
+                )
                 session.execute(stmnt)
+                session.execute(
+                    delete(JobTombstone).where(
+                        JobTombstone.deleted_at
+                        < datetime.now(timezone.utc)
+                        - timedelta(seconds=self.job_changes_config.tombstone_retention_s)
+                    )
+                )
+                # Inserted last, so the deletion time is just before the commit.
+                session.add(
+                    JobTombstone(
+                        job_id=job_id,
+                        user_name=job_to_delete.user_name,
+                        project_name=job_to_delete.project_name,
+                        deleted_at=func.clock_timestamp(),
+                    )
+                )
                 job_deleted = True
             else:
                 job_deleted = False
 
         return job_deleted
 
-    def get_jobs(self, job_ids: list[uuid.UUID] | None = None) -> list[JobRest]:
+    def get_jobs(self, job_ids: list[uuid.UUID] | None = None) -> list[JobSummaryRecord]:
         """Retrieve a list of the jobs.
 
         :param job_ids: Optional list of uuid's to select specific jobs, default is all jobs.
         :return: List of jobs.
         """
-        with session_scope(do_expunge=True) as session:
+        with self.read_scope() as connection:
             stmnt = SELECT_JOB_SUMMARY_STMT
             if job_ids:
                 logger.debug(
                     f"Retrieving job data for jobs "
                     f"'{','.join([str(job_id) for job_id in job_ids])}'"
                 )
-                stmnt = stmnt.where(JobRest.job_id.in_(job_ids))
+                stmnt = stmnt.where(
+                    JobRest.job_id.in_(job_ids),
+                    *job_time_bounds(
+                        job_ids, job_rest_table.c.registered_at, job_state_table.c.registered_at
+                    ),
+                )
             else:
                 logger.debug("Retrieving job data for all jobs")
 
-            jobs = list(session.scalars(stmnt).all())
+            jobs = list(map(JobSummaryRecord._make, connection.execute(stmnt)))
         return jobs
 
+    def get_job_changes(
+        self,
+        since: int | None = None,
+        user_name: str | None = None,
+        project_name: str | None = None,
+    ) -> JobChanges:
+        """Retrieve the jobs created, updated or deleted since a change cursor.
+
+        The update time of a job is set by the last statement of its transaction, so it is just
+        before the commit. The returned cursor lags the time of the database by the settle time,
+        so the changes of transactions which are not yet committed are retrieved with the next
+        changes. Changes
+        after the returned cursor may be retrieved again with the next changes.
+
+        :param since: Cursor returned with earlier changes, None to retrieve all jobs.
+        :param user_name: Only retrieve the changes of the jobs of this user.
+        :param project_name: Only retrieve the changes of the jobs of this project.
+        :return: The changed jobs, the deleted job ids and the cursor for the next changes.
+        :raises ExpiredChangeCursorException: If the cursor is older than the retention of the
+            tombstones of deleted jobs.
+        """
+        logger.debug(
+            "Retrieving job changes since %s for user %s and project %s",
+            since,
+            user_name,
+            project_name,
+        )
+        config = self.job_changes_config
+        with self.read_scope() as connection:
+            now: datetime = connection.execute(select(func.now())).scalar_one()
+            cursor = change_cursor(now - timedelta(seconds=config.settle_s))
+
+            job_stmnt = SELECT_JOB_SUMMARY_STMT
+            tombstone_stmnt = select(JobTombstone.job_id)
+            if user_name is not None:
+                job_stmnt = job_stmnt.where(JobRest.user_name == user_name)
+                tombstone_stmnt = tombstone_stmnt.where(JobTombstone.user_name == user_name)
+            if project_name is not None:
+                job_stmnt = job_stmnt.where(JobRest.project_name == project_name)
+                tombstone_stmnt = tombstone_stmnt.where(JobTombstone.project_name == project_name)
+
+            deleted_job_ids: list[uuid.UUID] = []
+            if since is not None:
+                if since < change_cursor(now - timedelta(seconds=config.tombstone_retention_s)):
+                    raise ExpiredChangeCursorException(
+                        f"Change cursor {since} is expired, retrieve all jobs again."
+                    )
+                cursor = max(cursor, since)
+                since_time = change_cursor_time(since)
+                job_stmnt = job_stmnt.where(job_state_table.c.updated_at > since_time)
+                deleted_job_ids = list(
+                    connection.scalars(tombstone_stmnt.where(JobTombstone.deleted_at > since_time))
+                )
+            jobs = list(map(JobSummaryRecord._make, connection.execute(job_stmnt)))
+        return JobChanges(jobs, deleted_job_ids, cursor)
+
+    def get_job_version(self, job_id: uuid.UUID) -> JobVersion | None:
+        """Retrieve the version of a job, only reading the narrow job state.
+
+        :param job_id: Job id.
+        :return: Version of the job, None if the job does not exist.
+        """
+        logger.debug("Retrieving job version for job with id '%s'", job_id)
+        with self.read_scope() as connection:
+            stmnt = select(job_state_table.c.updated_at).where(
+                job_state_table.c.job_id == job_id,
+                *job_time_bounds([job_id], job_state_table.c.registered_at),
+            )
+            updated_at: datetime | None = connection.scalar(stmnt)
+        if updated_at is None:
+            return None
+        return JobVersion(str(change_cursor(updated_at)), updated_at)
+
+    def get_jobs_version(
+        self, user_name: str | None = None, project_name: str | None = None
+    ) -> JobVersion:
+        """Retrieve the version of a list of jobs, without retrieving the jobs themselves.
+
+        The version combines the number of jobs with the sum of their update times. Unlike the
+        latest update time, the sum also changes when a transaction which started earlier
+        commits an update later, or when a job is deleted. For that reason the version of a list
+        has no moment of the last change, which would miss these changes.
+
+        :param user_name: Only the jobs of this user.
+        :param project_name: Only the jobs of this project.
+        :return: Version of the list of jobs.
+        """
+        logger.debug("Retrieving jobs version for user %s and project %s", user_name, project_name)
+        with self.read_scope() as connection:
+            stmnt = select(
+                func.count(),
+                func.sum(
+                    cast(extract("epoch", job_state_table.c.updated_at) * 1_000_000, BigInteger)
+                ),
+            )
+            if user_name is None and project_name is None:
+                stmnt = stmnt.select_from(job_state_table)
+            else:
+                stmnt = stmnt.select_from(JobRest)
+            if user_name is not None:
+                stmnt = stmnt.where(JobRest.user_name == user_name)
+            if project_name is not None:
+                stmnt = stmnt.where(JobRest.project_name == project_name)
+            job_count, updated_at_sum = connection.execute(stmnt).one()
+        return JobVersion(f"{job_count}-{updated_at_sum or 0}", None)
+
+    def get_job_export_chunks(
+        self, query: JobExportQuery, columns: Sequence[str], chunk_size: int
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """Retrieve the jobs to export in chunks, through a server-side cursor.
+
+        Only a single chunk of jobs is held in memory at a time. The connection is held until the
+        iterator is exhausted or closed.
+
+        :param query: Filters on the jobs to export.
+        :param columns: Names of the `JobRest` attributes to retrieve.
+        :param chunk_size: Number of jobs per chunk.
+        :return: Iterator over the chunks of rows with the columns, ordered by registration time.
+        """
+        logger.debug("Retrieving jobs to export for %s", query)
+        stmnt = select(*(getattr(JobRest, column) for column in columns)).order_by(
+            JobRest.registered_at
+        )
+        if query.user_name is not None:
+            stmnt = stmnt.where(JobRest.user_name == query.user_name)
+        if query.project_name is not None:
+            stmnt = stmnt.where(JobRest.project_name == query.project_name)
+        if query.workflow_type is not None:
+            stmnt = stmnt.where(JobRest.workflow_type == query.workflow_type)
+        if query.status is not None:
+            stmnt = stmnt.where(JobRest.status == query.status)
+        # The bounds on both registered_at columns prune the partitions of both tables.
+        if query.registered_after is not None:
+            stmnt = stmnt.where(
+                job_rest_table.c.registered_at >= query.registered_after,
+                job_state_table.c.registered_at >= query.registered_after,
+            )
+        if query.registered_before is not None:
+            stmnt = stmnt.where(
+                job_rest_table.c.registered_at < query.registered_before,
+                job_state_table.c.registered_at < query.registered_before,
+            )
+
+        # A server-side cursor needs a transaction, so the autocommit read engine is not used.
+        with self.engine.connect() as connection:
+            result = connection.execution_options(stream_results=True).execute(stmnt)
+            yield from result.partitions(chunk_size)
+
     def get_job_output_esdl(self, job_id: uuid.UUID) -> str | None:
         """Retrieve the output ESDL of a job.
 
@@ -329,9 +1459,16 @@ class PostgresInterface:
         :return: Output ESDL as a base64 string.
         """
         logger.debug("Retrieving job output esdl for job with id '%s'", job_id)
-        with session_scope() as session:
-            stmnt = select(JobRest.output_esdl).where(JobRest.job_id == job_id)
-            job_output_esdl: str | None = session.scalar(stmnt)
+        with self.read_scope() as connection:
+            stmnt = (
+                select(job_rest_table.c.output_esdl)
+                .where(
+                    job_rest_table.c.job_id == job_id,
+                    *job_time_bounds([job_id], job_rest_table.c.registered_at),
+                )
+                .execution_options(**{BINARY_RESULTS: True})
+            )
+            job_output_esdl: str | None = connection.scalar(stmnt)
         return job_output_esdl
 
     def get_job_logs(self, job_id: uuid.UUID) -> str | None:
@@ -341,31 +1478,90 @@ class PostgresInterface:
         :return: Job logs as a string.
         """
         logger.debug("Retrieving job log for job with id '%s'", job_id)
-        with session_scope() as session:
-            stmnt = select(JobRest.logs).where(JobRest.job_id == job_id)
-            job_logs: str | None = session.scalar(stmnt)
+        with self.read_scope() as connection:
+            stmnt = (
+                select(job_rest_table.c.logs)
+                .where(
+                    job_rest_table.c.job_id == job_id,
+                    *job_time_bounds([job_id], job_rest_table.c.registered_at),
+                )
+                .execution_options(**{BINARY_RESULTS: True})
+            )
+            job_logs: str | None = connection.scalar(stmnt)
         return job_logs
 
-    def get_jobs_from_user(self, user_name: str) -> list[JobRest]:
+    def get_jobs_from_user(self, user_name: str) -> list[JobSummaryRecord]:
         """Retrieve a list of the jobs from a specific user.
 
         :param user_name: Name of the user.
         :return: List of jobs.
         """
         logger.debug(f"Retrieving job data for jobs from user '{user_name}'")
-        with session_scope(do_expunge=True) as session:
+        with self.read_scope() as connection:
             stmnt = SELECT_JOB_SUMMARY_STMT.where(JobRest.user_name == user_name)
-            jobs = list(session.scalars(stmnt).all())
+            jobs = list(map(JobSummaryRecord._make, connection.execute(stmnt)))
         return jobs
 
-    def get_jobs_from_project(self, project_name: str) -> list[JobRest]:
+    def get_jobs_from_project(self, project_name: str) -> list[JobSummaryRecord]:
         """Retrieve a list of the jobs from a specific project.
 
         :param project_name: Name of the project.
         :return: List of jobs.
         """
         logger.debug(f"Retrieving job data for jobs from project '{project_name}'")
-        with session_scope(do_expunge=True) as session:
+        with self.read_scope() as connection:
             stmnt = SELECT_JOB_SUMMARY_STMT.where(JobRest.project_name == project_name)
-            jobs = list(session.scalars(stmnt).all())
+            jobs = list(map(JobSummaryRecord._make, connection.execute(stmnt)))
         return jobs
+
+    def get_job_stats(self) -> JobStatsResponse:
+        """Aggregate job statistics in a single query using grouping sets.
+
+        :return: Job counts per status, workflow type, user and project and the percentiles of
+            the queue wait and run time.
+        """
+        logger.debug("Retrieving job statistics")
+        percentiles: array[float] = array(JOB_STATS_PERCENTILES)
+        queue_wait = func.extract("epoch", JobRest.running_at - JobRest.submitted_at)
+        run_time = func.extract("epoch", JobRest.stopped_at - JobRest.running_at)
+        grouped_columns = (
+            JobRest.status,
+            JobRest.workflow_type,
+            JobRest.user_name,
+            JobRest.project_name,
+        )
+        with self.read_scope() as connection:
+            stmnt = select(
+                func.grouping(*grouped_columns),
+                *grouped_columns,
+                func.count(),
+                func.percentile_cont(percentiles).within_group(queue_wait).cast(ARRAY(Float)),
+                func.percentile_cont(percentiles).within_group(run_time).cast(ARRAY(Float)),
+            ).group_by(func.grouping_sets(*grouped_columns, tuple_()))
+            rows = connection.execute(stmnt).all()
+
+        job_stats = JobStatsResponse(
+            total_jobs=0,
+            jobs_per_status={},
+            jobs_per_workflow_type={},
+            jobs_per_user={},
+            jobs_per_project={},
+            queue_wait_s=DurationPercentiles(p50=None, p90=None, p99=None),
+            run_time_s=DurationPercentiles(p50=None, p90=None, p99=None),
+        )
+        # The grouping bitmask has a bit set for each grouped column that is not in the set,
+        # with the first column as the most significant bit.
+        for grouping, status, workflow_type, user_name, project_name, count, wait, run in rows:
+            if grouping == 0b0111:
+                job_stats.jobs_per_status[status.name] = count
+            elif grouping == 0b1011:
+                job_stats.jobs_per_workflow_type[workflow_type or "unknown"] = count
+            elif grouping == 0b1101:
+                job_stats.jobs_per_user[user_name] = count
+            elif grouping == 0b1110:
+                job_stats.jobs_per_project[project_name] = count
+            elif grouping == 0b1111:
+                job_stats.total_jobs = count
+                job_stats.queue_wait_s = DurationPercentiles(*(wait or (None, None, None)))
+                job_stats.run_time_s = DurationPercentiles(*(run or (None, None, None)))
+        return job_stats
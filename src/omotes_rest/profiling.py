@@ -0,0 +1,321 @@
+import cProfile
+import logging
+import os
+import random
+import secrets
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Protocol
+
+from flask import Flask, Response, abort, g, jsonify, request, send_file
+
+from omotes_rest.config import ProfilingConfig
+
+logger = logging.getLogger("omotes_rest")
+
+PROFILE_HEADER = "X-Omotes-Profile"
+"""Request header with the profiling admin token, to profile the request or use the admin
+endpoints."""
+PROFILE_ID_HEADER = "X-Omotes-Profile-Id"
+"""Response header with the id of the profile of the request."""
+
+
+class Profiler(Protocol):
+    """Profiler of a single request."""
+
+    file_suffix: str
+    """Suffix of the profile files written by the profiler."""
+
+    def start(self) -> None:
+        """Start profiling the current thread."""
+
+    def stop(self) -> None:
+        """Stop profiling."""
+
+    def write(self, path: str) -> None:
+        """Write the profile to a file.
+
+        :param path: Path of the file.
+        """
+
+
+class CProfileProfiler:
+    """Profiler which records every function call with cProfile.
+
+    The profile files can be shown as flamegraph by tools such as snakeviz or flameprof.
+    """
+
+    file_suffix = ".prof"
+
+    def __init__(self) -> None:
+        """Create the profiler."""
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        """Start profiling the current thread."""
+        self._profile.enable()
+
+    def stop(self) -> None:
+        """Stop profiling."""
+        self._profile.disable()
+
+    def write(self, path: str) -> None:
+        """Write the profile to a pstats file.
+
+        :param path: Path of the file.
+        """
+        self._profile.dump_stats(path)
+
+
+create_profiler: Callable[[], Profiler] = CProfileProfiler
+"""Create the profiler of a request. This is a sampling profiler if the `pyinstrument` package is
+installed, else cProfile."""
+
+try:
+    import pyinstrument
+    from pyinstrument.renderers import SpeedscopeRenderer
+
+    class PyinstrumentProfiler:
+        """Sampling profiler with low overhead, which writes speedscope flamegraph files."""
+
+        file_suffix = ".speedscope.json"
+
+        def __init__(self) -> None:
+            """Create the profiler."""
+            self._profiler = pyinstrument.Profiler(interval=0.001)
+
+        def start(self) -> None:
+            """Start profiling the current thread."""
+            self._profiler.start()
+
+        def stop(self) -> None:
+            """Stop profiling."""
+            self._profiler.stop()
+
+        def write(self, path: str) -> None:
+            """Write the profile to a speedscope file.
+
+            :param path: Path of the file.
+            """
+            with open(path, "w") as file:
+                file.write(self._profiler.output(SpeedscopeRenderer()))
+
+    create_profiler = PyinstrumentProfiler
+except ImportError:
+    pass
+
+
+@dataclass
+class RequestProfile:
+    """Profile of a single request."""
+
+    profile_id: str
+    method: str
+    path: str
+    started_at: datetime
+    duration_s: float = 0.0
+    status_code: int | None = None
+    phases_s: dict[str, float] = field(default_factory=dict)
+    """Total duration of each phase of the request in seconds."""
+    profile_file: str | None = None
+
+
+_current_profile: ContextVar[RequestProfile | None] = ContextVar("_current_profile", default=None)
+
+
+def add_phase_duration(name: str, duration_s: float) -> None:
+    """Add to the duration of a phase of the current request, if the request is profiled.
+
+    :param name: Name of the phase.
+    :param duration_s: Duration to add in seconds.
+    """
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.phases_s[name] = profile.phases_s.get(name, 0.0) + duration_s
+
+
+@contextmanager
+def phase(name: str) -> Iterator[None]:
+    """Record the duration of a phase of the current request, if the request is profiled.
+
+    The durations of phases with the same name are summed.
+
+    :param name: Name of the phase.
+    """
+    if _current_profile.get() is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase_duration(name, time.perf_counter() - start)
+
+
+@dataclass
+class _ActiveProfile:
+    profile: RequestProfile
+    profiler: Profiler
+    token: Token
+    start: float
+
+
+class RequestProfiler:
+    """Profile sampled requests and requests with the admin token in the profile header.
+
+    A profiled request gets a `Server-Timing` header with the duration of its phases and the
+    profile is written to a file in the profiling directory. The most recent profiles are listed
+    by the admin endpoint `/profiling/` and the profile files can be downloaded from
+    `/profiling/<profile_id>`. The statistics of the SQL statements are returned by
+    `/profiling/sql`. The admin endpoints require the admin token in the profile header.
+    """
+
+    config: ProfilingConfig | None
+    """Profiling configuration, None if profiling is disabled."""
+    profiles: deque[RequestProfile]
+    """Most recent profiles, the oldest first."""
+
+    def __init__(self) -> None:
+        """Create the profiling extension, the settings are read in `init_app`."""
+        self.config = None
+        self.profiles = deque()
+        self._lock = threading.Lock()
+
+    def init_app(self, app: Flask) -> None:
+        """Read the profiling settings and profile the requests of the app.
+
+        Profiling is disabled unless a sample rate or admin token is configured.
+
+        :param app: The Flask app.
+        """
+        config = ProfilingConfig()
+        if not config.sample_rate and not config.admin_token:
+            return
+
+        os.makedirs(config.directory, exist_ok=True)
+        self.config = config
+        app.before_request(self._start_profile)
+        app.after_request(self._stop_profile)
+        app.teardown_request(self._discard_profile)
+        if config.admin_token:
+            app.add_url_rule("/profiling/", "profiling_list", self.list_profiles)
+            app.add_url_rule("/profiling/sql", "profiling_sql", self.get_query_stats)
+            app.add_url_rule(
+                "/profiling/<string:profile_id>", "profiling_file", self.get_profile_file
+            )
+        logger.info(
+            f"Profiling requests with sample rate {config.sample_rate} to {config.directory}."
+        )
+
+    def _has_admin_token(self) -> bool:
+        assert self.config
+        token = request.headers.get(PROFILE_HEADER)
+        return bool(
+            token
+            and self.config.admin_token
+            and secrets.compare_digest(token, self.config.admin_token)
+        )
+
+    def _start_profile(self) -> None:
+        assert self.config
+        if request.endpoint in ("profiling_list", "profiling_sql", "profiling_file"):
+            return
+        if not self._has_admin_token() and random.random() >= self.config.sample_rate:
+            return
+
+        profile = RequestProfile(
+            profile_id=uuid.uuid4().hex,
+            method=request.method,
+            path=request.path,
+            started_at=datetime.now(timezone.utc),
+        )
+        profiler = create_profiler()
+        g.request_profile = _ActiveProfile(
+            profile=profile,
+            profiler=profiler,
+            token=_current_profile.set(profile),
+            start=time.perf_counter(),
+        )
+        profiler.start()
+
+    def _stop_profile(self, response: Response) -> Response:
+        assert self.config
+        active: _ActiveProfile | None = g.pop("request_profile", None)
+        if active is None:
+            return response
+
+        active.profiler.stop()
+        _current_profile.reset(active.token)
+        profile = active.profile
+        profile.duration_s = time.perf_counter() - active.start
+        profile.status_code = response.status_code
+        profile.profile_file = os.path.join(
+            self.config.directory, profile.profile_id + active.profiler.file_suffix
+        )
+        active.profiler.write(profile.profile_file)
+        self._add_profile(profile)
+
+        server_timing = [
+            f"{name};dur={duration_s * 1000:.3f}" for name, duration_s in profile.phases_s.items()
+        ]
+        server_timing.append(f"total;dur={profile.duration_s * 1000:.3f}")
+        response.headers["Server-Timing"] = ", ".join(server_timing)
+        response.headers[PROFILE_ID_HEADER] = profile.profile_id
+        return response
+
+    @staticmethod
+    def _discard_profile(_: BaseException | None) -> None:
+        active: _ActiveProfile | None = g.pop("request_profile", None)
+        if active is not None:
+            active.profiler.stop()
+            _current_profile.reset(active.token)
+
+    def _add_profile(self, profile: RequestProfile) -> None:
+        assert self.config
+        with self._lock:
+            self.profiles.append(profile)
+            while len(self.profiles) > self.config.max_profiles:
+                evicted_profile = self.profiles.popleft()
+                if evicted_profile.profile_file:
+                    try:
+                        os.remove(evicted_profile.profile_file)
+                    except FileNotFoundError:
+                        pass
+
+    def list_profiles(self) -> Response:
+        """List the most recent profiles, the newest first."""
+        if not self._has_admin_token():
+            abort(403)
+        with self._lock:
+            profiles = [asdict(profile) for profile in reversed(self.profiles)]
+        return jsonify(profiles)
+
+    def get_query_stats(self) -> Response:
+        """Get the statistics of the SQL statements per PostgresInterface method."""
+        from omotes_rest.typed_app import current_app
+
+        if not self._has_admin_token():
+            abort(403)
+        query_stats = current_app.rest_if.postgres_if.query_timer.histogram.snapshot()
+        return jsonify({tag: asdict(stats) for tag, stats in query_stats.items()})
+
+    def get_profile_file(self, profile_id: str) -> Response:
+        """Download the profile file of a request."""
+        if not self._has_admin_token():
+            abort(403)
+        with self._lock:
+            profile_files = [
+                profile.profile_file
+                for profile in self.profiles
+                if profile.profile_id == profile_id and profile.profile_file
+            ]
+        if not profile_files:
+            abort(404, description=f"Profile {profile_id} not found.")
+        return send_file(profile_files[0], as_attachment=True)
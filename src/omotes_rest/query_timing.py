@@ -0,0 +1,248 @@
+import bisect
+import logging
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine, ExceptionContext
+
+from omotes_rest.config import QueryTimingConfig
+from omotes_rest.profiling import add_phase_duration
+
+logger = logging.getLogger("omotes_rest")
+
+HISTOGRAM_BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+"""Upper bounds of the histogram buckets in milliseconds, the last bucket has no upper bound."""
+SLICES_PER_WINDOW = 10
+"""Number of time slices of the rolling window, a slice is dropped at once when it expires."""
+MAX_LOGGED_STATEMENT_LENGTH = 1000
+"""Slow statements are truncated to this number of characters in the log."""
+UNKNOWN_QUERY_TAG = "unknown"
+"""Tag of statements which are not executed by a function of the tagged module."""
+
+
+@dataclass
+class QueryStats:
+    """Statistics of the statements with the same tag over the rolling window."""
+
+    count: int
+    total_ms: float
+    max_ms: float
+    p50_ms: float | None
+    """Upper bound of the histogram bucket with the median, None if it has no upper bound."""
+    p99_ms: float | None
+    """Upper bound of the histogram bucket with the 99th percentile, None if it has no upper
+    bound."""
+    buckets: dict[str, int]
+    """Number of statements per histogram bucket, by upper bound in milliseconds."""
+
+
+class _TagCounts:
+    """Histogram and totals of the statements with the same tag in a time slice."""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+
+class RollingHistogram:
+    """Histogram of durations per tag over a rolling time window.
+
+    The window is divided into time slices. Durations are counted in the current slice and the
+    oldest slice is dropped once it falls outside the window.
+    """
+
+    window_s: float
+    """Duration of the window in seconds."""
+
+    def __init__(self, window_s: float):
+        """Create the histogram.
+
+        :param window_s: Duration of the window in seconds.
+        """
+        self.window_s = window_s
+        self._slice_s = window_s / SLICES_PER_WINDOW
+        self._slices: deque[tuple[int, dict[str, _TagCounts]]] = deque()
+        self._lock = threading.Lock()
+
+    def _drop_expired_slices(self, current_slice: int) -> None:
+        while self._slices and self._slices[0][0] <= current_slice - SLICES_PER_WINDOW:
+            self._slices.popleft()
+
+    def record(self, tag: str, duration_s: float) -> None:
+        """Count a duration.
+
+        :param tag: Tag of the duration.
+        :param duration_s: The duration in seconds.
+        """
+        duration_ms = duration_s * 1000
+        current_slice = int(time.monotonic() // self._slice_s)
+        with self._lock:
+            if not self._slices or self._slices[-1][0] != current_slice:
+                self._slices.append((current_slice, {}))
+                self._drop_expired_slices(current_slice)
+            counts = self._slices[-1][1].get(tag)
+            if counts is None:
+                counts = self._slices[-1][1][tag] = _TagCounts()
+            counts.buckets[bisect.bisect_left(HISTOGRAM_BOUNDS_MS, duration_ms)] += 1
+            counts.total_ms += duration_ms
+            counts.max_ms = max(counts.max_ms, duration_ms)
+
+    def snapshot(self) -> dict[str, QueryStats]:
+        """Get the statistics of the durations in the window.
+
+        :return: Statistics by tag.
+        """
+        totals: dict[str, _TagCounts] = {}
+        with self._lock:
+            self._drop_expired_slices(int(time.monotonic() // self._slice_s))
+            for _, slice_counts in self._slices:
+                for tag, counts in slice_counts.items():
+                    total = totals.setdefault(tag, _TagCounts())
+                    total.buckets = [a + b for a, b in zip(total.buckets, counts.buckets)]
+                    total.total_ms += counts.total_ms
+                    total.max_ms = max(total.max_ms, counts.max_ms)
+
+        bucket_names = [str(bound) for bound in HISTOGRAM_BOUNDS_MS] + ["+Inf"]
+        return {
+            tag: QueryStats(
+                count=sum(total.buckets),
+                total_ms=total.total_ms,
+                max_ms=total.max_ms,
+                p50_ms=self._percentile_bound(total.buckets, 0.5),
+                p99_ms=self._percentile_bound(total.buckets, 0.99),
+                buckets=dict(zip(bucket_names, total.buckets)),
+            )
+            for tag, total in sorted(totals.items())
+        }
+
+    @staticmethod
+    def _percentile_bound(buckets: list[int], percentile: float) -> float | None:
+        rank = percentile * sum(buckets)
+        cumulative_count = 0
+        for bound, count in zip(HISTOGRAM_BOUNDS_MS, buckets):
+            cumulative_count += count
+            if cumulative_count >= rank:
+                return float(bound)
+        return None
+
+
+def parameter_sizes(parameters: Any) -> Any:
+    """Describe the bound parameters of a statement by their size instead of their value.
+
+    :param parameters: Bound parameters as passed to the DBAPI cursor.
+    :return: The length of each string or bytes parameter and the type name of other parameters,
+        in the structure of the parameters. For many parameter sets only the number of sets and
+        the sizes of the first set are returned.
+    """
+    if isinstance(parameters, dict):
+        return {key: parameter_sizes(value) for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return {"sets": len(parameters), "first": parameter_sizes(parameters[0])}
+        return [parameter_sizes(value) for value in parameters]
+    if isinstance(parameters, (str, bytes, bytearray, memoryview)):
+        return len(parameters)
+    return type(parameters).__name__
+
+
+class QueryTimer:
+    """Time every statement executed by engines and tag it with the function executing it.
+
+    The tag is the name of the innermost function of the tagged module, such as the
+    PostgresInterface, which is on the call stack of the statement. Durations are counted in a
+    rolling histogram per tag and statements slower than the threshold are logged with the sizes
+    of their bound parameters, not their values.
+    """
+
+    config: QueryTimingConfig
+    """Configuration of the timing."""
+    histogram: RollingHistogram
+    """Durations of the statements per tag."""
+
+    def __init__(self, config: QueryTimingConfig, tagged_module_file: str):
+        """Create the query timer.
+
+        :param config: Configuration of the timing.
+        :param tagged_module_file: File of the module with the functions used as tags.
+        """
+        self.config = config
+        self.histogram = RollingHistogram(config.window_s)
+        self._tagged_module_file = tagged_module_file
+
+    def attach(self, engine: Engine) -> None:
+        """Time the statements executed by an engine, if the timing is enabled.
+
+        :param engine: The engine.
+        """
+        if not self.config.enabled:
+            return
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+
+    def _query_tag(self) -> str:
+        frame = sys._getframe(2)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_filename == self._tagged_module_file and not code.co_name.endswith("_scope"):
+                return code.co_name
+            frame = frame.f_back  # type: ignore[assignment]
+        return UNKNOWN_QUERY_TAG
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        conn.info.setdefault("query_timing", []).append((self._query_tag(), time.perf_counter()))
+
+    def _finish_statement(
+        self, conn: Connection, statement: str, parameters: Any, failed: bool
+    ) -> None:
+        query_timings = conn.info.get("query_timing")
+        if not query_timings:
+            return
+        tag, start = query_timings.pop()
+        duration_s = time.perf_counter() - start
+        self.histogram.record(tag, duration_s)
+        add_phase_duration("sql", duration_s)
+
+        if duration_s * 1000 >= self.config.slow_query_threshold_ms:
+            logger.warning(
+                "Slow query in %s took %.1f ms%s: %s, parameter sizes: %s",
+                tag,
+                duration_s * 1000,
+                " and failed" if failed else "",
+                statement[:MAX_LOGGED_STATEMENT_LENGTH],
+                parameter_sizes(parameters),
+            )
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        self._finish_statement(conn, statement, parameters, failed=False)
+
+    def _handle_error(self, exception_context: ExceptionContext) -> None:
+        if exception_context.connection is not None and exception_context.statement is not None:
+            self._finish_statement(
+                exception_context.connection,
+                exception_context.statement,
+                exception_context.parameters,
+                failed=True,
+            )
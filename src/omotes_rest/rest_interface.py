@@ -1,8 +1,16 @@
+import dataclasses
+import hashlib
+import itertools
+import json
+import tempfile
+import threading
+import time
 import uuid
-from datetime import timedelta, datetime
-from typing import Union, Any
+from datetime import timedelta, datetime, timezone
+from typing import Any, Callable, Iterator, Union
 import logging
 
+
 from omotes_sdk.types import ParamsDict
 from omotes_sdk.omotes_interface import OmotesInterface
 from omotes_sdk.internal.common.config import EnvRabbitMQConfig
@@ -11,9 +19,11 @@ from omotes_sdk.omotes_interface import (
     JobResult,
     JobProgressUpdate,
     JobStatusUpdate,
+    UnknownWorkflowException,
 )
-import omotes_sdk.workflow_type
+from omotes_sdk.queue_names import OmotesQueueNames
 from omotes_sdk.workflow_type import (
+    convert_params_dict_to_struct,
     StringParameter,
     BooleanParameter,
     IntegerParameter,
@@ -24,40 +34,101 @@ from omotes_sdk.workflow_type import (
 )
 from omotes_sdk_protocol.job_pb2 import EsdlMessage, JobSubmission
 from omotes_rest.postgres_interface import PostgresInterface
-from omotes_rest.config import PostgresConfig
-from omotes_rest.apis.api_dataclasses import JobInput, JobStatusResponse
+from omotes_rest.bytes_lru_cache import BytesLRUCache, DiskBytesLRUCache
+from omotes_rest.config import (
+    JobExportConfig,
+    JobOutboxConfig,
+    JobPartitionConfig,
+    JobProgressConfig,
+    JobResultConfig,
+    JobSweepConfig,
+    PayloadCacheConfig,
+    PostgresConfig,
+    ResultCacheConfig,
+)
+from omotes_rest.apis.api_dataclasses import (
+    JobCloneInput,
+    JobExportQuery,
+    JobInput,
+    JobSweepInput,
+    JobStatusResponse,
+    JobStatsResponse,
+    JobStatusBatchResponse,
+)
+from omotes_rest.apis.job_summary import JobChanges, JobSummaryRecord, JobVersion
 from omotes_rest.db_models.job_rest import JobRestStatus, JobRest
+from omotes_rest.job_export import export_jobs
+from omotes_rest.job_outbox import JobOutboxRelay
+from omotes_rest.job_partition_maintenance import JobPartitionMaintainer
+from omotes_rest.job_progress import JobProgressWriter
+from omotes_rest.job_result import InFlightBytesBudget, job_result_size, spill_job_result
+from omotes_rest.job_partitions import add_months, month_start, new_job_id
+from omotes_rest.profiling import phase
+from omotes_rest.result_cache_eviction import ResultCacheEvictor
 from omotes_rest.settings import EnvSettings
+from omotes_rest.workflow_params import InvalidJobParametersException, WorkflowParamsValidator
 
 logger = logging.getLogger("omotes_rest")
 
+STOPPED_JOB_STATUSES = frozenset(
+    {
+        JobRestStatus.SUCCEEDED,
+        JobRestStatus.CANCELLED,
+        JobRestStatus.TIMEOUT,
+        JobRestStatus.ERROR,
+    }
+)
+"""Statuses of jobs which have stopped, whose result no longer changes."""
+
 
 def convert_json_forms_values_to_params_dict(
     workflow_type: WorkflowType, input_params_dict: dict[str, Any]
 ) -> ParamsDict:
     """Convert values received from the JSON forms format to the omotes params_dict format.
 
+    Note: This compiles a new validator on each call. Use `RestInterface.get_params_validator`
+    to reuse the validator of a workflow type.
+
     :param workflow_type: The workflow type for which these JSON format values were received.
     :param input_params_dict: Dictionary of values in JSON forms format.
+    :raises InvalidJobParametersException: If the values do not match the workflow parameters.
     :return: The omotes params_dict.
     """
-    params_dict: ParamsDict = {}
-    if workflow_type.workflow_parameters:
-        for parameter in workflow_type.workflow_parameters:
-            json_forms_value = input_params_dict.get(parameter.key_name)
+    return WorkflowParamsValidator(workflow_type).validate(input_params_dict)
 
-            if json_forms_value is None:
-                raise RuntimeError(f"Missing parameter {parameter.key_name} in job submission.")
 
-            match type(parameter):
-                case omotes_sdk.workflow_type.DurationParameter:
-                    params_dict[parameter.key_name] = timedelta(seconds=json_forms_value)
-                case omotes_sdk.workflow_type.DateTimeParameter:
-                    params_dict[parameter.key_name] = datetime.fromisoformat(json_forms_value)
-                case _:
-                    params_dict[parameter.key_name] = json_forms_value
+def result_hash_prefix(workflow_type_name: str, input_params_dict: dict) -> bytes:
+    """Encode the job input which is hashed before the input ESDL by `compute_result_hash`.
 
-    return params_dict
+    :param workflow_type_name: Name of the workflow type.
+    :param input_params_dict: Dictionary of values in JSON forms format.
+    :return: The encoded job input.
+    """
+    prefix = b""
+    for part in (
+        workflow_type_name.encode("utf-8"),
+        json.dumps(input_params_dict, sort_keys=True, separators=(",", ":")).encode("utf-8"),
+    ):
+        prefix += len(part).to_bytes(8, "big") + part
+    return prefix
+
+
+def compute_result_hash(workflow_type_name: str, input_params_dict: dict, esdl: str) -> str:
+    """Compute a canonical hash of all job input which determines the job result.
+
+    The parameters are serialized with sorted keys so the order in which they are received does
+    not influence the hash.
+
+    :param workflow_type_name: Name of the workflow type.
+    :param input_params_dict: Dictionary of values in JSON forms format.
+    :param esdl: Input ESDL.
+    :return: Hex digest of the hash.
+    """
+    result_hash = hashlib.sha256(result_hash_prefix(workflow_type_name, input_params_dict))
+    esdl_bytes = esdl.encode("utf-8")
+    result_hash.update(len(esdl_bytes).to_bytes(8, "big"))
+    result_hash.update(esdl_bytes)
+    return result_hash.hexdigest()
 
 
 class RestInterface:
@@ -67,6 +138,41 @@ class RestInterface:
     """Interface to Omotes."""
     postgres_if: PostgresInterface
     """Interface to Omotes rest postgres."""
+    result_cache_config: ResultCacheConfig
+    """Configuration of the cache to reuse results of identical jobs."""
+    result_cache_evictor: ResultCacheEvictor
+    """Background eviction of the expired jobs from the result cache."""
+    _params_validators: dict[str, WorkflowParamsValidator]
+    """Compiled parameter validator per workflow type name."""
+    job_stats_cache_ttl_s: float
+    """Duration for which the job statistics are reused."""
+    _job_stats_cache: tuple[float, JobStatsResponse] | None
+    """Monotonic time at which the cached job statistics were retrieved and the statistics."""
+    payload_cache: BytesLRUCache[str] | DiskBytesLRUCache
+    """Output ESDL and logs of stopped jobs, which never change once written."""
+    job_outbox_config: JobOutboxConfig
+    """Configuration of the relay of the job outbox."""
+    job_outbox_relay: JobOutboxRelay
+    """Background relay publishing the submitted jobs to Omotes."""
+    _connected_job_ids: set[uuid.UUID]
+    """Jobs of which the queues are connected but the job submission is not yet published."""
+    _connected_job_ids_lock: threading.Lock
+    job_partition_config: JobPartitionConfig
+    """Configuration of the monthly partitions of the job tables."""
+    job_partition_maintainer: JobPartitionMaintainer
+    """Background maintenance of the monthly partitions of the job tables."""
+    job_progress_config: JobProgressConfig
+    """Configuration of the batched writes of job progress updates."""
+    job_progress_writer: JobProgressWriter
+    """Background writer of the progress updates of jobs in batches."""
+    job_export_config: JobExportConfig
+    """Configuration of the export of jobs."""
+    job_sweep_config: JobSweepConfig
+    """Configuration of the parameter sweeps of jobs."""
+    job_result_config: JobResultConfig
+    """Configuration of the handling of job results."""
+    job_result_budget: InFlightBytesBudget
+    """Limit on the size of the job results which are handled at the same time."""
 
     def __init__(
         self,
@@ -74,19 +180,68 @@ class RestInterface:
         """Create the omotes rest interface."""
         self.omotes_if = OmotesInterface(EnvRabbitMQConfig(), EnvSettings.omotes_id())
         self.postgres_if = PostgresInterface(PostgresConfig())
+        self.result_cache_config = ResultCacheConfig()
+        self.result_cache_evictor = ResultCacheEvictor(
+            self.evict_result_cache, self.result_cache_config.eviction_interval_s
+        )
+        self._params_validators = {}
+        self.job_stats_cache_ttl_s = EnvSettings.job_stats_cache_ttl_s()
+        self._job_stats_cache = None
+        payload_cache_config = PayloadCacheConfig()
+        if payload_cache_config.directory:
+            self.payload_cache = DiskBytesLRUCache(
+                payload_cache_config.directory, payload_cache_config.max_bytes
+            )
+        else:
+            self.payload_cache = BytesLRUCache(payload_cache_config.max_bytes)
+        self.job_outbox_config = JobOutboxConfig()
+        self.job_outbox_relay = JobOutboxRelay(
+            self.relay_job_outbox_batch,
+            self.job_outbox_config.batch_size,
+            self.job_outbox_config.poll_interval_s,
+        )
+        self._connected_job_ids = set()
+        self._connected_job_ids_lock = threading.Lock()
+        self.job_partition_config = JobPartitionConfig()
+        self.job_partition_maintainer = JobPartitionMaintainer(
+            self.maintain_job_partitions, self.job_partition_config.maintenance_interval_s
+        )
+        self.job_progress_config = JobProgressConfig()
+        self.job_progress_writer = JobProgressWriter(
+            self.write_job_progress_batch, self.job_progress_config.flush_interval_s
+        )
+        self.job_export_config = JobExportConfig()
+        self.job_sweep_config = JobSweepConfig()
+        self.job_result_config = JobResultConfig()
+        self.job_result_budget = InFlightBytesBudget(self.job_result_config.in_flight_budget_bytes)
 
     def start(self) -> None:
         """Start the omotes rest interface."""
         self.omotes_if.start()
         self.postgres_if.start()
+        self.maintain_job_partitions()
+        self.job_partition_maintainer.start()
+        self.job_outbox_relay.start()
+        if self.result_cache_config.enabled:
+            self.result_cache_evictor.start()
+        if self.job_progress_config.flush_interval_s > 0:
+            self.job_progress_writer.start()
 
     def stop(self) -> None:
         """Stop the omotes rest interface."""
+        self.job_outbox_relay.stop()
+        self.job_partition_maintainer.stop()
+        self.result_cache_evictor.stop()
         self.omotes_if.stop()
+        self.job_progress_writer.stop()
 
     def handle_on_job_finished(self, job: Job, result: JobResult) -> None:
         """When a job is finished.
 
+        Results larger than the spill threshold are spilled to a temporary file and streamed to
+        the database. The handler waits while the results in flight exceed the budget, and holds
+        its part of the budget until the result is stored.
+
         :param job: Omotes job.
         :param result: JobResult protobuf message.
         """
@@ -118,13 +273,29 @@ class RestInterface:
                 }
             )
 
-        self.postgres_if.set_job_stopped(
-            job_id=job.id,
-            new_status=final_status,
-            logs=result.logs,
-            output_esdl=result.output_esdl,
-            esdl_feedback=esdl_feedback,
-        )
+        # The SDK holds the parsed result until the handler returns, so the reservation of its
+        # size is held until then, also while a large result is streamed to the database.
+        result_size = job_result_size(result)
+        with self.job_result_budget.reserve(result_size):
+            if result_size <= self.job_result_config.spill_threshold_bytes:
+                self.postgres_if.set_job_stopped(
+                    job_id=job.id,
+                    new_status=final_status,
+                    logs=result.logs,
+                    output_esdl=result.output_esdl,
+                    esdl_feedback=esdl_feedback,
+                )
+                return
+
+            with tempfile.TemporaryFile(prefix="omotes_rest_result_") as result_file:
+                spill_job_result(result, result_file)
+                result_file.seek(0)
+                self.postgres_if.set_job_stopped_with_result_file(
+                    job_id=job.id,
+                    new_status=final_status,
+                    result_file=result_file,
+                    esdl_feedback=esdl_feedback,
+                )
 
     def handle_on_job_status_update(self, job: Job, status_update: JobStatusUpdate) -> None:
         """When a job has a status update.
@@ -157,11 +328,14 @@ class RestInterface:
         :param job: Omotes job.
         :param progress_update: JobProgressUpdate protobuf message.
         """
-        self.postgres_if.set_job_progress(
-            job_id=job.id,
-            progress_fraction=progress_update.progress,
-            progress_message=progress_update.message,
-        )
+        if self.job_progress_config.flush_interval_s > 0:
+            self.job_progress_writer.put(job.id, progress_update.progress, progress_update.message)
+        else:
+            self.postgres_if.set_job_progress(
+                job_id=job.id,
+                progress_fraction=progress_update.progress,
+                progress_message=progress_update.message,
+            )
 
     def get_workflows_jsonforms_format(self) -> list:
         """Get the available workflows with jsonforms schema for the non-ESDL parameters.
@@ -259,8 +433,23 @@ class RestInterface:
                 )
         return workflows
 
+    def get_params_validator(self, workflow_type: WorkflowType) -> WorkflowParamsValidator:
+        """Get the compiled parameter validator for a workflow type.
+
+        The validator is compiled once and reused until the workflow type is replaced by an
+        update of the available workflows.
+
+        :param workflow_type: The workflow type.
+        :return: The validator for the workflow type.
+        """
+        validator = self._params_validators.get(workflow_type.workflow_type_name)
+        if validator is None or validator.workflow_type is not workflow_type:
+            validator = WorkflowParamsValidator(workflow_type)
+            self._params_validators[workflow_type.workflow_type_name] = validator
+        return validator
+
     def submit_job(self, job_input: JobInput) -> JobStatusResponse:
-        """When a job has a progress update.
+        """Register a new job, it is published to Omotes in the background by the outbox relay.
 
         :param job_input: JobInput dataclass with job input.
         :return: JobStatusResponse.
@@ -271,29 +460,279 @@ class RestInterface:
         if not workflow_type:
             raise RuntimeError(f"Unknown workflow type {job_input.workflow_type}")
 
-        params_dict = convert_json_forms_values_to_params_dict(
-            workflow_type, job_input.input_params_dict
-        )
+        with phase("validate_params"):
+            self.get_params_validator(workflow_type).validate(job_input.input_params_dict)
 
         if not job_input.job_priority:
             job_input.job_priority = JobSubmission.JobPriority.Name(
                 JobSubmission.JobPriority.MEDIUM
             ).lower()
 
-        job = self.omotes_if.submit_job(
-            esdl=job_input.input_esdl,
-            job_reference=job_input.job_name,
-            params_dict=params_dict,
-            workflow_type=workflow_type,
-            job_timeout=timedelta(seconds=job_input.timeout_after_s),
-            callback_on_finished=self.handle_on_job_finished,
-            callback_on_progress_update=self.handle_on_job_progress_update,
-            callback_on_status_update=self.handle_on_job_status_update,
-            auto_disconnect_on_result=True,
-            job_priority=JobSubmission.JobPriority.Value(job_input.job_priority.upper()),
+        result_hash = None
+        if self.result_cache_config.enabled:
+            result_hash = compute_result_hash(
+                job_input.workflow_type, job_input.input_params_dict, job_input.input_esdl
+            )
+            cached_response = self._submit_cached_job(job_input, result_hash)
+            if cached_response:
+                return cached_response
+
+        job_id = new_job_id()
+        with phase("put_new_job"):
+            self.postgres_if.put_new_job(
+                job_id=job_id, job_input=job_input, result_hash=result_hash
+            )
+        self.job_outbox_relay.notify()
+        return JobStatusResponse(job_id=job_id, status=JobRestStatus.REGISTERED)
+
+    def clone_job(self, job_id: uuid.UUID, clone_input: JobCloneInput) -> JobStatusResponse | None:
+        """Register a new job with the input of an existing job and the given overrides.
+
+        The input ESDL of the existing job is copied within the database.
+
+        :param job_id: Job id of the job to clone.
+        :param clone_input: Overrides of the job input, the parameters are merged with the
+            parameters of the job.
+        :return: JobStatusResponse, None if the job to clone does not exist.
+        :raises InvalidJobParametersException: If the parameters do not match the workflow type.
+        """
+        responses = self._submit_clones(job_id, [clone_input])
+        return responses[0] if responses else None
+
+    def sweep_job(self, sweep_input: JobSweepInput) -> list[JobStatusResponse] | None:
+        """Register a clone of an existing job for each combination of the parameter grid.
+
+        The combinations are ordered as by `itertools.product`, the last parameter of the grid
+        varies fastest. The name of each job is suffixed with the values of its combination.
+
+        :param sweep_input: Job to clone, parameter grid and overrides of all jobs.
+        :return: JobStatusResponse per combination, None if the job to clone does not exist.
+        :raises InvalidJobParametersException: If the grid is empty or too large, or if the
+            parameters do not match the workflow type.
+        """
+        grid = sweep_input.parameter_grid
+        number_of_jobs = 1
+        for name, values in grid.items():
+            if not values:
+                raise InvalidJobParametersException(f"No values to sweep for parameter '{name}'.")
+            number_of_jobs *= len(values)
+        if number_of_jobs > self.job_sweep_config.max_jobs:
+            raise InvalidJobParametersException(
+                f"The parameter grid has {number_of_jobs} combinations, at most"
+                f" {self.job_sweep_config.max_jobs} jobs may be submitted in a sweep."
+            )
+
+        overrides = sweep_input.overrides
+        clone_inputs = []
+        job_name_suffixes = []
+        for combination_values in itertools.product(*grid.values()):
+            combination = dict(zip(grid, combination_values))
+            clone_inputs.append(
+                dataclasses.replace(
+                    overrides, input_params_dict=overrides.input_params_dict | combination
+                )
+            )
+            job_name_suffixes.append(
+                ", ".join(f"{name}={value}" for name, value in combination.items())
+            )
+        return self._submit_clones(sweep_input.job_id, clone_inputs, job_name_suffixes)
+
+    def _submit_clones(
+        self,
+        source_job_id: uuid.UUID,
+        clone_inputs: list[JobCloneInput],
+        job_name_suffixes: list[str] | None = None,
+    ) -> list[JobStatusResponse] | None:
+        """Register clones of an existing job, or reuse a cached result for each clone.
+
+        All parameters are validated before any job is registered. Result hashes are completed
+        by the database, so the input ESDL is never retrieved.
+
+        :param source_job_id: Job id of the job to clone.
+        :param clone_inputs: Overrides of the job input per clone.
+        :param job_name_suffixes: Suffix of the job name per clone.
+        :return: JobStatusResponse per clone, None if the job to clone does not exist.
+        """
+        source = self.postgres_if.get_job_clone_source(source_job_id)
+        if source is None:
+            return None
+        workflow_type = self.omotes_if.get_workflow_type_manager().get_workflow_by_name(
+            source.workflow_type
         )
-        self.postgres_if.put_new_job(job_id=job.id, job_input=job_input)
-        return JobStatusResponse(job_id=job.id, status=JobRestStatus.REGISTERED)
+        if not workflow_type:
+            raise RuntimeError(f"Unknown workflow type {source.workflow_type}")
+        default_priority = JobSubmission.JobPriority.Name(JobSubmission.JobPriority.MEDIUM).lower()
+
+        job_inputs = []
+        with phase("validate_params"):
+            validator = self.get_params_validator(workflow_type)
+            for i, clone_input in enumerate(clone_inputs):
+                input_params_dict = source.input_params_dict | clone_input.input_params_dict
+                validator.validate(input_params_dict)
+                job_name = clone_input.job_name or source.job_name
+                if job_name_suffixes:
+                    job_name = f"{job_name} ({job_name_suffixes[i]})"
+                job_inputs.append(
+                    dataclasses.replace(
+                        source,
+                        job_name=job_name,
+                        user_name=clone_input.user_name or source.user_name,
+                        project_name=clone_input.project_name or source.project_name,
+                        input_params_dict=input_params_dict,
+                        timeout_after_s=(
+                            source.timeout_after_s
+                            if clone_input.timeout_after_s is None
+                            else clone_input.timeout_after_s
+                        ),
+                        job_priority=(
+                            clone_input.job_priority or source.job_priority or default_priority
+                        ),
+                    )
+                )
+
+        result_hashes: list[str | None] = [None] * len(job_inputs)
+        responses: list[JobStatusResponse | None] = [None] * len(job_inputs)
+        if self.result_cache_config.enabled:
+            stored_esdl_result_hashes = self.postgres_if.get_stored_esdl_result_hashes(
+                source_job_id,
+                [
+                    result_hash_prefix(job_input.workflow_type, job_input.input_params_dict)
+                    for job_input in job_inputs
+                ],
+            )
+            if not stored_esdl_result_hashes:
+                return None
+            result_hashes = list(stored_esdl_result_hashes)
+            responses = [
+                self._submit_cached_job(job_input, result_hash)
+                for job_input, result_hash in zip(job_inputs, stored_esdl_result_hashes)
+            ]
+
+        clones = [
+            (new_job_id(), job_input, result_hash)
+            for job_input, result_hash, response in zip(job_inputs, result_hashes, responses)
+            if response is None
+        ]
+        if clones:
+            with phase("put_cloned_jobs"):
+                if not self.postgres_if.put_cloned_jobs(source_job_id, clones):
+                    return None
+            self.job_outbox_relay.notify()
+        new_responses = iter(
+            JobStatusResponse(job_id=job_id, status=JobRestStatus.REGISTERED)
+            for job_id, _, _ in clones
+        )
+        return [response or next(new_responses) for response in responses]
+
+    def publish_job(self, job_rest: JobRest) -> None:
+        """Submit a job from the outbox to Omotes under the job id assigned by this service.
+
+        `OmotesInterface.submit_job` generates a new job id, so instead the steps of
+        `OmotesInterface.submit_job` of omotes-sdk-python 4.2.0 are repeated with the job id of
+        this service: the workflow type is checked, the callbacks are connected to the queues of
+        the job and the job submission is published. The SDK is pinned to that version, and
+        `test_omotes_sdk_contract.py` checks that both publish the same to the broker.
+
+        A job may be published more than once, see `PostgresInterface.relay_job_outbox`. Each
+        submission has the same job id and connects to the same queues.
+
+        :param job_rest: The job to submit.
+        :raises UnknownWorkflowException: If the workflow type is unknown.
+        """
+        workflow_type_manager = self.omotes_if.get_workflow_type_manager()
+        workflow_type = workflow_type_manager.get_workflow_by_name(job_rest.workflow_type)
+        if not workflow_type or not workflow_type_manager.workflow_exists(workflow_type):
+            raise UnknownWorkflowException()
+        params_dict = self.get_params_validator(workflow_type).validate(job_rest.input_params_dict)
+
+        job = Job(id=job_rest.job_id, workflow_type=workflow_type)
+        with self._connected_job_ids_lock:
+            if job.id not in self._connected_job_ids:
+                self.omotes_if.connect_to_submitted_job(
+                    job,
+                    callback_on_finished=self.handle_on_job_finished,
+                    callback_on_progress_update=self.handle_on_job_progress_update,
+                    callback_on_status_update=self.handle_on_job_status_update,
+                    auto_disconnect_on_result=True,
+                    reconnect=False,
+                )
+                self._connected_job_ids.add(job.id)
+
+        job_submission = JobSubmission(
+            uuid=str(job.id),
+            timeout_ms=(
+                job_rest.timeout_after_s * 1000 if job_rest.timeout_after_s is not None else None
+            ),
+            workflow_type=workflow_type.workflow_type_name,
+            esdl=job_rest.input_esdl,
+            params_dict=convert_params_dict_to_struct(workflow_type, params_dict),
+            job_reference=job_rest.job_name,
+            job_priority=JobSubmission.JobPriority.Value(job_rest.job_priority.upper()),
+        )
+        self.omotes_if.broker_if.send_message_to(
+            exchange_name=OmotesQueueNames.omotes_exchange_name(),
+            routing_key=OmotesQueueNames.job_submission_queue_name(),
+            message=job_submission.SerializeToString(),
+        )
+        with self._connected_job_ids_lock:
+            self._connected_job_ids.discard(job.id)
+        logger.info("Submitted job %s with reference %s", job.id, job_rest.job_name)
+
+    def maintain_job_partitions(self) -> None:
+        """Create the job partitions of the coming months and detach the expired partitions.
+
+        Errors are logged, a job registered in a month without a partition is stored in the
+        default partition.
+        """
+        this_month = month_start(datetime.now(timezone.utc))
+        try:
+            self.postgres_if.create_job_partitions(
+                this_month, add_months(this_month, self.job_partition_config.months_ahead)
+            )
+            if self.job_partition_config.retention_months > 0:
+                self.postgres_if.detach_job_partitions(
+                    add_months(this_month, -self.job_partition_config.retention_months),
+                    drop=self.job_partition_config.drop_expired,
+                )
+        except Exception:
+            logger.exception("Error while maintaining the job partitions")
+
+    def relay_job_outbox_batch(self) -> int:
+        """Publish a batch of job submissions from the outbox to Omotes.
+
+        :return: Number of outbox entries in the batch, published or not.
+        """
+        return self.postgres_if.relay_job_outbox(self.job_outbox_config, self.publish_job)
+
+    def write_job_progress_batch(self, jobs_progress: dict[uuid.UUID, tuple[float, str]]) -> None:
+        """Write a batch of progress updates of jobs.
+
+        :param jobs_progress: The progress fraction and progress message per job id.
+        """
+        self.postgres_if.set_jobs_progress(jobs_progress)
+
+    def evict_result_cache(self) -> None:
+        """Evict the expired jobs and the jobs which did not succeed from the result cache."""
+        self.postgres_if.evict_result_cache(
+            datetime.now() - timedelta(seconds=self.result_cache_config.ttl_s)
+        )
+
+    def _submit_cached_job(self, job_input: JobInput, result_hash: str) -> JobStatusResponse | None:
+        """Create a succeeded job from the result of an identical job, if one is cached.
+
+        :param job_input: JobInput dataclass with job input.
+        :param result_hash: Hash of the job input.
+        :return: JobStatusResponse if the result cache was hit, else None.
+        """
+        cached_job_id = self.postgres_if.get_cached_result_job_id(
+            result_hash, datetime.now() - timedelta(seconds=self.result_cache_config.ttl_s)
+        )
+        if cached_job_id:
+            job_id = new_job_id()
+            if self.postgres_if.put_new_cached_job(job_id, job_input, cached_job_id):
+                logger.info("Job %s reuses the result of job %s", job_id, cached_job_id)
+                return JobStatusResponse(job_id=job_id, status=JobRestStatus.SUCCEEDED)
+        return None
 
     def get_job(self, job_id: uuid.UUID) -> JobRest | None:
         """Get job by id.
@@ -303,7 +742,7 @@ class RestInterface:
         """
         return self.postgres_if.get_job(job_id)
 
-    def get_jobs(self) -> list[JobRest]:
+    def get_jobs(self) -> list[JobSummaryRecord]:
         """Get list of all jobs.
 
         :return: List of jobs.
@@ -329,7 +768,10 @@ class RestInterface:
             job = Job(id=job_id, workflow_type=workflow_type)
             self.omotes_if.delete_job(job)
 
-        return self.postgres_if.delete_job(job_id)
+        deleted = self.postgres_if.delete_job(job_id)
+        for payload_name in ("output_esdl", "logs"):
+            self.payload_cache.delete(f"{job_id}/{payload_name}")
+        return deleted
 
     def get_job_status(self, job_id: uuid.UUID) -> JobRestStatus | None:
         """Get job status by id.
@@ -339,13 +781,69 @@ class RestInterface:
         """
         return self.postgres_if.get_job_status(job_id)
 
+    def get_job_statuses(self, job_ids: list[uuid.UUID]) -> JobStatusBatchResponse:
+        """Get status and progress of multiple jobs by id.
+
+        :param job_ids: Job ids.
+        :return: Status and progress of the known jobs and the unknown job ids.
+        """
+        job_statuses = self.postgres_if.get_job_statuses(job_ids)
+        known_job_ids = {job_status.job_id for job_status in job_statuses}
+        return JobStatusBatchResponse(
+            jobs=job_statuses,
+            unknown_job_ids=[job_id for job_id in job_ids if job_id not in known_job_ids],
+        )
+
+    def _get_job_payload(
+        self,
+        job_id: uuid.UUID,
+        payload_name: str,
+        get_payload: Callable[[uuid.UUID], str | None],
+    ) -> str | None:
+        """Get a job payload from the payload cache, or from the database and then cache it.
+
+        Payloads are only written when the job stops, so once the job has stopped its payloads
+        never change until the job is deleted. Only payloads of stopped jobs are cached. The job
+        status is queried before every read, so the cache saves the transfer of the payload from
+        the database but not the query.
+
+        :param job_id: Job id.
+        :param payload_name: Name of the payload.
+        :param get_payload: Function retrieving the payload from the database.
+        :return: The payload if found, else None.
+        """
+        key = f"{job_id}/{payload_name}"
+        # The payload cache may be local to this worker while the job is deleted through another,
+        # so the job is confirmed to still exist and to have stopped before using the cache.
+        status = self.postgres_if.get_job_status(job_id)
+        if status is None:
+            self.payload_cache.delete(key)
+            return None
+        if status not in STOPPED_JOB_STATUSES:
+            return get_payload(job_id)
+
+        cached_payload = self.payload_cache.get(key)
+        if cached_payload is not None:
+            return cached_payload.decode("utf-8")
+
+        payload = get_payload(job_id)
+        if payload is not None:
+            self.payload_cache.put(key, payload.encode("utf-8"))
+        logger.debug(
+            "Payload cache hits %s, misses %s, size %s bytes",
+            self.payload_cache.hits,
+            self.payload_cache.misses,
+            self.payload_cache.size_bytes,
+        )
+        return payload
+
     def get_job_output_esdl(self, job_id: uuid.UUID) -> str | None:
         """Get job output ESDL by id.
 
         :param job_id: Job id.
         :return: Output ESDL base64 string if found, else None.
         """
-        return self.postgres_if.get_job_output_esdl(job_id)
+        return self._get_job_payload(job_id, "output_esdl", self.postgres_if.get_job_output_esdl)
 
     def get_job_logs(self, job_id: uuid.UUID) -> str | None:
         """Get job logs by id.
@@ -353,9 +851,9 @@ class RestInterface:
         :param job_id: Job id.
         :return: logs as string if found, else None.
         """
-        return self.postgres_if.get_job_logs(job_id)
+        return self._get_job_payload(job_id, "logs", self.postgres_if.get_job_logs)
 
-    def get_jobs_from_user(self, user_name: str) -> list[JobRest]:
+    def get_jobs_from_user(self, user_name: str) -> list[JobSummaryRecord]:
         """Get list of all jobs from a specific user.
 
         :param user_name: Name of the user.
@@ -363,10 +861,67 @@ class RestInterface:
         """
         return self.postgres_if.get_jobs_from_user(user_name)
 
-    def get_jobs_from_project(self, user_name: str) -> list[JobRest]:
+    def get_jobs_from_project(self, user_name: str) -> list[JobSummaryRecord]:
         """Get list of all jobs from a specific project.
 
         :param user_name: Name of the project.
         :return: List of jobs.
         """
         return self.postgres_if.get_jobs_from_project(user_name)
+
+    def get_job_changes(
+        self,
+        since: int | None = None,
+        user_name: str | None = None,
+        project_name: str | None = None,
+    ) -> JobChanges:
+        """Get the jobs created, updated or deleted since a change cursor.
+
+        :param since: Cursor returned with earlier changes, None to get all jobs.
+        :param user_name: Only get the changes of the jobs of this user.
+        :param project_name: Only get the changes of the jobs of this project.
+        :return: The changed jobs, the deleted job ids and the cursor for the next changes.
+        """
+        return self.postgres_if.get_job_changes(since, user_name, project_name)
+
+    def export_jobs(self, query: JobExportQuery) -> Iterator[bytes]:
+        """Export jobs, reading and writing a chunk of jobs at a time.
+
+        :param query: Filters on the jobs to export and the format.
+        :return: Iterator over the exported data.
+        """
+        return export_jobs(self.postgres_if, query, self.job_export_config)
+
+    def get_job_version(self, job_id: uuid.UUID) -> JobVersion | None:
+        """Get the version of a job, to validate a response cached by a client.
+
+        :param job_id: Job id.
+        :return: Version of the job, None if the job does not exist.
+        """
+        return self.postgres_if.get_job_version(job_id)
+
+    def get_jobs_version(
+        self, user_name: str | None = None, project_name: str | None = None
+    ) -> JobVersion:
+        """Get the version of a list of jobs, to validate a response cached by a client.
+
+        :param user_name: Only the jobs of this user.
+        :param project_name: Only the jobs of this project.
+        :return: Version of the list of jobs.
+        """
+        return self.postgres_if.get_jobs_version(user_name, project_name)
+
+    def get_job_stats(self) -> JobStatsResponse:
+        """Get aggregated statistics over all jobs.
+
+        The statistics are cached for a few seconds so frequently polling dashboards do not
+        cause an aggregate query per request.
+
+        :return: Job statistics.
+        """
+        now = time.monotonic()
+        job_stats_cache = self._job_stats_cache
+        if job_stats_cache is None or now - job_stats_cache[0] > self.job_stats_cache_ttl_s:
+            job_stats_cache = (now, self.postgres_if.get_job_stats())
+            self._job_stats_cache = job_stats_cache
+        return job_stats_cache[1]
@@ -0,0 +1,49 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger("omotes_rest")
+
+
+class ResultCacheEvictor:
+    """Background thread which evicts the expired jobs from the result cache periodically.
+
+    The eviction updates all cached jobs which expired, so it runs outside the requests which
+    submit jobs and a slow eviction never delays a job submission.
+    """
+
+    interval_s: float
+    """Time between the evictions."""
+
+    def __init__(self, evict: Callable[[], None], interval_s: float):
+        """Create the evictor.
+
+        :param evict: Function evicting the expired jobs from the result cache.
+        :param interval_s: Time between the evictions.
+        """
+        self.interval_s = interval_s
+        self._evict = evict
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start evicting in a background thread, the first eviction is directly at the start."""
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="result_cache_evictor", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop evicting, an eviction which is in progress is finished first."""
+        self._stopping.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self._evict()
+            except Exception:
+                logger.exception("Error while evicting the result cache")
+            if self._stopping.wait(self.interval_s):
+                break
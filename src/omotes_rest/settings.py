@@ -34,6 +34,36 @@ class EnvSettings:
         """Env var."""
         return os.getenv("OMOTES_ID", "omotes-rest")
 
+    @staticmethod
+    def gunicorn_workers() -> int:
+        """Env var."""
+        return int(os.getenv("GUNICORN_WORKERS", "1"))
+
+    @staticmethod
+    def gunicorn_preload_app() -> bool:
+        """Env var."""
+        return os.getenv("GUNICORN_PRELOAD_APP", "true").lower() == "true"
+
+    @staticmethod
+    def job_stats_cache_ttl_s() -> float:
+        """Env var."""
+        return float(os.getenv("JOB_STATS_CACHE_TTL_S", "5"))
+
+    @staticmethod
+    def compression_enabled() -> bool:
+        """Env var."""
+        return os.getenv("COMPRESSION_ENABLED", "true").lower() == "true"
+
+    @staticmethod
+    def compression_min_size_bytes() -> int:
+        """Env var."""
+        return int(os.getenv("COMPRESSION_MIN_SIZE_BYTES", "1024"))
+
+    @staticmethod
+    def compression_cache_max_bytes() -> int:
+        """Env var."""
+        return int(os.getenv("COMPRESSION_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
 
 class Config(object):
     """Generic config for all environments."""
@@ -49,6 +79,8 @@ class Config(object):
     OPENAPI_REDOC_PATH = "/redoc"
     OPENAPI_REDOC_URL = "https://cdn.jsdelivr.net/npm/redoc@next/bundles/redoc.standalone.js"
 
+    JSON_PROVIDER = "omotes_rest.json_provider.OrjsonProvider"
+
     API_SPEC_OPTIONS = {
         "info": {
             "description": "This is the Omotes REST service API.",
@@ -1,14 +1,15 @@
-from typing import cast
+from typing import TYPE_CHECKING, cast
 
 from flask import current_app as flask_app, Flask
 
-from omotes_rest import RestInterface
+if TYPE_CHECKING:
+    from omotes_rest.rest_interface import RestInterface
 
 
 class OmotesRestApp(Flask):
     """Type-complete description with extensions of the Flask app."""
 
-    rest_if: RestInterface
+    rest_if: "RestInterface"
 
 
 current_app = cast(OmotesRestApp, flask_app)
@@ -0,0 +1,267 @@
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from omotes_sdk.types import ParamsDict, ParamsDictValues
+from omotes_sdk.workflow_type import (
+    StringParameter,
+    BooleanParameter,
+    IntegerParameter,
+    FloatParameter,
+    DateTimeParameter,
+    DurationParameter,
+    WorkflowParameter,
+    WorkflowType,
+)
+from omotes_sdk_protocol.workflow_pb2 import WorkflowParameter as WorkflowParameterPb
+
+ParameterConverter = Callable[[Any], ParamsDictValues]
+
+
+class InvalidJobParametersException(Exception):
+    """Thrown when the parameters of a job submission do not match the workflow type."""
+
+    ...  # pragma: no cover
+
+
+def _is_number(value: Any) -> bool:
+    """Check if a JSON value is a number. Booleans are not considered to be numbers.
+
+    :param value: JSON value.
+    :return: True if the value is an int or float.
+    """
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _check_range(
+    key_name: str,
+    value: float | timedelta,
+    minimum: float | timedelta | None,
+    maximum: float | timedelta | None,
+) -> None:
+    """Check if a value is within the (inclusive) bounds of the parameter.
+
+    :param key_name: Key name of the parameter.
+    :param value: Value to check.
+    :param minimum: Optional lower bound.
+    :param maximum: Optional upper bound.
+    """
+    if minimum is not None and value < minimum:  # type: ignore[operator]
+        raise InvalidJobParametersException(
+            f"Parameter {key_name} must be at least {minimum} but received {value}."
+        )
+    if maximum is not None and value > maximum:  # type: ignore[operator]
+        raise InvalidJobParametersException(
+            f"Parameter {key_name} must be at most {maximum} but received {value}."
+        )
+
+
+def _compile_string_converter(parameter: StringParameter) -> ParameterConverter:
+    """Compile the converter for a string parameter.
+
+    :param parameter: The string parameter.
+    :return: Converter which checks the type and enum options.
+    """
+    key_name = parameter.key_name
+    enum_keys = (
+        frozenset(option.key_name for option in parameter.enum_options)
+        if parameter.enum_options
+        else None
+    )
+
+    def convert(value: Any) -> str:
+        if not isinstance(value, str):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be a string but received {value!r}."
+            )
+        if enum_keys is not None and value not in enum_keys:
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be one of {sorted(enum_keys)} but received {value!r}."
+            )
+        return value
+
+    return convert
+
+
+def _compile_boolean_converter(parameter: BooleanParameter) -> ParameterConverter:
+    """Compile the converter for a boolean parameter.
+
+    :param parameter: The boolean parameter.
+    :return: Converter which checks the type.
+    """
+    key_name = parameter.key_name
+
+    def convert(value: Any) -> bool:
+        if not isinstance(value, bool):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be a boolean but received {value!r}."
+            )
+        return value
+
+    return convert
+
+
+def _compile_integer_converter(parameter: IntegerParameter) -> ParameterConverter:
+    """Compile the converter for an integer parameter.
+
+    :param parameter: The integer parameter.
+    :return: Converter which checks the type and range.
+    """
+    key_name = parameter.key_name
+    minimum = parameter.minimum
+    maximum = parameter.maximum
+
+    def convert(value: Any) -> int:
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        if not isinstance(value, int) or isinstance(value, bool):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be an integer but received {value!r}."
+            )
+        _check_range(key_name, value, minimum, maximum)
+        return value
+
+    return convert
+
+
+def _compile_float_converter(parameter: FloatParameter) -> ParameterConverter:
+    """Compile the converter for a float parameter.
+
+    :param parameter: The float parameter.
+    :return: Converter which checks the type and range.
+    """
+    key_name = parameter.key_name
+    minimum = parameter.minimum
+    maximum = parameter.maximum
+
+    def convert(value: Any) -> float:
+        if not _is_number(value):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be a number but received {value!r}."
+            )
+        _check_range(key_name, value, minimum, maximum)
+        return float(value)
+
+    return convert
+
+
+def _compile_datetime_converter(parameter: DateTimeParameter) -> ParameterConverter:
+    """Compile the converter for a datetime parameter.
+
+    :param parameter: The datetime parameter.
+    :return: Converter which parses the ISO format string.
+    """
+    key_name = parameter.key_name
+
+    def convert(value: Any) -> datetime:
+        try:
+            return datetime.fromisoformat(value)
+        except (TypeError, ValueError):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be an ISO format datetime but received {value!r}."
+            )
+
+    return convert
+
+
+def _compile_duration_converter(parameter: DurationParameter) -> ParameterConverter:
+    """Compile the converter for a duration parameter.
+
+    :param parameter: The duration parameter.
+    :return: Converter which checks the type and range and converts seconds to a timedelta.
+    """
+    key_name = parameter.key_name
+    minimum = parameter.minimum
+    maximum = parameter.maximum
+
+    def convert(value: Any) -> timedelta:
+        if not _is_number(value):
+            raise InvalidJobParametersException(
+                f"Parameter {key_name} must be a number of seconds but received {value!r}."
+            )
+        duration = timedelta(seconds=value)
+        _check_range(key_name, duration, minimum, maximum)
+        return duration
+
+    return convert
+
+
+def _compile_converter(parameter: WorkflowParameter) -> ParameterConverter:
+    """Compile the converter for a workflow parameter based on its type.
+
+    :param parameter: The workflow parameter.
+    :return: Converter from the JSON forms value to the params_dict value.
+    """
+    if isinstance(parameter, StringParameter):
+        return _compile_string_converter(parameter)
+    elif isinstance(parameter, BooleanParameter):
+        return _compile_boolean_converter(parameter)
+    elif isinstance(parameter, IntegerParameter):
+        return _compile_integer_converter(parameter)
+    elif isinstance(parameter, FloatParameter):
+        return _compile_float_converter(parameter)
+    elif isinstance(parameter, DateTimeParameter):
+        return _compile_datetime_converter(parameter)
+    elif isinstance(parameter, DurationParameter):
+        return _compile_duration_converter(parameter)
+    else:
+        raise NotImplementedError(f"Parameter type {type(parameter)} not supported")
+
+
+class WorkflowParamsValidator:
+    """Validator of JSON forms values for a workflow type.
+
+    All parameter checks are compiled once when the validator is created so validating a job
+    submission does not need to inspect the workflow parameters again.
+    """
+
+    workflow_type: WorkflowType
+    """The workflow type this validator is compiled for."""
+    _converters: list[tuple[str, ParameterConverter]]
+    """Converter per parameter key name."""
+    _constraints: list[tuple[WorkflowParameter, WorkflowParameterPb.Constraint]]
+    """Constraints between parameters."""
+
+    def __init__(self, workflow_type: WorkflowType) -> None:
+        """Compile the validator for a workflow type.
+
+        :param workflow_type: The workflow type to compile the validator for.
+        """
+        self.workflow_type = workflow_type
+        parameters = workflow_type.workflow_parameters or []
+        self._converters = [
+            (parameter.key_name, _compile_converter(parameter)) for parameter in parameters
+        ]
+        self._constraints = [
+            (parameter, constraint)
+            for parameter in parameters
+            for constraint in parameter.constraints
+        ]
+
+    def validate(self, input_params_dict: dict[str, Any]) -> ParamsDict:
+        """Validate and convert values received in the JSON forms format.
+
+        :param input_params_dict: Dictionary of values in JSON forms format.
+        :raises InvalidJobParametersException: If a parameter is missing, of the wrong type, out
+            of range, not one of the enum options or violates a constraint.
+        :return: The omotes params_dict.
+        """
+        params_dict: ParamsDict = {}
+        for key_name, convert in self._converters:
+            json_forms_value = input_params_dict.get(key_name)
+            if json_forms_value is None:
+                raise InvalidJobParametersException(
+                    f"Missing parameter {key_name} in job submission."
+                )
+            params_dict[key_name] = convert(json_forms_value)
+
+        for parameter, constraint in self._constraints:
+            try:
+                parameter.check_parameter_constraint(
+                    params_dict[parameter.key_name],
+                    params_dict[constraint.other_key_name],
+                    constraint,
+                )
+            except (KeyError, RuntimeError) as e:
+                raise InvalidJobParametersException(str(e))
+
+        return params_dict
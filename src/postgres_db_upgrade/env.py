@@ -1,7 +1,9 @@
 import importlib.util
 import os
+import re
 import sys
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
 from sqlalchemy import create_engine
@@ -39,6 +41,26 @@ else:
 
 load_dotenv(dotenv_path="../.env")
 
+# The monthly and default partitions of the job tables are created by omotes-rest, not by the
+# revisions, so they are ignored when comparing the database with the models.
+JOB_PARTITION_PATTERN = re.compile(r"^(job_rest|job_state)_(p\d{4}_\d{2}|default)$")
+
+
+def include_name(name: str | None, type_: str, parent_names: dict[str, str | None]) -> bool:
+    """Include all tables and other objects except the partitions of the job tables."""
+    return not (type_ == "table" and name and JOB_PARTITION_PATTERN.match(name))
+
+
+def include_object(
+    object: Any, name: str | None, type_: str, reflected: bool, compare_to: Any
+) -> bool:
+    """Include all objects except the foreign keys which PostgreSQL adds for each partition."""
+    return not (
+        type_ == "foreign_key_constraint"
+        and reflected
+        and JOB_PARTITION_PATTERN.match(object.referred_table.name)
+    )
+
 
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
@@ -56,6 +78,8 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_name=include_name,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -92,7 +116,12 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            include_name=include_name,
+            include_object=include_object,
+        )
 
         with context.begin_transaction():
             context.run_migrations()
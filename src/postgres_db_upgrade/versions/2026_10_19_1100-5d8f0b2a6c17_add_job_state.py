@@ -0,0 +1,72 @@
+"""add job state
+
+Revision ID: 5d8f0b2a6c17
+Revises: 7a1e5c3f9b62
+Create Date: 2026-10-19 11:00:41.530272
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d8f0b2a6c17'
+down_revision: Union[str, None] = '7a1e5c3f9b62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_STATE_COLUMNS = 'status, progress_fraction, progress_message, submitted_at, running_at, stopped_at'
+
+
+def upgrade() -> None:
+    op.create_table('job_state',
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('status', postgresql.ENUM('REGISTERED', 'ENQUEUED', 'RUNNING', 'SUCCEEDED', 'CANCELLED', 'TIMEOUT', 'ERROR', name='jobreststatus', create_type=False), nullable=False),
+    sa.Column('progress_fraction', sa.Float(), nullable=False),
+    sa.Column('progress_message', sa.String(), nullable=False),
+    sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('running_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('stopped_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['job_rest.job_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    # Leave room in each page so status and progress updates are HOT updates.
+    op.execute('ALTER TABLE job_state SET (fillfactor = 50)')
+    op.execute(f'INSERT INTO job_state (job_id, {JOB_STATE_COLUMNS}) SELECT job_id, {JOB_STATE_COLUMNS} FROM job_rest')
+    op.create_index('ix_job_state_status', 'job_state', ['status'], unique=False)
+
+    op.drop_index('ix_job_rest_status', table_name='job_rest')
+    op.drop_index('ix_job_rest_user_name', table_name='job_rest')
+    op.drop_index('ix_job_rest_project_name', table_name='job_rest')
+    op.create_index('ix_job_rest_user_name', 'job_rest', ['user_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'registered_at', 'project_name'])
+    op.create_index('ix_job_rest_project_name', 'job_rest', ['project_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'registered_at', 'user_name'])
+    op.drop_column('job_rest', 'stopped_at')
+    op.drop_column('job_rest', 'running_at')
+    op.drop_column('job_rest', 'submitted_at')
+    op.drop_column('job_rest', 'progress_message')
+    op.drop_column('job_rest', 'progress_fraction')
+    op.drop_column('job_rest', 'status')
+
+
+def downgrade() -> None:
+    op.add_column('job_rest', sa.Column('status', postgresql.ENUM('REGISTERED', 'ENQUEUED', 'RUNNING', 'SUCCEEDED', 'CANCELLED', 'TIMEOUT', 'ERROR', name='jobreststatus', create_type=False), nullable=True))
+    op.add_column('job_rest', sa.Column('progress_fraction', sa.Float(), nullable=True))
+    op.add_column('job_rest', sa.Column('progress_message', sa.String(), nullable=True))
+    op.add_column('job_rest', sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('job_rest', sa.Column('running_at', sa.DateTime(timezone=True), nullable=True))
+    op.add_column('job_rest', sa.Column('stopped_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute(f'UPDATE job_rest SET ({JOB_STATE_COLUMNS}) = (SELECT {JOB_STATE_COLUMNS} FROM job_state WHERE job_state.job_id = job_rest.job_id)')
+    op.alter_column('job_rest', 'status', nullable=False)
+    op.alter_column('job_rest', 'progress_fraction', nullable=False)
+    op.alter_column('job_rest', 'progress_message', nullable=False)
+
+    op.drop_index('ix_job_rest_user_name', table_name='job_rest')
+    op.drop_index('ix_job_rest_project_name', table_name='job_rest')
+    op.create_index('ix_job_rest_project_name', 'job_rest', ['project_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'status', 'progress_fraction', 'registered_at', 'running_at', 'stopped_at', 'user_name'])
+    op.create_index('ix_job_rest_status', 'job_rest', ['status'], unique=False)
+    op.create_index('ix_job_rest_user_name', 'job_rest', ['user_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'status', 'progress_fraction', 'registered_at', 'running_at', 'stopped_at', 'project_name'])
+    op.drop_index('ix_job_state_status', table_name='job_state')
+    op.drop_table('job_state')
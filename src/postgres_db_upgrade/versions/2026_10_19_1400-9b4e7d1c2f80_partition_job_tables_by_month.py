@@ -0,0 +1,157 @@
+"""partition job tables by month
+
+Revision ID: 9b4e7d1c2f80
+Revises: 5d8f0b2a6c17
+Create Date: 2026-10-19 14:00:07.291846
+
+"""
+from datetime import timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b4e7d1c2f80'
+down_revision: Union[str, None] = '5d8f0b2a6c17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JOB_REST_COLUMNS = 'job_id, job_name, workflow_type, job_priority, registered_at, timeout_after_s, user_name, project_name, input_params_dict, input_esdl, output_esdl, logs, esdl_feedback, result_hash, cached_from_job_id'
+JOB_STATE_COLUMNS = 'job_id, status, progress_fraction, progress_message, submitted_at, running_at, stopped_at'
+PARTITIONS_MONTHS_AHEAD = 3
+
+
+def job_rest_columns() -> list[sa.Column]:
+    return [
+        sa.Column('job_id', sa.UUID(), nullable=False),
+        sa.Column('job_name', sa.String(), nullable=False),
+        sa.Column('workflow_type', sa.String(), nullable=True),
+        sa.Column('job_priority', sa.String(), nullable=True),
+        sa.Column('registered_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('timeout_after_s', sa.Integer(), nullable=True),
+        sa.Column('user_name', sa.String(), nullable=False),
+        sa.Column('project_name', sa.String(), nullable=False),
+        sa.Column('input_params_dict', sa.JSON(), nullable=True),
+        sa.Column('input_esdl', sa.String(), nullable=False),
+        sa.Column('output_esdl', sa.String(), nullable=True),
+        sa.Column('logs', sa.String(), nullable=True),
+        sa.Column('esdl_feedback', sa.JSON(), nullable=True),
+        sa.Column('result_hash', sa.String(), nullable=True),
+        sa.Column('cached_from_job_id', sa.UUID(), nullable=True),
+    ]
+
+
+def job_state_columns() -> list[sa.Column]:
+    return [
+        sa.Column('status', postgresql.ENUM('REGISTERED', 'ENQUEUED', 'RUNNING', 'SUCCEEDED', 'CANCELLED', 'TIMEOUT', 'ERROR', name='jobreststatus', create_type=False), nullable=False),
+        sa.Column('progress_fraction', sa.Float(), nullable=False),
+        sa.Column('progress_message', sa.String(), nullable=False),
+        sa.Column('submitted_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('running_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('stopped_at', sa.DateTime(timezone=True), nullable=True),
+    ]
+
+
+def drop_job_indexes() -> None:
+    op.drop_index('ix_job_state_status', table_name='job_state')
+    op.drop_index('ix_job_rest_user_name', table_name='job_rest')
+    op.drop_index('ix_job_rest_registered_at', table_name='job_rest')
+    op.drop_index('ix_job_rest_project_name', table_name='job_rest')
+    op.drop_index('ix_job_rest_result_hash', table_name='job_rest', postgresql_where=sa.text('result_hash IS NOT NULL'))
+
+
+def create_job_indexes() -> None:
+    op.create_index('ix_job_rest_result_hash', 'job_rest', ['result_hash'], unique=False, postgresql_where=sa.text('result_hash IS NOT NULL'))
+    op.create_index('ix_job_rest_project_name', 'job_rest', ['project_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'registered_at', 'user_name'])
+    op.create_index('ix_job_rest_registered_at', 'job_rest', ['registered_at'], unique=False)
+    op.create_index('ix_job_rest_user_name', 'job_rest', ['user_name'], unique=False, postgresql_include=['job_id', 'job_name', 'workflow_type', 'registered_at', 'project_name'])
+    op.create_index('ix_job_state_status', 'job_state', ['status'], unique=False)
+
+
+def set_aside_job_tables(suffix: str) -> None:
+    op.drop_constraint('job_state_job_id_fkey' if suffix == 'unpartitioned' else 'job_state_job_id_registered_at_fkey', 'job_state', type_='foreignkey')
+    drop_job_indexes()
+    for table in ('job_rest', 'job_state'):
+        op.rename_table(table, f'{table}_{suffix}')
+        op.execute(f'ALTER TABLE {table}_{suffix} RENAME CONSTRAINT {table}_pkey TO {table}_{suffix}_pkey')
+
+
+def upgrade() -> None:
+    op.drop_constraint('job_outbox_job_id_fkey', 'job_outbox', type_='foreignkey')
+    set_aside_job_tables('unpartitioned')
+
+    op.create_table('job_rest',
+    *job_rest_columns(),
+    sa.PrimaryKeyConstraint('job_id', 'registered_at'),
+    postgresql_partition_by='RANGE (registered_at)'
+    )
+    op.create_table('job_state',
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('registered_at', sa.DateTime(timezone=True), nullable=False),
+    *job_state_columns(),
+    sa.ForeignKeyConstraint(['job_id', 'registered_at'], ['job_rest.job_id', 'job_rest.registered_at'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'registered_at'),
+    postgresql_partition_by='RANGE (registered_at)'
+    )
+
+    # A partition per month (in UTC) from the first registered job up to a few months ahead,
+    # omotes-rest creates the partitions of later months.
+    op.execute('CREATE TABLE job_rest_default PARTITION OF job_rest DEFAULT')
+    op.execute('CREATE TABLE job_state_default PARTITION OF job_state DEFAULT WITH (fillfactor = 50)')
+    months = op.get_bind().execute(sa.text(
+        "SELECT generate_series("
+        "date_trunc('month', coalesce(min(registered_at), now()) AT TIME ZONE 'UTC'), "
+        f"date_trunc('month', (now() + interval '{PARTITIONS_MONTHS_AHEAD} months') AT TIME ZONE 'UTC'), "
+        "interval '1 month') FROM job_rest_unpartitioned"
+    )).scalars().all()
+    for month in months:
+        next_month = (month + timedelta(days=32)).replace(day=1)
+        for table, storage_parameters in (('job_rest', ''), ('job_state', ' WITH (fillfactor = 50)')):
+            op.execute(
+                f"CREATE TABLE {table}_p{month:%Y_%m} PARTITION OF {table} "
+                f"FOR VALUES FROM ('{month:%Y-%m-%d} 00:00+00') TO ('{next_month:%Y-%m-%d} 00:00+00'){storage_parameters}"
+            )
+
+    op.execute(f'INSERT INTO job_rest ({JOB_REST_COLUMNS}) SELECT {JOB_REST_COLUMNS} FROM job_rest_unpartitioned')
+    op.execute(
+        f'INSERT INTO job_state (registered_at, {JOB_STATE_COLUMNS}) '
+        f'SELECT job_rest.registered_at, job_state.{JOB_STATE_COLUMNS.replace(", ", ", job_state.")} '
+        'FROM job_state_unpartitioned AS job_state JOIN job_rest ON job_rest.job_id = job_state.job_id'
+    )
+    create_job_indexes()
+
+    op.add_column('job_outbox', sa.Column('registered_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute('UPDATE job_outbox SET registered_at = job_rest.registered_at FROM job_rest WHERE job_rest.job_id = job_outbox.job_id')
+    op.alter_column('job_outbox', 'registered_at', nullable=False)
+    op.create_foreign_key('job_outbox_job_id_registered_at_fkey', 'job_outbox', 'job_rest', ['job_id', 'registered_at'], ['job_id', 'registered_at'], ondelete='CASCADE')
+
+    op.drop_table('job_state_unpartitioned')
+    op.drop_table('job_rest_unpartitioned')
+
+
+def downgrade() -> None:
+    op.drop_constraint('job_outbox_job_id_registered_at_fkey', 'job_outbox', type_='foreignkey')
+    op.drop_column('job_outbox', 'registered_at')
+    set_aside_job_tables('partitioned')
+
+    op.create_table('job_rest',
+    *job_rest_columns(),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_table('job_state',
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    *job_state_columns(),
+    sa.ForeignKeyConstraint(['job_id'], ['job_rest.job_id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.execute('ALTER TABLE job_state SET (fillfactor = 50)')
+    op.execute(f'INSERT INTO job_rest ({JOB_REST_COLUMNS}) SELECT {JOB_REST_COLUMNS} FROM job_rest_partitioned')
+    op.execute(f'INSERT INTO job_state ({JOB_STATE_COLUMNS}) SELECT {JOB_STATE_COLUMNS} FROM job_state_partitioned')
+    create_job_indexes()
+    op.create_foreign_key('job_outbox_job_id_fkey', 'job_outbox', 'job_rest', ['job_id'], ['job_id'], ondelete='CASCADE')
+
+    op.drop_table('job_state_partitioned')
+    op.drop_table('job_rest_partitioned')
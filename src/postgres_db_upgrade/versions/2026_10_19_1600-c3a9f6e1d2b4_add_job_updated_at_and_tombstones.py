@@ -0,0 +1,42 @@
+"""add job updated_at and tombstones
+
+Revision ID: c3a9f6e1d2b4
+Revises: 9b4e7d1c2f80
+Create Date: 2026-10-19 16:00:41.502377
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9f6e1d2b4'
+down_revision: Union[str, None] = '9b4e7d1c2f80'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('job_tombstone',
+    sa.Column('job_id', sa.UUID(), nullable=False),
+    sa.Column('user_name', sa.String(), nullable=False),
+    sa.Column('project_name', sa.String(), nullable=False),
+    sa.Column('deleted_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('job_id')
+    )
+    op.create_index('ix_job_tombstone_deleted_at', 'job_tombstone', ['deleted_at'], unique=False)
+
+    # The existing jobs were last updated when they were registered or changed status.
+    op.add_column('job_state', sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True))
+    op.execute('UPDATE job_state SET updated_at = coalesce(stopped_at, running_at, submitted_at, registered_at)')
+    op.alter_column('job_state', 'updated_at', nullable=False, server_default=sa.text('clock_timestamp()'))
+    op.create_index('ix_job_state_updated_at', 'job_state', ['updated_at'], unique=False, postgresql_using='brin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_state_updated_at', table_name='job_state', postgresql_using='brin')
+    op.drop_column('job_state', 'updated_at')
+    op.drop_index('ix_job_tombstone_deleted_at', table_name='job_tombstone')
+    op.drop_table('job_tombstone')
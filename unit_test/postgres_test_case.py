@@ -0,0 +1,74 @@
+import os
+import unittest
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import event, insert, text
+from sqlalchemy.engine import Engine
+
+from omotes_rest.config import PostgresConfig
+from omotes_rest.db_models.job_rest import Base, job_rest_table, job_state_table, split_job_columns
+from omotes_rest.job_partitions import add_months
+from omotes_rest.postgres_interface import PostgresInterface
+
+TEST_SCHEMA = "omotes_rest_unit_test"
+
+
+@unittest.skipUnless(
+    os.environ.get("TEST_POSTGRES_HOST"),
+    "Set TEST_POSTGRES_HOST (and other TEST_POSTGRES_* variables) to run PostgreSQL tests.",
+)
+class PostgresTestCase(unittest.TestCase):
+    """Test case with a PostgresInterface connected to a real PostgreSQL database.
+
+    All tables are created in a separate schema which is dropped after the tests, with the job
+    partitions of the current and next month.
+    """
+
+    driver: str | None = None
+    engine: Engine
+    postgres_if: PostgresInterface
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        config = PostgresConfig(prefix="TEST_")
+        if cls.driver:
+            config.driver = cls.driver
+        cls.postgres_if = PostgresInterface(config)
+        cls.postgres_if.start()
+        cls.engine = cls.postgres_if.engine
+
+        def set_search_path(dbapi_connection: Any, _: Any) -> None:
+            cursor = dbapi_connection.cursor()
+            cursor.execute(f"SET search_path TO {TEST_SCHEMA}")
+            cursor.close()
+
+        for engine in (cls.engine, cls.postgres_if.read_engine):
+            event.listen(engine, "connect", set_search_path)
+            # Connections opened by start() are pooled without the search path.
+            engine.dispose()
+
+        with cls.engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
+            conn.execute(text(f"CREATE SCHEMA {TEST_SCHEMA}"))
+        Base.metadata.create_all(cls.engine)
+        now = datetime.now(timezone.utc)
+        cls.postgres_if.create_job_partitions(now, add_months(now, 1))
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        with cls.engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {TEST_SCHEMA} CASCADE"))
+        cls.postgres_if.stop()
+
+    @classmethod
+    def vacuum_analyze(cls) -> None:
+        with cls.engine.connect() as conn:
+            conn.execution_options(isolation_level="AUTOCOMMIT").execute(text("VACUUM ANALYZE"))
+
+    @classmethod
+    def insert_jobs(cls, jobs: list[dict[str, Any]]) -> None:
+        job_rest_rows, job_state_rows = zip(*map(split_job_columns, jobs))
+        with cls.engine.begin() as conn:
+            conn.execute(insert(job_rest_table), list(job_rest_rows))
+            conn.execute(insert(job_state_table), list(job_state_rows))
@@ -0,0 +1,144 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from omotes_rest.bytes_lru_cache import BytesLRUCache, DiskBytesLRUCache
+
+
+class BytesLRUCacheTest(unittest.TestCase):
+    def test__put__least_recently_used_values_are_evicted(self) -> None:
+        # Arrange
+        cache: BytesLRUCache[str] = BytesLRUCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+
+        # Act
+        cache.put("c", b"cccc")
+
+        # Assert
+        self.assertEqual(cache.get("a"), b"aaaa")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), b"cccc")
+        self.assertEqual(cache.size_bytes, 8)
+
+    def test__put__too_large_value_is_not_cached(self) -> None:
+        # Arrange
+        cache: BytesLRUCache[str] = BytesLRUCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+
+        # Act
+        cache.put("b", b"b" * 11)
+
+        # Assert
+        self.assertEqual(cache.get("a"), b"aaaa")
+        self.assertIsNone(cache.get("b"))
+
+    def test__delete__value_is_removed(self) -> None:
+        # Arrange
+        cache: BytesLRUCache[str] = BytesLRUCache(max_bytes=10)
+        cache.put("a", b"aaaa")
+
+        # Act
+        cache.delete("a")
+
+        # Assert
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.size_bytes, 0)
+        self.assertEqual(len(cache), 0)
+
+
+class DiskBytesLRUCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.cache = DiskBytesLRUCache(self.temp_dir.name, max_bytes=10)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    def test__get__value_is_shared_between_caches(self) -> None:
+        # Arrange
+        other_cache = DiskBytesLRUCache(self.temp_dir.name, max_bytes=10)
+        self.cache.put("a", b"aaaa")
+
+        # Act
+        result = other_cache.get("a")
+
+        # Assert
+        self.assertEqual(result, b"aaaa")
+        self.assertEqual(other_cache.hits, 1)
+
+    def test__put__least_recently_used_values_are_evicted(self) -> None:
+        # Arrange
+        self.cache.put("a", b"aaaa")
+        self.cache.put("b", b"bbbb")
+        os.utime(self.cache._path("a"), ns=(0, 0))
+        os.utime(self.cache._path("b"), ns=(1, 1))
+
+        # Act
+        self.cache.put("c", b"cccc")
+
+        # Assert
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.get("b"), b"bbbb")
+        self.assertEqual(self.cache.get("c"), b"cccc")
+        self.assertEqual(self.cache.misses, 1)
+
+    def test__delete__value_is_removed(self) -> None:
+        # Arrange
+        other_cache = DiskBytesLRUCache(self.temp_dir.name, max_bytes=10)
+        self.cache.put("a", b"aaaa")
+
+        # Act
+        other_cache.delete("a")
+
+        # Assert
+        self.assertIsNone(self.cache.get("a"))
+
+    def test__put__directory_is_scanned_only_when_maximum_is_exceeded(self) -> None:
+        # Arrange
+        self.cache.put("a", b"aaaa")
+        os.utime(self.cache._path("a"), ns=(0, 0))
+
+        # Act
+        with patch("omotes_rest.bytes_lru_cache.os.scandir", wraps=os.scandir) as scandir:
+            self.cache.put("b", b"bbbb")
+            self.cache.put("b", b"bbb")
+            scans_below_maximum = scandir.call_count
+            self.cache.put("c", b"cccc")
+
+        # Assert
+        self.assertEqual(scans_below_maximum, 0)
+        self.assertEqual(scandir.call_count, 1)
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.size_bytes, 7)
+
+    def test__put__missing_index_is_rebuilt_from_directory(self) -> None:
+        # Arrange
+        self.cache.put("a", b"aaaa")
+        os.remove(os.path.join(self.temp_dir.name, ".size"))
+
+        # Act
+        self.cache.put("b", b"bb")
+
+        # Assert
+        self.assertEqual(self.cache.get("b"), b"bb")
+        self.assertEqual(self.cache.size_bytes, 6)
+        self.assertEqual(
+            sorted(os.listdir(self.temp_dir.name)),
+            sorted([".size"] + [os.path.basename(self.cache._path(key)) for key in "ab"]),
+        )
+
+    def test__delete__size_is_shared_between_caches(self) -> None:
+        # Arrange
+        other_cache = DiskBytesLRUCache(self.temp_dir.name, max_bytes=10)
+        self.cache.put("a", b"aaaa")
+        other_cache.delete("a")
+        other_cache.delete("a")
+
+        # Act
+        self.cache.put("b", b"bb")
+
+        # Assert
+        self.assertEqual(self.cache.size_bytes, 2)
@@ -0,0 +1,103 @@
+import gzip
+import unittest
+from unittest.mock import MagicMock, patch
+
+from flask import Flask, Response, jsonify
+
+from omotes_rest.compression import Compression
+
+
+def jsonify_data(app: Flask, data: str) -> bytes:
+    with app.app_context():
+        response_data: bytes = jsonify(data=data).get_data()
+    return response_data
+
+
+class CompressionTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.compression = Compression()
+        with patch.dict("os.environ", {"COMPRESSION_MIN_SIZE_BYTES": "100"}):
+            self.compression.init_app(self.app)
+        self.create_response = MagicMock(side_effect=lambda: jsonify(data="x" * 1000))
+
+        @self.app.route("/large")
+        def large() -> Response:
+            return jsonify(data="x" * 1000)
+
+        @self.app.route("/small")
+        def small() -> Response:
+            return jsonify(data="x")
+
+        @self.app.route("/immutable")
+        def immutable() -> Response:
+            return self.compression.immutable_json_response("key", self.create_response)
+
+        self.client = self.app.test_client()
+
+    def test__compress_response__large_response_is_compressed(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.client.get("/large", headers={"Accept-Encoding": "gzip, deflate"})
+
+        # Assert
+        self.assertEqual(result.headers["Content-Encoding"], "gzip")
+        self.assertEqual(result.headers["Vary"], "Accept-Encoding")
+        self.assertEqual(gzip.decompress(result.data), jsonify_data(self.app, "x" * 1000))
+
+    def test__compress_response__small_response_is_not_compressed(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertNotIn("Content-Encoding", result.headers)
+
+    def test__compress_response__not_compressed_if_not_accepted(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.client.get("/large", headers={"Accept-Encoding": "gzip;q=0, identity"})
+
+        # Assert
+        self.assertNotIn("Content-Encoding", result.headers)
+        self.assertEqual(result.headers["Vary"], "Accept-Encoding")
+
+    def test__immutable_json_response__compressed_once(self) -> None:
+        # Arrange
+        self.client.get("/immutable", headers={"Accept-Encoding": "gzip"})
+
+        # Act
+        result = self.client.get("/immutable", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.create_response.assert_called_once()
+        self.assertEqual(result.headers["Content-Encoding"], "gzip")
+        self.assertEqual(result.mimetype, "application/json")
+        self.assertEqual(gzip.decompress(result.data), jsonify_data(self.app, "x" * 1000))
+
+    def test__delete_immutable_response__compressed_again(self) -> None:
+        # Arrange
+        self.client.get("/immutable", headers={"Accept-Encoding": "gzip"})
+
+        # Act
+        self.compression.delete_immutable_response("key")
+        self.client.get("/immutable", headers={"Accept-Encoding": "gzip"})
+
+        # Assert
+        self.assertEqual(self.create_response.call_count, 2)
+        self.assertEqual(len(self.compression.precompressed_cache), 1)
+
+    def test__compression_enabled__case_insensitive(self) -> None:
+        # Arrange
+        app = Flask(__name__)
+        compression = Compression()
+
+        # Act
+        with patch.dict("os.environ", {"COMPRESSION_ENABLED": "True"}):
+            compression.init_app(app)
+
+        # Assert
+        self.assertIn(compression.compress_response, app.after_request_funcs[None])
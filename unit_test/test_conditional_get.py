@@ -0,0 +1,88 @@
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+from flask import Flask, Response, jsonify
+from flask_smorest import Blueprint
+
+from omotes_rest.apis.conditional_get import conditional_get
+from omotes_rest.apis.job_summary import JobVersion
+
+
+class ConditionalGetTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.version = JobVersion(
+            "3-1234", datetime(2026, 10, 19, 12, 0, 30, 500, tzinfo=timezone.utc)
+        )
+        self.view = MagicMock(side_effect=lambda: jsonify([]))
+        blueprint = Blueprint("test", "test")
+        self.app = Flask("test")
+        self.get = conditional_get(blueprint, lambda: self.version)(self.view)
+
+    def request(self, headers: dict[str, str]) -> Response:
+        with self.app.test_request_context(headers=headers):
+            response: Response = self.get()
+        return response
+
+    def test__conditional_get__without_conditions__response_with_validators(self) -> None:
+        # Arrange
+        headers: dict[str, str] = {}
+
+        # Act
+        response = self.request(headers)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers["ETag"], 'W/"3-1234"')
+        self.assertEqual(response.headers["Last-Modified"], "Mon, 19 Oct 2026 12:00:30 GMT")
+        self.view.assert_called_once()
+
+    def test__conditional_get__matching_etag__not_modified_without_view(self) -> None:
+        # Arrange
+        headers = {"If-None-Match": '"2-1000", W/"3-1234"'}
+
+        # Act
+        response = self.request(headers)
+
+        # Assert
+        self.assertEqual(response.status_code, 304)
+        self.view.assert_not_called()
+
+    def test__conditional_get__other_etag__modified_despite_modified_since(self) -> None:
+        # Arrange
+        headers = {
+            "If-None-Match": 'W/"2-1000"',
+            "If-Modified-Since": "Mon, 19 Oct 2026 12:00:30 GMT",
+        }
+
+        # Act
+        response = self.request(headers)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+
+    def test__conditional_get__modified_since__compared_in_seconds(self) -> None:
+        # Arrange
+        current_headers = {"If-Modified-Since": "Mon, 19 Oct 2026 12:00:30 GMT"}
+        earlier_headers = {"If-Modified-Since": "Mon, 19 Oct 2026 12:00:29 GMT"}
+
+        # Act
+        current_response = self.request(current_headers)
+        earlier_response = self.request(earlier_headers)
+
+        # Assert
+        self.assertEqual(current_response.status_code, 304)
+        self.assertEqual(earlier_response.status_code, 200)
+
+    def test__conditional_get__without_last_modified__only_etag_validates(self) -> None:
+        # Arrange
+        self.version = JobVersion("3-1234", None)
+        headers = {"If-Modified-Since": "Mon, 19 Oct 2026 12:00:30 GMT"}
+
+        # Act
+        response = self.request(headers)
+
+        # Assert
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response.headers)
+        self.assertEqual(response.headers["ETag"], 'W/"3-1234"')
@@ -0,0 +1,130 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+
+from flask import Flask
+from flask_smorest import Api, Blueprint
+
+from omotes_rest.apis.api_dataclasses import (
+    DurationPercentiles,
+    JobRestStatus,
+    JobResponse,
+    JobStatsResponse,
+    JobStatusBatchResponse,
+    JobStatusProgress,
+    JobStatusResponse,
+    JobSummary,
+)
+from omotes_rest.apis.dump_functions import compile_dump_function, fast_response
+from omotes_rest.db_models.job_rest import JobRest
+
+
+class CompileDumpFunctionTest(unittest.TestCase):
+    def test__compile_dump_function__job_equal_to_schema_dump(self) -> None:
+        # Arrange
+        now = datetime.now(timezone.utc)
+        job_fields: dict[str, Any] = {
+            "job_id": uuid.uuid4(),
+            "job_name": "job",
+            "workflow_type": "grow_optimizer_default",
+            "status": JobRestStatus.RUNNING,
+            "progress_fraction": 0.5,
+            "progress_message": "Running.",
+            "registered_at": now,
+            "submitted_at": now,
+            "running_at": now,
+            "stopped_at": None,
+            "timeout_after_s": 3600,
+            "user_name": "user",
+            "project_name": None,
+            "input_params_dict": {"key": [1, 2]},
+            "input_esdl": "input esdl",
+            "output_esdl": None,
+            "logs": None,
+            "esdl_feedback": {"general": ["message"]},
+            "job_priority": "medium",
+        }
+        job = JobRest(**job_fields)
+
+        for schema in [JobResponse.Schema(), JobSummary.Schema()]:
+            with self.subTest(schema=schema):
+                # Act
+                result = compile_dump_function(schema)(job)
+
+                # Assert
+                self.assertEqual(result, schema.dump(job))
+
+    def test__compile_dump_function__nested_equal_to_schema_dump(self) -> None:
+        # Arrange
+        cases = [
+            (
+                JobStatsResponse.Schema(),
+                JobStatsResponse(
+                    total_jobs=2,
+                    jobs_per_status={"RUNNING": 2},
+                    jobs_per_workflow_type={"grow_optimizer_default": 2},
+                    jobs_per_user={"user": 2},
+                    jobs_per_project={},
+                    queue_wait_s=DurationPercentiles(p50=1.0, p90=2.0, p99=None),
+                    run_time_s=DurationPercentiles(p50=None, p90=None, p99=None),
+                ),
+            ),
+            (
+                JobStatusBatchResponse.Schema(),
+                JobStatusBatchResponse(
+                    jobs=[
+                        JobStatusProgress(
+                            job_id=uuid.uuid4(),
+                            status=JobRestStatus.REGISTERED,
+                            progress_fraction=0,
+                            progress_message="Registered.",
+                        )
+                    ],
+                    unknown_job_ids=[uuid.uuid4()],
+                ),
+            ),
+        ]
+
+        for schema, obj in cases:
+            with self.subTest(schema=schema):
+                # Act
+                result = compile_dump_function(schema)(obj)
+
+                # Assert
+                self.assertEqual(result, schema.dump(obj))
+
+    def test__compile_dump_function__missing_attributes_are_left_out(self) -> None:
+        # Arrange
+        schema = JobResponse.Schema()
+
+        # Act
+        result = compile_dump_function(schema)(None)
+
+        # Assert
+        self.assertEqual(result, {})
+
+
+class FastResponseTest(unittest.TestCase):
+    def test__fast_response__response_is_dumped(self) -> None:
+        # Arrange
+        app = Flask(__name__)
+        app.config.update(API_TITLE="test", API_VERSION="v1", OPENAPI_VERSION="3.0.2")
+        blueprint = Blueprint("test", "test")
+        job_id = uuid.uuid4()
+
+        @blueprint.route("/status")
+        @fast_response(blueprint, 200, JobStatusResponse.Schema())
+        def get_status() -> JobStatusResponse:
+            return JobStatusResponse(job_id=job_id, status=JobRestStatus.SUCCEEDED)
+
+        api = Api(app)
+        api.register_blueprint(blueprint)
+
+        # Act
+        result = app.test_client().get("/status")
+
+        # Assert
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(result.json, {"job_id": str(job_id), "status": "SUCCEEDED"})
+        self.assertIn("200", api.spec.to_dict()["paths"]["/status"]["get"]["responses"])
@@ -0,0 +1,50 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+
+def modules_imported_by(module: str) -> set[str]:
+    """Import a module in a new interpreter and return all modules which are imported."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys; import {module}; print(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+        text=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+class ImportBudgetTest(unittest.TestCase):
+    def test__import_db_models__does_not_import_flask_or_sdk_interface(self) -> None:
+        # Arrange
+        heavy_modules = {
+            "flask",
+            "flask_smorest",
+            "omotes_sdk.omotes_interface",
+            "aio_pika",
+            "omotes_rest.rest_interface",
+        }
+
+        # Act
+        result = modules_imported_by("omotes_rest.db_models.job_rest")
+
+        # Assert
+        self.assertEqual(result & heavy_modules, set())
+
+    def test__import_package__imports_app_factory_on_first_use(self) -> None:
+        # Arrange
+
+        # Act
+        result = modules_imported_by("omotes_rest")
+
+        # Assert
+        self.assertIn("omotes_rest", result)
+        self.assertNotIn("omotes_rest.app_factory", result)
+        self.assertNotIn("sqlalchemy", result)
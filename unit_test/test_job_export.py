@@ -0,0 +1,96 @@
+import importlib.util
+import io
+import os
+import tempfile
+import unittest
+import uuid
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import orjson
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.job_export import main, write_ndjson, write_parquet
+
+COLUMNS = ("job_id", "status", "registered_at", "input_params_dict")
+JOB_ID = uuid.UUID("01a15193-6870-73d6-aba4-533bf8801dd0")
+REGISTERED_AT = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+ROWS = [
+    (JOB_ID, JobRestStatus.SUCCEEDED, REGISTERED_AT, {"horizon": 10}),
+    (JOB_ID, None, REGISTERED_AT, None),
+]
+
+
+class JobExportTest(unittest.TestCase):
+    def test__write_ndjson__object_per_line_and_part_per_chunk(self) -> None:
+        # Arrange
+        chunks = [ROWS[:1], ROWS[1:]]
+
+        # Act
+        parts = list(write_ndjson(COLUMNS, chunks))
+
+        # Assert
+        self.assertEqual(len(parts), 2)
+        self.assertEqual(
+            orjson.loads(parts[0]),
+            {
+                "job_id": str(JOB_ID),
+                "status": "SUCCEEDED",
+                "registered_at": "2026-10-19T12:00:00+00:00",
+                "input_params_dict": {"horizon": 10},
+            },
+        )
+        self.assertTrue(parts[1].endswith(b"\n"))
+
+    @unittest.skipUnless(importlib.util.find_spec("pyarrow"), "pyarrow is not installed.")
+    def test__write_parquet__row_group_per_chunk(self) -> None:
+        # Arrange
+        import pyarrow.parquet
+
+        chunks = [ROWS[:1], ROWS[1:]]
+
+        # Act
+        parts = list(write_parquet(COLUMNS, chunks))
+
+        # Assert
+        self.assertEqual(len(parts), 3)
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(b"".join(parts)))
+        self.assertEqual(parquet_file.num_row_groups, 2)
+        self.assertEqual(
+            parquet_file.read(use_threads=False).to_pylist(),
+            [
+                {
+                    "job_id": str(JOB_ID),
+                    "status": "SUCCEEDED",
+                    "registered_at": REGISTERED_AT,
+                    "input_params_dict": '{"horizon":10}',
+                },
+                {
+                    "job_id": str(JOB_ID),
+                    "status": None,
+                    "registered_at": REGISTERED_AT,
+                    "input_params_dict": None,
+                },
+            ],
+        )
+
+    def test__main__filters_and_writes_output_file(self) -> None:
+        # Arrange
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "jobs.ndjson")
+            with patch("omotes_rest.job_export.PostgresInterface") as postgres_if_class:
+                postgres_if = postgres_if_class.return_value
+                postgres_if.get_job_export_chunks.return_value = iter([ROWS])
+
+                # Act
+                main(["--output", output, "--status", "SUCCEEDED", "--user-name", "user"])
+
+            # Assert
+            with open(output, "rb") as file:
+                lines = file.read().splitlines()
+        query, columns, _ = postgres_if.get_job_export_chunks.call_args.args
+        self.assertEqual(query.status, JobRestStatus.SUCCEEDED)
+        self.assertEqual(query.user_name, "user")
+        self.assertNotIn("input_esdl", columns)
+        self.assertEqual(len(lines), 2)
+        postgres_if.stop.assert_called_once()
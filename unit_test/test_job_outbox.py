@@ -0,0 +1,50 @@
+import threading
+import unittest
+
+from omotes_rest.job_outbox import JobOutboxRelay
+
+
+class JobOutboxRelayTest(unittest.TestCase):
+    def test__job_outbox_relay__notify_relays_without_waiting_for_poll_interval(self) -> None:
+        # Arrange
+        batches_relayed = threading.Semaphore(0)
+
+        def relay_batch() -> int:
+            batches_relayed.release()
+            return 0
+
+        relay = JobOutboxRelay(relay_batch, batch_size=10, poll_interval_s=60)
+        relay.start()
+        self.assertTrue(batches_relayed.acquire(timeout=5))
+
+        # Act
+        relay.notify()
+        relayed_after_notify = batches_relayed.acquire(timeout=5)
+        relay.stop()
+
+        # Assert
+        self.assertTrue(relayed_after_notify)
+
+    def test__job_outbox_relay__continues_after_failed_batch(self) -> None:
+        # Arrange
+        batches_relayed = threading.Semaphore(0)
+        calls: list[int] = []
+
+        def relay_batch() -> int:
+            calls.append(1)
+            batches_relayed.release()
+            if len(calls) == 1:
+                raise ConnectionError("database unavailable")
+            return 0
+
+        relay = JobOutboxRelay(relay_batch, batch_size=10, poll_interval_s=0.01)
+
+        # Act
+        with self.assertLogs("omotes_rest", level="ERROR"):
+            relay.start()
+            batches_relayed.acquire(timeout=5)
+            relayed_again = batches_relayed.acquire(timeout=5)
+        relay.stop()
+
+        # Assert
+        self.assertTrue(relayed_again)
@@ -0,0 +1,41 @@
+import threading
+import unittest
+
+from omotes_rest.job_partition_maintenance import JobPartitionMaintainer
+
+
+class JobPartitionMaintainerTest(unittest.TestCase):
+    def test__job_partition_maintainer__maintains_each_interval_after_failure(self) -> None:
+        # Arrange
+        maintained = threading.Semaphore(0)
+        calls: list[int] = []
+
+        def maintain() -> None:
+            calls.append(1)
+            maintained.release()
+            if len(calls) == 1:
+                raise ConnectionError("database unavailable")
+
+        maintainer = JobPartitionMaintainer(maintain, interval_s=0.01)
+
+        # Act
+        with self.assertLogs("omotes_rest", level="ERROR"):
+            maintainer.start()
+            maintained.acquire(timeout=5)
+            maintained_again = maintained.acquire(timeout=5)
+        maintainer.stop()
+
+        # Assert
+        self.assertTrue(maintained_again)
+
+    def test__job_partition_maintainer__not_maintained_before_first_interval(self) -> None:
+        # Arrange
+        calls: list[int] = []
+        maintainer = JobPartitionMaintainer(lambda: calls.append(1), interval_s=60)
+
+        # Act
+        maintainer.start()
+        maintainer.stop()
+
+        # Assert
+        self.assertEqual(calls, [])
@@ -0,0 +1,73 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from omotes_rest.job_partitions import (
+    add_months,
+    job_id_registered_at,
+    month_start,
+    new_job_id,
+    parse_partition_name,
+    partition_name,
+)
+
+
+class JobIdTest(unittest.TestCase):
+    def test__new_job_id__registration_time_is_encoded(self) -> None:
+        # Arrange
+        registered_at = datetime(2026, 10, 19, 12, 30, 15, 123000, tzinfo=timezone.utc)
+
+        # Act
+        job_id = new_job_id(registered_at)
+
+        # Assert
+        self.assertEqual(job_id.version, 7)
+        self.assertEqual(job_id.variant, uuid.RFC_4122)
+        self.assertEqual(job_id_registered_at(job_id), registered_at)
+
+    def test__new_job_id__ids_are_ordered_by_registration_time(self) -> None:
+        # Arrange
+        earlier = datetime(2026, 1, 31, 23, 59, 59, tzinfo=timezone.utc)
+        later = datetime(2026, 2, 1, tzinfo=timezone.utc)
+
+        # Act
+        job_ids = [new_job_id(later), new_job_id(earlier)]
+
+        # Assert
+        self.assertEqual(sorted(job_ids), [job_ids[1], job_ids[0]])
+
+    def test__job_id_registered_at__random_job_id__no_registration_time(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+
+        # Act
+        registered_at = job_id_registered_at(job_id)
+
+        # Assert
+        self.assertIsNone(registered_at)
+
+
+class PartitionNameTest(unittest.TestCase):
+    def test__add_months__across_year_boundaries(self) -> None:
+        # Arrange
+        month = month_start(datetime(2026, 11, 30, 23, 0, tzinfo=timezone.utc))
+
+        # Act
+        next_year = add_months(month, 2)
+        previous_year = add_months(month, -11)
+
+        # Assert
+        self.assertEqual(next_year, datetime(2027, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(previous_year, datetime(2025, 12, 1, tzinfo=timezone.utc))
+
+    def test__parse_partition_name__inverse_of_partition_name(self) -> None:
+        # Arrange
+        month = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+        # Act
+        parsed = parse_partition_name(partition_name("job_state", month))
+
+        # Assert
+        self.assertEqual(parsed, ("job_state", month))
+        self.assertEqual(parse_partition_name("job_rest_default"), ("job_rest", None))
+        self.assertIsNone(parse_partition_name("job_outbox"))
@@ -0,0 +1,49 @@
+import unittest
+import uuid
+
+from omotes_rest.job_progress import JobProgressWriter
+
+
+class JobProgressWriterTest(unittest.TestCase):
+    def test__job_progress_writer__only_latest_progress_of_job_is_written(self) -> None:
+        # Arrange
+        batches: list[dict[uuid.UUID, tuple[float, str]]] = []
+        writer = JobProgressWriter(batches.append, flush_interval_s=60)
+        job_id = uuid.uuid4()
+        other_job_id = uuid.uuid4()
+
+        # Act
+        writer.put(job_id, 0.1, "first")
+        writer.put(other_job_id, 0.5, "other")
+        writer.put(job_id, 0.2, "second")
+        writer.flush()
+        writer.flush()
+
+        # Assert
+        self.assertEqual(batches, [{job_id: (0.2, "second"), other_job_id: (0.5, "other")}])
+
+    def test__job_progress_writer__failed_batch_is_written_with_next_batch(self) -> None:
+        # Arrange
+        batches: list[dict[uuid.UUID, tuple[float, str]]] = []
+
+        def write_batch(batch: dict[uuid.UUID, tuple[float, str]]) -> None:
+            if not batches:
+                batches.append({})
+                raise ConnectionError("database unavailable")
+            batches.append(batch)
+
+        writer = JobProgressWriter(write_batch, flush_interval_s=0.01)
+        job_id = uuid.uuid4()
+        other_job_id = uuid.uuid4()
+        writer.put(job_id, 0.1, "first")
+        writer.put(other_job_id, 0.5, "other")
+        with self.assertRaises(ConnectionError):
+            writer.flush()
+
+        # Act
+        writer.put(job_id, 0.2, "second")
+        writer.start()
+        writer.stop()
+
+        # Assert
+        self.assertEqual(batches[1:], [{job_id: (0.2, "second"), other_job_id: (0.5, "other")}])
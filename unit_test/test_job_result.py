@@ -0,0 +1,56 @@
+import io
+import threading
+import unittest
+
+from omotes_sdk_protocol.job_pb2 import JobResult
+
+from omotes_rest.job_result import InFlightBytesBudget, job_result_size, spill_job_result
+
+
+class InFlightBytesBudgetTest(unittest.TestCase):
+    def test__reserve__waits_until_budget_is_available(self) -> None:
+        # Arrange
+        budget = InFlightBytesBudget(max_bytes=100)
+        reserved = threading.Event()
+
+        def reserve_concurrently() -> None:
+            with budget.reserve(60):
+                reserved.set()
+
+        # Act
+        with budget.reserve(60):
+            concurrent_reserve = threading.Thread(target=reserve_concurrently)
+            concurrent_reserve.start()
+            reserved_while_in_flight = reserved.wait(timeout=0.1)
+        concurrent_reserve.join(timeout=5)
+
+        # Assert
+        self.assertFalse(reserved_while_in_flight)
+        self.assertTrue(reserved.is_set())
+        self.assertEqual(budget.in_flight, 0)
+
+    def test__reserve__result_larger_than_budget_when_none_in_flight(self) -> None:
+        # Arrange
+        budget = InFlightBytesBudget(max_bytes=100)
+
+        # Act
+        with budget.reserve(1000):
+            in_flight = budget.in_flight
+
+        # Assert
+        self.assertEqual(in_flight, 1000)
+        self.assertEqual(budget.in_flight, 0)
+
+
+class SpillJobResultTest(unittest.TestCase):
+    def test__spill_job_result__copy_text_row_with_escaped_values(self) -> None:
+        # Arrange
+        result = JobResult(output_esdl="a\tb\\c\r\në", logs="log\n")
+        file = io.BytesIO()
+
+        # Act
+        spill_job_result(result, file)
+
+        # Assert
+        self.assertEqual(file.getvalue(), "a\\tb\\\\c\\r\\në\tlog\\n\n".encode("utf-8"))
+        self.assertEqual(job_result_size(result), 12)
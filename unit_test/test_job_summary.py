@@ -0,0 +1,44 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus, JobSummary
+from omotes_rest.apis.job_summary import JobSummaryRecord, dump_job_summaries
+
+
+class DumpJobSummariesTest(unittest.TestCase):
+    def test__dump_job_summaries__equal_to_schema_dump(self) -> None:
+        # Arrange
+        now = datetime.now(timezone.utc)
+        job_summaries = [
+            JobSummaryRecord(
+                job_id=uuid.uuid4(),
+                job_name="job",
+                workflow_type="grow_optimizer_default",
+                status=JobRestStatus.SUCCEEDED,
+                progress_fraction=1.0,
+                registered_at=now,
+                running_at=now,
+                stopped_at=now,
+                user_name="user",
+                project_name="project",
+            ),
+            JobSummaryRecord(
+                job_id=uuid.uuid4(),
+                job_name=None,
+                workflow_type="grow_optimizer_default",
+                status=JobRestStatus.REGISTERED,
+                progress_fraction=0,
+                registered_at=now,
+                running_at=None,
+                stopped_at=None,
+                user_name=None,
+                project_name=None,
+            ),
+        ]
+
+        # Act
+        result = dump_job_summaries(job_summaries)
+
+        # Assert
+        self.assertEqual(result, JobSummary.Schema(many=True).dump(job_summaries))
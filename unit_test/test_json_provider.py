@@ -0,0 +1,70 @@
+import decimal
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from flask import Flask
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus, JobStatusResponse
+from omotes_rest.json_provider import OrjsonProvider
+
+
+class OrjsonProviderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.app = Flask(__name__)
+        self.app.json = OrjsonProvider(self.app)
+
+    def test__dumps__native_types_are_serialized(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        registered_at = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+        # Act
+        result = self.app.json.dumps(
+            {"status": JobRestStatus.RUNNING, "job_id": job_id, "registered_at": registered_at}
+        )
+
+        # Assert
+        self.assertEqual(
+            result,
+            f'{{"job_id":"{job_id}","registered_at":"2024-01-02T03:04:05+00:00",'
+            f'"status":"running"}}',
+        )
+
+    def test__response__dataclass_is_serialized(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+
+        # Act
+        with self.app.app_context():
+            result = self.app.json.response(
+                JobStatusResponse(job_id=job_id, status=JobRestStatus.SUCCEEDED)
+            )
+
+        # Assert
+        self.assertEqual(result.mimetype, "application/json")
+        self.assertEqual(
+            self.app.json.loads(result.get_data()),
+            {"job_id": str(job_id), "status": "succeeded"},
+        )
+
+    def test__response__indented_in_debug_mode(self) -> None:
+        # Arrange
+        self.app.debug = True
+
+        # Act
+        with self.app.app_context():
+            result = self.app.json.response({"b": 1, "a": "é"})
+
+        # Assert
+        self.assertEqual(result.get_data(as_text=True), '{\n  "a": "é",\n  "b": 1\n}\n')
+
+    def test__dumps__decimal_is_serialized_as_string(self) -> None:
+        # Arrange
+        value = decimal.Decimal("0.25")
+
+        # Act
+        result = self.app.json.dumps({"fraction": value})
+
+        # Assert
+        self.assertEqual(result, '{"fraction":"0.25"}')
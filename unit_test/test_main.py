@@ -1,4 +1,6 @@
 import unittest
+from unittest.mock import patch
+
 from omotes_rest.config import PostgresConfig
 
 
@@ -11,3 +13,33 @@ class MyTest(unittest.TestCase):
 
         # Assert
         self.assertIsNotNone(result)
+
+    def test__construct_postgres_config__pools_and_overflow_within_budget(self) -> None:
+        # Arrange
+        environ = {"POSTGRES_MAX_CONNECTIONS": "40", "GUNICORN_WORKERS": "1"}
+
+        # Act
+        with patch.dict("os.environ", environ):
+            result = PostgresConfig()
+
+        # Assert
+        self.assertEqual(
+            (result.pool_size, result.read_pool_size, result.max_overflow), (20, 10, 5)
+        )
+        self.assertEqual(result.pool_size + result.read_pool_size + 2 * result.max_overflow, 40)
+
+    def test__construct_postgres_config__pools_divided_over_workers(self) -> None:
+        # Arrange
+        environ = {"POSTGRES_MAX_CONNECTIONS": "40", "GUNICORN_WORKERS": "4"}
+
+        # Act
+        with patch.dict("os.environ", environ):
+            result = PostgresConfig()
+        with patch.dict("os.environ", environ | {"POSTGRES_READ_POOL_SIZE": "5"}):
+            explicit = PostgresConfig()
+
+        # Assert
+        self.assertEqual((result.pool_size, result.read_pool_size, result.max_overflow), (6, 2, 1))
+        self.assertEqual(
+            (explicit.pool_size, explicit.read_pool_size, explicit.max_overflow), (3, 5, 1)
+        )
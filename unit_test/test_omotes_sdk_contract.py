@@ -0,0 +1,97 @@
+import unittest
+import uuid
+from datetime import timedelta
+from typing import Any
+from unittest.mock import MagicMock, _Call, patch
+
+from omotes_sdk.omotes_interface import OmotesInterface, UnknownWorkflowException
+from omotes_sdk.workflow_type import WorkflowType, WorkflowTypeManager
+from omotes_sdk_protocol.job_pb2 import JobSubmission
+
+from omotes_rest.db_models.job_rest import JobRest
+from omotes_rest.rest_interface import RestInterface
+
+
+def comparable_call(mock_call: _Call) -> tuple[str, dict[str, Any]]:
+    """Replace the callbacks bound to a new handler object by the method and handler fields."""
+    name, _, kwargs = mock_call
+    callback = kwargs.get("callback_on_message")
+    if callback is not None:
+        kwargs = kwargs | {"callback_on_message": (callback.__name__, vars(callback.__self__))}
+    return name, kwargs
+
+
+class OmotesSdkContractTest(unittest.TestCase):
+    """Check `RestInterface.publish_job` against the real `OmotesInterface` of the pinned SDK.
+
+    `publish_job` repeats the steps of `OmotesInterface.submit_job` with its own job id.
+    """
+
+    def setUp(self) -> None:
+        with (
+            patch("omotes_rest.rest_interface.OmotesInterface"),
+            patch("omotes_rest.rest_interface.PostgresInterface"),
+        ):
+            self.rest_if = RestInterface()
+        with patch("omotes_sdk.omotes_interface.BrokerInterface"):
+            self.omotes_if = OmotesInterface(MagicMock(), client_id="test")
+        self.broker_if = MagicMock()
+        self.omotes_if.broker_if = self.broker_if
+        self.workflow_type = WorkflowType(
+            workflow_type_name="workflow", workflow_type_description_name="Workflow"
+        )
+        self.omotes_if.workflow_type_manager = WorkflowTypeManager([self.workflow_type])
+        self.rest_if.omotes_if = self.omotes_if
+
+    def test__publish_job__same_broker_calls_as_sdk_submit_job(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        with patch("omotes_sdk.omotes_interface.uuid") as sdk_uuid:
+            sdk_uuid.uuid4.return_value = job_id
+            self.omotes_if.submit_job(
+                esdl="esdl",
+                params_dict={},
+                workflow_type=self.workflow_type,
+                job_timeout=timedelta(seconds=60),
+                callback_on_finished=self.rest_if.handle_on_job_finished,
+                callback_on_progress_update=self.rest_if.handle_on_job_progress_update,
+                callback_on_status_update=self.rest_if.handle_on_job_status_update,
+                auto_disconnect_on_result=True,
+                job_reference="job",
+                job_priority=JobSubmission.JobPriority.HIGH,
+            )
+        sdk_calls = list(map(comparable_call, self.broker_if.mock_calls))
+        self.broker_if.reset_mock()
+
+        # Act
+        self.rest_if.publish_job(
+            JobRest(
+                job_id=job_id,
+                job_name="job",
+                workflow_type="workflow",
+                job_priority="high",
+                timeout_after_s=60,
+                input_params_dict={},
+                input_esdl="esdl",
+            )
+        )
+
+        # Assert
+        self.assertEqual(list(map(comparable_call, self.broker_if.mock_calls)), sdk_calls)
+
+    def test__publish_job__unknown_workflow_is_rejected_like_sdk(self) -> None:
+        # Arrange
+        job_rest = JobRest(
+            job_id=uuid.uuid4(),
+            job_name="job",
+            workflow_type="unknown",
+            job_priority="medium",
+            timeout_after_s=60,
+            input_params_dict={},
+            input_esdl="esdl",
+        )
+
+        # Act / Assert
+        with self.assertRaises(UnknownWorkflowException):
+            self.rest_if.publish_job(job_rest)
+        self.assertEqual(self.broker_if.mock_calls, [])
@@ -0,0 +1,91 @@
+import tempfile
+import uuid
+
+from omotes_sdk_protocol.job_pb2 import JobResult
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.job_partitions import job_id_registered_at, new_job_id
+from omotes_rest.job_result import spill_job_result
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresDriverTest(PostgresTestCase):
+    def insert_running_jobs(self, number_of_jobs: int) -> list[uuid.UUID]:
+        job_ids = [new_job_id() for _ in range(number_of_jobs)]
+        self.insert_jobs(
+            [
+                dict(
+                    job_id=job_id,
+                    job_name="running job",
+                    registered_at=job_id_registered_at(job_id),
+                    status=JobRestStatus.RUNNING,
+                    progress_fraction=0.0,
+                    progress_message="started",
+                    user_name="user",
+                    project_name="project",
+                    input_esdl="esdl",
+                )
+                for job_id in job_ids
+            ]
+        )
+        return job_ids
+
+    def test__set_jobs_progress__progress_of_each_job_is_set(self) -> None:
+        # Arrange
+        job_ids = self.insert_running_jobs(3)
+
+        # Act
+        self.postgres_if.set_jobs_progress(
+            {job_id: (0.5 + i / 10, f"step {i}") for i, job_id in enumerate(job_ids)}
+        )
+
+        # Assert
+        job_statuses = {
+            job_status.job_id: job_status
+            for job_status in self.postgres_if.get_job_statuses(job_ids)
+        }
+        for i, job_id in enumerate(job_ids):
+            self.assertEqual(job_statuses[job_id].progress_fraction, 0.5 + i / 10)
+            self.assertEqual(job_statuses[job_id].progress_message, f"step {i}")
+
+    def test__get_job_output_esdl__large_esdl_is_read_intact(self) -> None:
+        # Arrange
+        [job_id] = self.insert_running_jobs(1)
+        output_esdl = "<esdl name='Grøningen \\ 😀'>\n" * 100_000
+
+        # Act
+        self.postgres_if.set_job_stopped(
+            job_id, JobRestStatus.SUCCEEDED, logs="logs", output_esdl=output_esdl
+        )
+
+        # Assert
+        self.assertEqual(self.postgres_if.get_job_output_esdl(job_id), output_esdl)
+        self.assertEqual(self.postgres_if.get_job_logs(job_id), "logs")
+        self.assertEqual(self.postgres_if.get_job_status(job_id), JobRestStatus.SUCCEEDED)
+
+    def test__set_job_stopped_with_result_file__result_is_copied_to_job(self) -> None:
+        # Arrange
+        (job_id,) = self.insert_running_jobs(1)
+        output_esdl = "<esdl name='Tëst'>\n\tC:\\path\r\n</esdl>"
+        result = JobResult(output_esdl=output_esdl, logs="line 1\nline 2")
+
+        # Act
+        with tempfile.TemporaryFile() as result_file:
+            spill_job_result(result, result_file)
+            result_file.seek(0)
+            self.postgres_if.set_job_stopped_with_result_file(
+                job_id, JobRestStatus.SUCCEEDED, result_file, {"general": []}
+            )
+
+        # Assert
+        job = self.postgres_if.get_job(job_id)
+        assert job is not None
+        self.assertEqual(job.status, JobRestStatus.SUCCEEDED)
+        self.assertEqual(job.output_esdl, output_esdl)
+        self.assertEqual(job.logs, "line 1\nline 2")
+        self.assertEqual(job.esdl_feedback, {"general": []})
+
+
+class PsycopgDriverTest(PostgresDriverTest):
+    driver = "psycopg"
@@ -0,0 +1,215 @@
+import unittest
+import uuid
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.pool import StaticPool
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.config import JobOutboxConfig, PostgresConfig
+from omotes_rest.db_models.job_rest import Base, JobOutbox, JobRest
+from omotes_rest.postgres_interface import PostgresInterface, Session, session_scope
+
+
+class PostgresInterfaceTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        Session.configure(bind=self.engine)
+        self.postgres_if = PostgresInterface(PostgresConfig())
+        self.postgres_if.engine = self.engine
+        self.postgres_if.read_engine = self.engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def _put_succeeded_job(self, result_hash: str) -> uuid.UUID:
+        job_id = uuid.uuid4()
+        self.postgres_if.put_new_job(
+            job_id, JobInput(job_priority="medium"), result_hash=result_hash
+        )
+        self.postgres_if.set_job_stopped(
+            job_id,
+            JobRestStatus.SUCCEEDED,
+            logs="some logs",
+            output_esdl="output esdl",
+            esdl_feedback={"general": []},
+        )
+        return job_id
+
+    def test__check_server_version__older_version_is_warned(self) -> None:
+        # Arrange
+
+        # Act
+        with (
+            patch("omotes_rest.postgres_interface.MIN_SERVER_VERSION", (99,)),
+            self.assertLogs("omotes_rest", level="WARNING") as logs,
+        ):
+            self.postgres_if._check_server_version()
+
+        # Assert
+        self.assertIn("older than the minimum version 99", logs.output[0])
+
+    def test__get_cached_result_job_id__succeeded_job_is_found(self) -> None:
+        # Arrange
+        job_id = self._put_succeeded_job("hash")
+
+        # Act
+        result = self.postgres_if.get_cached_result_job_id(
+            "hash", datetime.now() - timedelta(hours=1)
+        )
+
+        # Assert
+        self.assertEqual(result, job_id)
+
+    def test__get_cached_result_job_id__expired_job_is_not_found(self) -> None:
+        # Arrange
+        self._put_succeeded_job("hash")
+
+        # Act
+        result = self.postgres_if.get_cached_result_job_id(
+            "hash", datetime.now() + timedelta(hours=1)
+        )
+
+        # Assert
+        self.assertIsNone(result)
+
+    def test__put_new_cached_job__result_is_copied(self) -> None:
+        # Arrange
+        cached_job_id = self._put_succeeded_job("hash")
+        job_id = uuid.uuid4()
+
+        # Act
+        inserted = self.postgres_if.put_new_cached_job(
+            job_id, JobInput(job_name="rerun", job_priority="low"), cached_job_id
+        )
+
+        # Assert
+        self.assertTrue(inserted)
+        job = self.postgres_if.get_job(job_id)
+        assert job is not None
+        self.assertEqual(job.job_name, "rerun")
+        self.assertEqual(job.status, JobRestStatus.SUCCEEDED)
+        self.assertEqual(job.output_esdl, "output esdl")
+        self.assertEqual(job.logs, "some logs")
+        self.assertEqual(job.cached_from_job_id, cached_job_id)
+        self.assertIsNone(job.result_hash)
+
+    def test__put_new_cached_job__missing_cached_job_is_not_inserted(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+
+        # Act
+        inserted = self.postgres_if.put_new_cached_job(
+            job_id, JobInput(job_priority="low"), uuid.uuid4()
+        )
+
+        # Assert
+        self.assertFalse(inserted)
+        self.assertIsNone(self.postgres_if.get_job(job_id))
+
+    def test__evict_result_cache__only_expired_jobs_are_evicted(self) -> None:
+        # Arrange
+        self._put_succeeded_job("hash")
+        running_job_id = uuid.uuid4()
+        self.postgres_if.put_new_job(
+            running_job_id, JobInput(job_priority="medium"), result_hash="hash"
+        )
+
+        # Act
+        evicted = self.postgres_if.evict_result_cache(datetime.now() + timedelta(seconds=1))
+
+        # Assert
+        self.assertEqual(evicted, 1)
+        running_job = self.postgres_if.get_job(running_job_id)
+        assert running_job is not None
+        self.assertEqual(running_job.result_hash, "hash")
+
+
+class PostgresInterfaceJobOutboxTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://", poolclass=StaticPool)
+        Base.metadata.create_all(self.engine)
+        Session.configure(bind=self.engine)
+        self.postgres_if = PostgresInterface(PostgresConfig())
+        self.postgres_if.engine = self.engine
+        self.postgres_if.read_engine = self.engine.execution_options(isolation_level="AUTOCOMMIT")
+        self.config = JobOutboxConfig()
+        self.job_id = uuid.uuid4()
+        self.postgres_if.put_new_job(self.job_id, JobInput(job_priority="medium"))
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def _get_outbox_entry(self) -> JobOutbox | None:
+        with session_scope(do_expunge=True) as session:
+            outbox_entry: JobOutbox | None = session.scalar(select(JobOutbox))
+        return outbox_entry
+
+    def test__relay_job_outbox__published_job_is_removed_from_outbox(self) -> None:
+        # Arrange
+        published_job_ids: list[uuid.UUID] = []
+
+        def publish_job(job: JobRest) -> None:
+            published_job_ids.append(job.job_id)
+
+        # Act
+        relayed = self.postgres_if.relay_job_outbox(self.config, publish_job)
+
+        # Assert
+        self.assertEqual(relayed, 1)
+        self.assertEqual(published_job_ids, [self.job_id])
+        self.assertIsNone(self._get_outbox_entry())
+
+    def test__relay_job_outbox__only_submission_columns_are_loaded(self) -> None:
+        # Arrange
+        loaded_input_esdls: list[str] = []
+
+        def publish_job(job: JobRest) -> None:
+            loaded_input_esdls.append(job.input_esdl)
+            job.output_esdl
+
+        # Act
+        with self.assertLogs("omotes_rest", level="WARNING"):
+            self.postgres_if.relay_job_outbox(self.config, publish_job)
+
+        # Assert
+        self.assertEqual(len(loaded_input_esdls), 1)
+        outbox_entry = self._get_outbox_entry()
+        assert outbox_entry is not None
+        self.assertIn("output_esdl", str(outbox_entry.last_error))
+
+    def test__relay_job_outbox__failed_publish_is_retried_after_backoff(self) -> None:
+        # Arrange
+        def publish_job(job: JobRest) -> None:
+            raise ConnectionError("broker unavailable")
+
+        # Act
+        with self.assertLogs("omotes_rest", level="WARNING"):
+            relayed = self.postgres_if.relay_job_outbox(self.config, publish_job)
+        relayed_again = self.postgres_if.relay_job_outbox(self.config, publish_job)
+
+        # Assert
+        self.assertEqual(relayed, 1)
+        self.assertEqual(relayed_again, 0)
+        outbox_entry = self._get_outbox_entry()
+        assert outbox_entry is not None
+        self.assertEqual(outbox_entry.attempts, 1)
+        self.assertEqual(outbox_entry.last_error, "broker unavailable")
+        self.assertGreater(outbox_entry.next_attempt_at, datetime.now())
+
+    def test__relay_job_outbox__job_stopped_after_max_attempts(self) -> None:
+        # Arrange
+        self.config.max_attempts = 1
+
+        def publish_job(job: JobRest) -> None:
+            raise ConnectionError("broker unavailable")
+
+        # Act
+        with self.assertLogs("omotes_rest", level="ERROR"):
+            self.postgres_if.relay_job_outbox(self.config, publish_job)
+
+        # Assert
+        self.assertIsNone(self._get_outbox_entry())
+        self.assertEqual(self.postgres_if.get_job_status(self.job_id), JobRestStatus.ERROR)
@@ -0,0 +1,98 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.apis.job_summary import ExpiredChangeCursorException
+from omotes_rest.job_partitions import new_job_id
+from omotes_rest.postgres_interface import PostgresInterface, change_cursor, session_scope
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobChangesTest(PostgresTestCase):
+    def setUp(self) -> None:
+        self.postgres_if.job_changes_config.settle_s = 0
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM job_rest"))
+            conn.execute(text("DELETE FROM job_tombstone"))
+
+    def put_new_job(self, user_name: str = "user", project_name: str = "project") -> uuid.UUID:
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(
+            job_id,
+            JobInput(job_priority="medium", user_name=user_name, project_name=project_name),
+        )
+        return job_id
+
+    def test__get_job_changes__without_cursor__all_jobs(self) -> None:
+        # Arrange
+        job_ids = [self.put_new_job(), self.put_new_job()]
+
+        # Act
+        changes = self.postgres_if.get_job_changes()
+
+        # Assert
+        self.assertCountEqual([job.job_id for job in changes.jobs], job_ids)
+        self.assertEqual(changes.deleted_job_ids, [])
+
+    def test__get_job_changes__only_jobs_updated_since_cursor(self) -> None:
+        # Arrange
+        updated_job_id = self.put_new_job()
+        self.put_new_job()
+        cursor = self.postgres_if.get_job_changes().cursor
+        self.postgres_if.set_job_progress(updated_job_id, 0.5, "Halfway.")
+        created_job_id = self.put_new_job()
+
+        # Act
+        changes = self.postgres_if.get_job_changes(cursor)
+
+        # Assert
+        self.assertCountEqual(
+            [job.job_id for job in changes.jobs], [updated_job_id, created_job_id]
+        )
+        self.assertEqual(
+            {job.job_id: job.progress_fraction for job in changes.jobs}[updated_job_id], 0.5
+        )
+        self.assertGreaterEqual(changes.cursor, cursor)
+
+    def test__get_job_changes__job_stopped_by_transaction_started_before_cursor(self) -> None:
+        # Arrange
+        job_id = self.put_new_job()
+        with session_scope() as session:
+            session.execute(text("SELECT 1"))
+            cursor = self.postgres_if.get_job_changes().cursor
+            PostgresInterface._update_job_stopped(
+                session, job_id, JobRestStatus.SUCCEEDED, {"logs": "logs"}
+            )
+
+        # Act
+        changes = self.postgres_if.get_job_changes(cursor)
+
+        # Assert
+        self.assertEqual([job.job_id for job in changes.jobs], [job_id])
+
+    def test__get_job_changes__deleted_job_of_user_is_tombstone(self) -> None:
+        # Arrange
+        deleted_job_id = self.put_new_job(user_name="user")
+        other_deleted_job_id = self.put_new_job(user_name="other user")
+        cursor = self.postgres_if.get_job_changes().cursor
+
+        # Act
+        self.postgres_if.delete_job(deleted_job_id)
+        self.postgres_if.delete_job(other_deleted_job_id)
+        changes = self.postgres_if.get_job_changes(cursor, user_name="user")
+
+        # Assert
+        self.assertEqual(changes.jobs, [])
+        self.assertEqual(changes.deleted_job_ids, [deleted_job_id])
+
+    def test__get_job_changes__cursor_older_than_tombstone_retention__expired(self) -> None:
+        # Arrange
+        self.postgres_if.job_changes_config.tombstone_retention_s = 3600
+        cursor = change_cursor(datetime(2026, 1, 1, tzinfo=timezone.utc))
+
+        # Act / Assert
+        with self.assertRaises(ExpiredChangeCursorException):
+            self.postgres_if.get_job_changes(cursor)
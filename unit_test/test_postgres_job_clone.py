@@ -0,0 +1,103 @@
+import uuid
+
+from sqlalchemy import select, text
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.db_models.job_rest import JobOutbox
+from omotes_rest.job_partitions import new_job_id
+from omotes_rest.rest_interface import compute_result_hash, result_hash_prefix
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobCloneTest(PostgresTestCase):
+    def setUp(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM job_rest"))
+
+    def put_source_job(self, input_esdl: str = "esdl") -> uuid.UUID:
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(
+            job_id,
+            JobInput(
+                job_name="source",
+                workflow_type="workflow",
+                job_priority="medium",
+                user_name="user",
+                input_esdl=input_esdl,
+                input_params_dict={"a": 1},
+                timeout_after_s=60,
+            ),
+        )
+        return job_id
+
+    def test__get_job_clone_source__input_without_esdl(self) -> None:
+        # Arrange
+        job_id = self.put_source_job()
+
+        # Act
+        source = self.postgres_if.get_job_clone_source(job_id)
+        missing = self.postgres_if.get_job_clone_source(new_job_id())
+
+        # Assert
+        assert source is not None
+        self.assertEqual(source.job_name, "source")
+        self.assertEqual(source.input_params_dict, {"a": 1})
+        self.assertEqual(source.timeout_after_s, 60)
+        self.assertEqual(source.input_esdl, "")
+        self.assertIsNone(missing)
+
+    def test__get_stored_esdl_result_hashes__equal_to_compute_result_hash(self) -> None:
+        # Arrange
+        input_esdl = "<esdl name='Tëst ☃'/>"
+        job_id = self.put_source_job(input_esdl)
+        params: list[dict] = [{"a": 1}, {"a": 2, "b": "ü"}]
+
+        # Act
+        result_hashes = self.postgres_if.get_stored_esdl_result_hashes(
+            job_id, [result_hash_prefix("workflow", p) for p in params]
+        )
+        missing = self.postgres_if.get_stored_esdl_result_hashes(
+            new_job_id(), [result_hash_prefix("workflow", params[0])]
+        )
+
+        # Assert
+        self.assertEqual(
+            result_hashes, [compute_result_hash("workflow", p, input_esdl) for p in params]
+        )
+        self.assertEqual(missing, [])
+
+    def test__put_cloned_jobs__input_esdl_copied_and_jobs_in_outbox(self) -> None:
+        # Arrange
+        source_job_id = self.put_source_job("large esdl")
+        clones = [
+            (new_job_id(), JobInput(job_name=f"clone {i}", job_priority="high"), None)
+            for i in range(2)
+        ]
+
+        # Act
+        inserted = self.postgres_if.put_cloned_jobs(source_job_id, clones)
+        not_inserted = self.postgres_if.put_cloned_jobs(
+            new_job_id(), [(new_job_id(), JobInput(job_priority="high"), None)]
+        )
+
+        # Assert
+        self.assertTrue(inserted)
+        self.assertFalse(not_inserted)
+        for job_id, _, _ in clones:
+            job = self.postgres_if.get_job(job_id)
+            assert job is not None
+            self.assertEqual(job.input_esdl, "large esdl")
+            self.assertEqual(job.job_priority, "high")
+            self.assertEqual(job.status, JobRestStatus.REGISTERED)
+        with self.engine.connect() as conn:
+            outbox_job_ids = set(
+                conn.scalars(
+                    select(JobOutbox.job_id).where(
+                        JobOutbox.job_id.in_([job_id for job_id, _, _ in clones])
+                    )
+                )
+            )
+            number_of_jobs = conn.scalar(text("SELECT count(*) FROM job_rest"))
+        self.assertEqual(outbox_job_ids, {job_id for job_id, _, _ in clones})
+        self.assertEqual(number_of_jobs, 3)
@@ -0,0 +1,76 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import orjson
+from sqlalchemy import text
+
+from omotes_rest.apis.api_dataclasses import JobExportQuery, JobInput, JobRestStatus
+from omotes_rest.apis.job_summary import JOB_EXPORT_COLUMNS
+from omotes_rest.config import JobExportConfig
+from omotes_rest.job_export import export_jobs
+from omotes_rest.job_partitions import new_job_id
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobExportTest(PostgresTestCase):
+    def setUp(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM job_rest"))
+
+    def put_new_job(self, user_name: str = "user") -> uuid.UUID:
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(
+            job_id,
+            JobInput(
+                job_priority="medium",
+                user_name=user_name,
+                input_esdl="esdl",
+                input_params_dict={"user": user_name},
+            ),
+        )
+        return job_id
+
+    def test__get_job_export_chunks__filtered_jobs_in_chunks(self) -> None:
+        # Arrange
+        job_ids = [self.put_new_job(), self.put_new_job(), self.put_new_job()]
+        self.put_new_job(user_name="other user")
+        self.postgres_if.set_job_stopped(job_ids[0], JobRestStatus.SUCCEEDED)
+        now = datetime.now(timezone.utc)
+        query = JobExportQuery(
+            user_name="user",
+            registered_after=now - timedelta(hours=1),
+            registered_before=now + timedelta(hours=1),
+        )
+
+        # Act
+        chunks = list(self.postgres_if.get_job_export_chunks(query, JOB_EXPORT_COLUMNS, 2))
+        succeeded_chunks = list(
+            self.postgres_if.get_job_export_chunks(
+                JobExportQuery(status=JobRestStatus.SUCCEEDED), ["job_id"], 2
+            )
+        )
+
+        # Assert
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual([row.job_id for chunk in chunks for row in chunk], job_ids)
+        self.assertEqual(chunks[0][0].input_params_dict, {"user": "user"})
+        self.assertEqual(succeeded_chunks, [[(job_ids[0],)]])
+
+    def test__export_jobs__esdl_only_if_requested(self) -> None:
+        # Arrange
+        self.put_new_job()
+        config = JobExportConfig()
+
+        # Act
+        without_esdl = orjson.loads(
+            b"".join(export_jobs(self.postgres_if, JobExportQuery(), config))
+        )
+        with_esdl = orjson.loads(
+            b"".join(export_jobs(self.postgres_if, JobExportQuery(include_esdl=True), config))
+        )
+
+        # Assert
+        self.assertNotIn("input_esdl", without_esdl)
+        self.assertEqual(with_esdl["input_esdl"], "esdl")
+        self.assertIsNone(with_esdl["output_esdl"])
@@ -0,0 +1,40 @@
+import threading
+import uuid
+
+from omotes_rest.apis.api_dataclasses import JobInput
+from omotes_rest.config import JobOutboxConfig
+from omotes_rest.db_models.job_rest import JobRest
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobOutboxTest(PostgresTestCase):
+    def test__relay_job_outbox__concurrent_relays_skip_locked_entries(self) -> None:
+        # Arrange
+        job_ids = {uuid.uuid4() for _ in range(3)}
+        for job_id in job_ids:
+            self.postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+        config = JobOutboxConfig()
+        published_job_ids: list[uuid.UUID] = []
+        concurrently_relayed: list[int] = []
+
+        def relay_concurrently() -> None:
+            concurrently_relayed.append(self.postgres_if.relay_job_outbox(config, lambda _: None))
+
+        def publish_job(job: JobRest) -> None:
+            if not concurrently_relayed:
+                concurrent_relay = threading.Thread(target=relay_concurrently)
+                concurrent_relay.start()
+                concurrent_relay.join()
+            published_job_ids.append(job.job_id)
+
+        # Act
+        config.batch_size = 2
+        relayed = self.postgres_if.relay_job_outbox(config, publish_job)
+
+        # Assert
+        self.assertEqual(relayed, 2)
+        self.assertEqual(concurrently_relayed, [1])
+        remaining = self.postgres_if.relay_job_outbox(config, publish_job)
+        self.assertEqual(remaining, 0)
+        self.assertEqual(len(set(published_job_ids)), 2)
@@ -0,0 +1,123 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.job_partitions import new_job_id
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobPartitionsTest(PostgresTestCase):
+    def partition_of_job(self, table: str, job_id: uuid.UUID) -> str | None:
+        with self.engine.connect() as conn:
+            partition: str | None = conn.scalar(
+                text(f"SELECT tableoid::regclass::text FROM {table} WHERE job_id = :job_id"),
+                {"job_id": job_id},
+            )
+        return partition
+
+    def table_exists(self, table: str) -> bool:
+        with self.engine.connect() as conn:
+            return conn.scalar(text("SELECT to_regclass(:table)"), {"table": table}) is not None
+
+    def insert_old_job(self, registered_at: datetime) -> uuid.UUID:
+        job_id = new_job_id(registered_at)
+        self.insert_jobs(
+            [
+                dict(
+                    job_id=job_id,
+                    job_name="old job",
+                    registered_at=registered_at,
+                    status=JobRestStatus.SUCCEEDED,
+                    progress_fraction=1.0,
+                    progress_message="done",
+                    user_name="user",
+                    project_name="project",
+                    input_esdl="esdl",
+                )
+            ]
+        )
+        return job_id
+
+    def test__create_job_partitions__creates_missing_partitions_once(self) -> None:
+        # Arrange
+        first_month = datetime(2030, 1, 15, tzinfo=timezone.utc)
+        last_month = datetime(2030, 2, 1, tzinfo=timezone.utc)
+
+        # Act
+        created = self.postgres_if.create_job_partitions(first_month, last_month)
+        created_again = self.postgres_if.create_job_partitions(first_month, last_month)
+
+        # Assert
+        self.assertEqual(
+            created,
+            ["job_rest_p2030_01", "job_state_p2030_01", "job_rest_p2030_02", "job_state_p2030_02"],
+        )
+        self.assertEqual(created_again, [])
+
+    def test__put_new_job__job_is_stored_in_partition_of_its_month(self) -> None:
+        # Arrange
+        job_id = new_job_id(datetime(2030, 1, 20, tzinfo=timezone.utc))
+        self.postgres_if.create_job_partitions(
+            datetime(2030, 1, 15, tzinfo=timezone.utc), datetime(2030, 1, 15, tzinfo=timezone.utc)
+        )
+
+        # Act
+        self.postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+
+        # Assert
+        self.assertEqual(self.partition_of_job("job_rest", job_id), "job_rest_p2030_01")
+        self.assertEqual(self.partition_of_job("job_state", job_id), "job_state_p2030_01")
+        job = self.postgres_if.get_job(job_id)
+        assert job is not None
+        self.assertEqual(job.registered_at, datetime(2030, 1, 20, tzinfo=timezone.utc))
+
+    def test__detach_job_partitions__jobs_of_month_are_detached(self) -> None:
+        # Arrange
+        self.postgres_if.create_job_partitions(
+            datetime(2020, 1, 15, tzinfo=timezone.utc), datetime(2020, 1, 15, tzinfo=timezone.utc)
+        )
+        job_id = self.insert_old_job(datetime(2020, 1, 15, tzinfo=timezone.utc))
+
+        # Act
+        detached = self.postgres_if.detach_job_partitions(datetime(2020, 2, 1, tzinfo=timezone.utc))
+
+        # Assert
+        self.assertEqual(detached, ["job_state_p2020_01", "job_rest_p2020_01"])
+        self.assertIsNone(self.partition_of_job("job_rest", job_id))
+        self.assertEqual(self.partition_of_job("job_rest_p2020_01", job_id), "job_rest_p2020_01")
+        self.assertEqual(self.partition_of_job("job_state_p2020_01", job_id), "job_state_p2020_01")
+
+    def test__detach_job_partitions__drop__partitions_are_dropped(self) -> None:
+        # Arrange
+        self.postgres_if.create_job_partitions(
+            datetime(2021, 1, 15, tzinfo=timezone.utc), datetime(2021, 1, 15, tzinfo=timezone.utc)
+        )
+        self.insert_old_job(datetime(2021, 1, 15, tzinfo=timezone.utc))
+
+        # Act
+        dropped = self.postgres_if.detach_job_partitions(
+            datetime(2021, 2, 1, tzinfo=timezone.utc), drop=True
+        )
+
+        # Assert
+        self.assertEqual(dropped, ["job_state_p2021_01", "job_rest_p2021_01"])
+        self.assertFalse(self.table_exists("job_rest_p2021_01"))
+        self.assertFalse(self.table_exists("job_state_p2021_01"))
+
+    def test__detach_job_partitions__job_in_outbox__month_is_skipped(self) -> None:
+        # Arrange
+        self.postgres_if.create_job_partitions(
+            datetime(2022, 1, 15, tzinfo=timezone.utc), datetime(2022, 1, 15, tzinfo=timezone.utc)
+        )
+        job_id = new_job_id(datetime(2022, 1, 15, tzinfo=timezone.utc))
+        self.postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+
+        # Act
+        detached = self.postgres_if.detach_job_partitions(datetime(2022, 2, 1, tzinfo=timezone.utc))
+
+        # Assert
+        self.assertEqual(detached, [])
+        self.assertEqual(self.partition_of_job("job_rest", job_id), "job_rest_p2022_01")
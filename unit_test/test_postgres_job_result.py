@@ -0,0 +1,73 @@
+import gc
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+from omotes_sdk_protocol.job_pb2 import JobResult
+from sqlalchemy import func, select
+
+from omotes_rest.apis.api_dataclasses import JobInput, JobRestStatus
+from omotes_rest.db_models.job_rest import job_rest_table
+from omotes_rest.job_partitions import new_job_id
+from omotes_rest.rest_interface import RestInterface
+
+from postgres_test_case import PostgresTestCase
+
+RESULT_SIZE = 200 * 2**20
+
+
+def reset_peak_rss() -> None:
+    with open("/proc/self/clear_refs", "w") as file:
+        file.write("5")
+
+
+def peak_rss_bytes() -> int:
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    raise RuntimeError("No peak resident set size in /proc/self/status")
+
+
+@unittest.skipUnless(sys.platform == "linux", "Resetting the peak RSS is only supported on Linux.")
+class PostgresJobResultTest(PostgresTestCase):
+    def setUp(self) -> None:
+        with (
+            patch("omotes_rest.rest_interface.OmotesInterface"),
+            patch("omotes_rest.rest_interface.PostgresInterface"),
+        ):
+            self.rest_if = RestInterface()
+        self.rest_if.postgres_if = self.postgres_if
+
+    def test__handle_on_job_finished__large_result_peak_rss_below_two_and_a_half_results(
+        self,
+    ) -> None:
+        # Arrange
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+        serialized_result = JobResult(
+            result_type=JobResult.ResultType.SUCCEEDED,
+            output_esdl="<esdl>" + "x" * RESULT_SIZE + "</esdl>",
+            logs="log line\n" * 1000,
+        ).SerializeToString()
+        gc.collect()
+        reset_peak_rss()
+        baseline = peak_rss_bytes()
+
+        # Act
+        result = JobResult.FromString(serialized_result)
+        self.rest_if.handle_on_job_finished(MagicMock(id=job_id), result)
+
+        # Assert
+        # The parsed message and the output ESDL decoded from it are each held once, writing the
+        # result as statement parameters peaks at four times the result.
+        peak_growth = peak_rss_bytes() - baseline
+        self.assertLess(peak_growth, 2.5 * RESULT_SIZE)
+        self.assertEqual(self.postgres_if.get_job_status(job_id), JobRestStatus.SUCCEEDED)
+        with self.engine.connect() as conn:
+            output_esdl_length = conn.scalar(
+                select(func.length(job_rest_table.c.output_esdl)).where(
+                    job_rest_table.c.job_id == job_id
+                )
+            )
+        self.assertEqual(output_esdl_length, RESULT_SIZE + 13)
@@ -0,0 +1,53 @@
+from sqlalchemy import text, update
+
+from omotes_rest.apis.api_dataclasses import JobInput
+from omotes_rest.db_models.job_rest import JOB_STATE_FILLFACTOR, JobState
+from omotes_rest.job_partitions import job_id_registered_at, month_start, new_job_id, partition_name
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobStateTest(PostgresTestCase):
+    def test__job_state_partitions__created_with_low_fillfactor(self) -> None:
+        # Arrange
+
+        # Act
+        with self.engine.connect() as conn:
+            reloptions = conn.scalars(
+                text(
+                    "SELECT reloptions FROM pg_class JOIN pg_inherits ON inhrelid = pg_class.oid "
+                    "WHERE inhparent = 'job_state'::regclass"
+                )
+            ).all()
+
+        # Assert
+        self.assertEqual(len(reloptions), 3)
+        for partition_reloptions in reloptions:
+            self.assertEqual(partition_reloptions, [f"fillfactor={JOB_STATE_FILLFACTOR}"])
+
+    def test__job_state__progress_updates_are_hot_updates(self) -> None:
+        # Arrange
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(job_id, JobInput(job_priority="medium"))
+        registered_at = job_id_registered_at(job_id)
+        assert registered_at is not None
+        partition = partition_name("job_state", month_start(registered_at))
+
+        # Act
+        with self.engine.begin() as conn:
+            for step in range(50):
+                conn.execute(
+                    update(JobState)
+                    .where(JobState.job_id == job_id)
+                    .values(progress_fraction=step / 50, progress_message=f"Step {step}.")
+                )
+            updates = conn.execute(
+                text(
+                    f"SELECT pg_stat_get_xact_tuples_updated('{partition}'::regclass),"
+                    f" pg_stat_get_xact_tuples_hot_updated('{partition}'::regclass)"
+                )
+            ).one()
+
+        # Assert
+        self.assertEqual(updates[0], 50)
+        self.assertEqual(updates[1], 50)
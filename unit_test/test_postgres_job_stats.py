@@ -0,0 +1,48 @@
+import uuid
+from datetime import datetime, timedelta
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobStatsTest(PostgresTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        now = datetime.now()
+        cls.insert_jobs(
+            [
+                dict(
+                    job_id=uuid.uuid4(),
+                    job_name=f"job {i}",
+                    workflow_type="workflow a" if i < 3 else "workflow b",
+                    status=JobRestStatus.SUCCEEDED if i < 4 else JobRestStatus.REGISTERED,
+                    progress_fraction=1.0,
+                    progress_message="done",
+                    registered_at=now,
+                    submitted_at=now if i < 4 else None,
+                    running_at=now + timedelta(seconds=i + 1) if i < 4 else None,
+                    stopped_at=now + timedelta(seconds=10 * (i + 1)) if i < 4 else None,
+                    user_name=f"user {i % 2}",
+                    project_name="project",
+                    input_esdl="esdl",
+                )
+                for i in range(5)
+            ]
+        )
+
+    def test__get_job_stats__counts_and_percentiles(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.postgres_if.get_job_stats()
+
+        # Assert
+        self.assertEqual(result.total_jobs, 5)
+        self.assertEqual(result.jobs_per_status, {"SUCCEEDED": 4, "REGISTERED": 1})
+        self.assertEqual(result.jobs_per_workflow_type, {"workflow a": 3, "workflow b": 2})
+        self.assertEqual(result.jobs_per_user, {"user 0": 3, "user 1": 2})
+        self.assertEqual(result.jobs_per_project, {"project": 5})
+        self.assertEqual(result.queue_wait_s.p50, 2.5)
+        self.assertEqual(result.run_time_s.p50, 22.5)
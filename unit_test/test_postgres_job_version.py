@@ -0,0 +1,55 @@
+import uuid
+
+from sqlalchemy import text
+
+from omotes_rest.apis.api_dataclasses import JobInput
+from omotes_rest.job_partitions import new_job_id
+
+from postgres_test_case import PostgresTestCase
+
+
+class PostgresJobVersionTest(PostgresTestCase):
+    def setUp(self) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(text("DELETE FROM job_rest"))
+
+    def put_new_job(self, user_name: str = "user") -> uuid.UUID:
+        job_id = new_job_id()
+        self.postgres_if.put_new_job(
+            job_id, JobInput(job_priority="medium", user_name=user_name, project_name="project")
+        )
+        return job_id
+
+    def test__get_job_version__changes_with_progress(self) -> None:
+        # Arrange
+        job_id = self.put_new_job()
+        version = self.postgres_if.get_job_version(job_id)
+
+        # Act
+        unchanged_version = self.postgres_if.get_job_version(job_id)
+        self.postgres_if.set_job_progress(job_id, 0.5, "Halfway.")
+        changed_version = self.postgres_if.get_job_version(job_id)
+
+        # Assert
+        assert version is not None and changed_version is not None
+        self.assertEqual(unchanged_version, version)
+        self.assertNotEqual(changed_version.etag, version.etag)
+        self.assertIsNone(self.postgres_if.get_job_version(new_job_id()))
+
+    def test__get_jobs_version__changes_with_jobs_of_user(self) -> None:
+        # Arrange
+        job_id = self.put_new_job(user_name="user")
+        other_job_id = self.put_new_job(user_name="other user")
+        version = self.postgres_if.get_jobs_version(user_name="user")
+
+        # Act
+        self.postgres_if.set_job_progress(other_job_id, 0.5, "Halfway.")
+        other_user_changed_version = self.postgres_if.get_jobs_version(user_name="user")
+        self.postgres_if.delete_job(job_id)
+        deleted_version = self.postgres_if.get_jobs_version(user_name="user")
+
+        # Assert
+        self.assertEqual(other_user_changed_version, version)
+        self.assertEqual(deleted_version.etag, "0-0")
+        self.assertIsNone(deleted_version.last_modified)
+        self.assertNotEqual(self.postgres_if.get_jobs_version().etag, version.etag)
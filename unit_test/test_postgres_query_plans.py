@@ -0,0 +1,201 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import event, text
+
+from omotes_rest.apis.api_dataclasses import JobRestStatus
+from omotes_rest.job_partitions import job_id_registered_at, month_start, new_job_id, partition_name
+
+from postgres_test_case import PostgresTestCase
+
+
+def find_plan_nodes(plan: dict[str, Any]) -> list[dict[str, Any]]:
+    nodes = [plan]
+    for sub_plan in plan.get("Plans", []):
+        nodes.extend(find_plan_nodes(sub_plan))
+    return nodes
+
+
+class PostgresQueryPlansTest(PostgresTestCase):
+    """Check that every query path of the PostgresInterface is answered using an index.
+
+    Sequential scans are disabled so the planner uses an index whenever the query allows it,
+    regardless of the (small) amount of test data.
+    """
+
+    captured_statements: list[tuple[str, Any]]
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        now = datetime.now()
+        cls.insert_jobs(
+            [
+                dict(
+                    job_id=uuid.uuid4(),
+                    job_name=f"job {i}",
+                    workflow_type="grow_optimizer_default",
+                    status=JobRestStatus.SUCCEEDED,
+                    progress_fraction=1.0,
+                    progress_message="done",
+                    registered_at=now - timedelta(minutes=i),
+                    stopped_at=now - timedelta(minutes=i),
+                    user_name=f"user {i % 100}",
+                    project_name=f"project {i % 50}",
+                    input_esdl="esdl",
+                    result_hash=f"hash {i % 200}",
+                )
+                for i in range(5000)
+            ]
+        )
+        cls.vacuum_analyze()
+
+        cls.captured_statements = []
+
+        def capture_statement(
+            _: Any, __: Any, statement: str, parameters: Any, ___: Any, ____: Any
+        ) -> None:
+            cls.captured_statements.append((statement, parameters))
+
+        for engine in (cls.engine, cls.postgres_if.read_engine):
+            event.listen(engine, "before_cursor_execute", capture_statement)
+
+    def setUp(self) -> None:
+        self.captured_statements.clear()
+
+    def explain_captured_select(self) -> list[dict[str, Any]]:
+        statement, parameters = next(
+            (statement, parameters)
+            for statement, parameters in self.captured_statements
+            if statement.lstrip().upper().startswith("SELECT")
+        )
+        with self.engine.connect() as conn:
+            cursor = conn.connection.dbapi_connection.cursor()  # type: ignore[union-attr]
+            cursor.execute("SET enable_seqscan = off")
+            cursor.execute("SET enable_bitmapscan = off")
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+            row = cursor.fetchone()
+            cursor.close()
+            conn.rollback()
+        assert row is not None
+        plan = json.loads(row[0]) if isinstance(row[0], str) else row[0]
+        return find_plan_nodes(plan[0]["Plan"])
+
+    def assert_index_used(
+        self, nodes: list[dict[str, Any]], index_name: str, index_only: bool = False
+    ) -> None:
+        with self.engine.connect() as conn:
+            parent_index_names = {
+                child: parent
+                for child, parent in conn.execute(
+                    text(
+                        "SELECT child.relname, parent.relname FROM pg_inherits "
+                        "JOIN pg_class AS child ON child.oid = inhrelid "
+                        "JOIN pg_class AS parent ON parent.oid = inhparent "
+                        "WHERE child.relkind = 'i'"
+                    )
+                )
+            }
+        node_types = {"Index Only Scan"} if index_only else {"Index Scan", "Index Only Scan"}
+        self.assertTrue(
+            any(
+                node["Node Type"] in node_types
+                and parent_index_names.get(node.get("Index Name"), node.get("Index Name"))
+                == index_name
+                for node in nodes
+            ),
+            f"Expected {node_types} on {index_name} but the plan was {nodes}",
+        )
+
+    def assert_only_partitions_scanned(
+        self, nodes: list[dict[str, Any]], job_id: uuid.UUID, tables: list[str]
+    ) -> None:
+        registered_at = job_id_registered_at(job_id)
+        assert registered_at is not None
+        self.assertEqual(
+            {node["Relation Name"] for node in nodes if "Relation Name" in node},
+            {partition_name(table, month_start(registered_at)) for table in tables},
+        )
+
+    def test__get_jobs_from_user__index_only_scan(self) -> None:
+        # Arrange
+
+        # Act
+        self.postgres_if.get_jobs_from_user("user 1")
+
+        # Assert
+        self.assert_index_used(
+            self.explain_captured_select(), "ix_job_rest_user_name", index_only=True
+        )
+
+    def test__get_jobs_from_project__index_only_scan(self) -> None:
+        # Arrange
+
+        # Act
+        self.postgres_if.get_jobs_from_project("project 1")
+
+        # Assert
+        self.assert_index_used(
+            self.explain_captured_select(), "ix_job_rest_project_name", index_only=True
+        )
+
+    def test__get_job_status__primary_key_is_used(self) -> None:
+        # Arrange
+
+        # Act
+        self.postgres_if.get_job_status(uuid.uuid4())
+
+        # Assert
+        self.assert_index_used(self.explain_captured_select(), "job_state_pkey")
+
+    def test__get_cached_result_job_id__result_hash_index_is_used(self) -> None:
+        # Arrange
+
+        # Act
+        self.postgres_if.get_cached_result_job_id("hash 1", datetime.now() - timedelta(days=1))
+
+        # Assert
+        self.assert_index_used(self.explain_captured_select(), "ix_job_rest_result_hash")
+
+    def test__get_job_statuses__primary_key_is_used(self) -> None:
+        # Arrange
+
+        # Act
+        self.postgres_if.get_job_statuses([uuid.uuid4(), uuid.uuid4()])
+
+        # Assert
+        self.assert_index_used(self.explain_captured_select(), "job_state_pkey")
+
+    def test__get_job_status__only_partition_of_job_is_scanned(self) -> None:
+        # Arrange
+        job_id = new_job_id()
+
+        # Act
+        self.postgres_if.get_job_status(job_id)
+
+        # Assert
+        self.assert_only_partitions_scanned(self.explain_captured_select(), job_id, ["job_state"])
+
+    def test__get_job__only_partitions_of_job_are_scanned(self) -> None:
+        # Arrange
+        job_id = new_job_id()
+
+        # Act
+        self.postgres_if.get_job(job_id)
+
+        # Assert
+        self.assert_only_partitions_scanned(
+            self.explain_captured_select(), job_id, ["job_rest", "job_state"]
+        )
+
+    def test__get_job_output_esdl__only_partition_of_job_is_scanned(self) -> None:
+        # Arrange
+        job_id = new_job_id()
+
+        # Act
+        self.postgres_if.get_job_output_esdl(job_id)
+
+        # Assert
+        self.assert_only_partitions_scanned(self.explain_captured_select(), job_id, ["job_rest"])
@@ -0,0 +1,104 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from flask import Flask
+
+from omotes_rest.profiling import PROFILE_HEADER, PROFILE_ID_HEADER, RequestProfiler, phase
+
+
+class RequestProfilerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.profile_dir = tempfile.TemporaryDirectory()
+        self.app = Flask(__name__)
+        self.request_profiler = RequestProfiler()
+        with patch.dict(
+            "os.environ",
+            {"PROFILING_ADMIN_TOKEN": "secret", "PROFILING_DIR": self.profile_dir.name},
+        ):
+            self.request_profiler.init_app(self.app)
+
+        @self.app.route("/work")
+        def work() -> str:
+            with phase("decode_esdl"):
+                pass
+            return "done"
+
+        self.client = self.app.test_client()
+
+    def tearDown(self) -> None:
+        self.profile_dir.cleanup()
+
+    def test__request_profiler__request_with_admin_token_is_profiled(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.client.get("/work", headers={PROFILE_HEADER: "secret"})
+
+        # Assert
+        self.assertIn("decode_esdl;dur=", result.headers["Server-Timing"])
+        self.assertIn("total;dur=", result.headers["Server-Timing"])
+        profile = self.request_profiler.profiles[0]
+        self.assertEqual(profile.profile_id, result.headers[PROFILE_ID_HEADER])
+        self.assertEqual(profile.status_code, 200)
+        self.assertIn("decode_esdl", profile.phases_s)
+        assert profile.profile_file
+        self.assertTrue(os.path.exists(profile.profile_file))
+
+    def test__request_profiler__request_without_admin_token_is_not_profiled(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.client.get("/work", headers={PROFILE_HEADER: "wrong"})
+
+        # Assert
+        self.assertNotIn("Server-Timing", result.headers)
+        self.assertEqual(len(self.request_profiler.profiles), 0)
+
+    def test__list_profiles__returns_profiles_to_admin(self) -> None:
+        # Arrange
+        profile_id = self.client.get("/work", headers={PROFILE_HEADER: "secret"}).headers[
+            PROFILE_ID_HEADER
+        ]
+
+        # Act
+        result = self.client.get("/profiling/", headers={PROFILE_HEADER: "secret"})
+        forbidden_result = self.client.get("/profiling/")
+
+        # Assert
+        self.assertEqual(result.status_code, 200)
+        assert result.json
+        self.assertEqual(result.json[0]["profile_id"], profile_id)
+        self.assertEqual(forbidden_result.status_code, 403)
+
+    def test__get_profile_file__returns_profile_file(self) -> None:
+        # Arrange
+        profile_id = self.client.get("/work", headers={PROFILE_HEADER: "secret"}).headers[
+            PROFILE_ID_HEADER
+        ]
+
+        # Act
+        result = self.client.get(f"/profiling/{profile_id}", headers={PROFILE_HEADER: "secret"})
+        missing_result = self.client.get("/profiling/unknown", headers={PROFILE_HEADER: "secret"})
+
+        # Assert
+        self.assertEqual(result.status_code, 200)
+        self.assertGreater(len(result.data), 0)
+        self.assertEqual(missing_result.status_code, 404)
+        result.close()
+
+    def test__request_profiler__oldest_profiles_are_removed(self) -> None:
+        # Arrange
+        assert self.request_profiler.config
+        self.request_profiler.config.max_profiles = 1
+        self.client.get("/work", headers={PROFILE_HEADER: "secret"})
+        oldest_profile = self.request_profiler.profiles[0]
+
+        # Act
+        self.client.get("/work", headers={PROFILE_HEADER: "secret"})
+
+        # Assert
+        self.assertEqual(len(self.request_profiler.profiles), 1)
+        assert oldest_profile.profile_file
+        self.assertFalse(os.path.exists(oldest_profile.profile_file))
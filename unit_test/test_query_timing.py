@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import patch
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+
+from omotes_rest.config import QueryTimingConfig
+from omotes_rest.query_timing import QueryTimer, RollingHistogram, parameter_sizes
+
+
+def select_value(engine: Engine, value: str) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT :value"), {"value": value})
+
+
+def select_from_unknown_table(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT * FROM unknown_table"))
+
+
+class QueryTimerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.engine = create_engine("sqlite://")
+        with patch.dict("os.environ", {"SQL_SLOW_QUERY_THRESHOLD_MS": "0"}):
+            self.query_timer = QueryTimer(QueryTimingConfig(), __file__)
+        self.query_timer.attach(self.engine)
+
+    def tearDown(self) -> None:
+        self.engine.dispose()
+
+    def test__query_timer__statement_tagged_with_calling_function(self) -> None:
+        # Arrange
+
+        # Act
+        with self.assertLogs("omotes_rest"):
+            select_value(self.engine, "value")
+            select_value(self.engine, "value")
+
+        # Assert
+        query_stats = self.query_timer.histogram.snapshot()
+        self.assertEqual(list(query_stats), ["select_value"])
+        self.assertEqual(query_stats["select_value"].count, 2)
+
+    def test__query_timer__slow_query_logged_with_parameter_sizes(self) -> None:
+        # Arrange
+        value = "secret esdl"
+
+        # Act
+        with self.assertLogs("omotes_rest", level="WARNING") as logs:
+            select_value(self.engine, value)
+
+        # Assert
+        self.assertIn("Slow query in select_value", logs.output[0])
+        self.assertIn(str(len(value)), logs.output[0])
+        self.assertNotIn(value, logs.output[0])
+
+    def test__query_timer__failed_statement_is_counted(self) -> None:
+        # Arrange
+
+        # Act
+        with self.assertLogs("omotes_rest", level="WARNING") as logs:
+            with self.assertRaises(OperationalError):
+                select_from_unknown_table(self.engine)
+
+        # Assert
+        self.assertIn("failed", logs.output[0])
+        query_stats = self.query_timer.histogram.snapshot()
+        self.assertEqual(query_stats["select_from_unknown_table"].count, 1)
+
+
+class RollingHistogramTest(unittest.TestCase):
+    def test__rolling_histogram__counts_durations_in_buckets(self) -> None:
+        # Arrange
+        histogram = RollingHistogram(window_s=60)
+
+        # Act
+        for _ in range(99):
+            histogram.record("get_job", 0.0015)
+        histogram.record("get_job", 20)
+
+        # Assert
+        query_stats = histogram.snapshot()["get_job"]
+        self.assertEqual(query_stats.count, 100)
+        self.assertEqual(query_stats.buckets["2"], 99)
+        self.assertEqual(query_stats.buckets["+Inf"], 1)
+        self.assertEqual(query_stats.p50_ms, 2)
+        self.assertEqual(query_stats.p99_ms, 2)
+        self.assertEqual(query_stats.max_ms, 20000)
+
+    def test__rolling_histogram__expired_durations_are_dropped(self) -> None:
+        # Arrange
+        histogram = RollingHistogram(window_s=60)
+        with patch("omotes_rest.query_timing.time.monotonic", return_value=1000):
+            histogram.record("get_job", 0.001)
+
+        # Act
+        with patch("omotes_rest.query_timing.time.monotonic", return_value=1030):
+            histogram.record("get_job", 0.001)
+            recent_stats = histogram.snapshot()
+        with patch("omotes_rest.query_timing.time.monotonic", return_value=1061):
+            expired_stats = histogram.snapshot()
+
+        # Assert
+        self.assertEqual(recent_stats["get_job"].count, 2)
+        self.assertEqual(expired_stats["get_job"].count, 1)
+
+
+class ParameterSizesTest(unittest.TestCase):
+    def test__parameter_sizes__many_parameter_sets(self) -> None:
+        # Arrange
+        parameters = [{"job_id": 1, "esdl": "x" * 100}, {"job_id": 2, "esdl": "y"}]
+
+        # Act
+        result = parameter_sizes(parameters)
+
+        # Assert
+        self.assertEqual(result, {"sets": 2, "first": {"job_id": "int", "esdl": 100}})
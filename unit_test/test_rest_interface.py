@@ -0,0 +1,454 @@
+import unittest
+import uuid
+from datetime import datetime, timezone
+from typing import Any, BinaryIO
+from unittest.mock import MagicMock, patch
+
+from omotes_sdk.workflow_type import WorkflowType
+from omotes_sdk_protocol.job_pb2 import JobResult, JobSubmission
+
+from omotes_rest.apis.api_dataclasses import (
+    JobCloneInput,
+    JobInput,
+    JobRestStatus,
+    JobStatusProgress,
+    JobSweepInput,
+)
+from omotes_rest.db_models.job_rest import JobRest
+from omotes_rest.job_partitions import add_months, month_start
+from omotes_rest.rest_interface import RestInterface, compute_result_hash
+from omotes_rest.workflow_params import InvalidJobParametersException
+
+
+class ComputeResultHashTest(unittest.TestCase):
+    def test__compute_result_hash__parameter_order_is_irrelevant(self) -> None:
+        # Arrange
+        params_a = {"a": 1, "b": {"c": 2, "d": 3}}
+        params_b = {"b": {"d": 3, "c": 2}, "a": 1}
+
+        # Act
+        hash_a = compute_result_hash("workflow", params_a, "esdl")
+        hash_b = compute_result_hash("workflow", params_b, "esdl")
+
+        # Assert
+        self.assertEqual(hash_a, hash_b)
+
+    def test__compute_result_hash__field_boundaries_are_distinct(self) -> None:
+        # Arrange
+
+        # Act
+        hash_a = compute_result_hash("workflow", {}, "esdl")
+        hash_b = compute_result_hash("workflo", {}, "wesdl")
+
+        # Assert
+        self.assertNotEqual(hash_a, hash_b)
+
+
+class RestInterfaceSubmitJobTest(unittest.TestCase):
+    def setUp(self) -> None:
+        with (
+            patch("omotes_rest.rest_interface.OmotesInterface"),
+            patch("omotes_rest.rest_interface.PostgresInterface"),
+        ):
+            self.rest_if = RestInterface()
+        self.omotes_if = MagicMock()
+        self.postgres_if = MagicMock()
+        self.rest_if.omotes_if = self.omotes_if
+        self.rest_if.postgres_if = self.postgres_if
+        workflow_type_manager = self.omotes_if.get_workflow_type_manager.return_value
+        workflow_type_manager.get_workflow_by_name.return_value = WorkflowType(
+            workflow_type_name="workflow", workflow_type_description_name="Workflow"
+        )
+
+    def test__submit_job__result_cache_hit_skips_sdk(self) -> None:
+        # Arrange
+        self.rest_if.result_cache_config.enabled = True
+        self.postgres_if.get_cached_result_job_id.return_value = uuid.uuid4()
+        self.postgres_if.put_new_cached_job.return_value = True
+
+        # Act
+        result = self.rest_if.submit_job(JobInput())
+
+        # Assert
+        self.assertEqual(result.status, JobRestStatus.SUCCEEDED)
+        self.omotes_if.submit_job.assert_not_called()
+        self.postgres_if.put_new_job.assert_not_called()
+        self.postgres_if.evict_result_cache.assert_not_called()
+
+    def test__submit_job__result_cache_miss_puts_job_in_outbox(self) -> None:
+        # Arrange
+        self.rest_if.result_cache_config.enabled = True
+        self.postgres_if.get_cached_result_job_id.return_value = None
+
+        # Act
+        result = self.rest_if.submit_job(JobInput())
+
+        # Assert
+        self.assertEqual(result.status, JobRestStatus.REGISTERED)
+        self.omotes_if.submit_job.assert_not_called()
+        self.assertEqual(self.postgres_if.put_new_job.call_args.kwargs["job_id"], result.job_id)
+        self.assertIsNotNone(self.postgres_if.put_new_job.call_args.kwargs["result_hash"])
+
+    def test__publish_job__job_submission_has_job_id_of_service(self) -> None:
+        # Arrange
+        job_rest = JobRest(
+            job_id=uuid.uuid4(),
+            job_name="job",
+            workflow_type="workflow",
+            job_priority="high",
+            timeout_after_s=60,
+            input_params_dict={},
+            input_esdl="esdl",
+        )
+
+        # Act
+        self.rest_if.publish_job(job_rest)
+
+        # Assert
+        connected_job = self.omotes_if.connect_to_submitted_job.call_args.args[0]
+        self.assertEqual(connected_job.id, job_rest.job_id)
+        message = self.omotes_if.broker_if.send_message_to.call_args.kwargs["message"]
+        job_submission = JobSubmission.FromString(message)
+        self.assertEqual(job_submission.uuid, str(job_rest.job_id))
+        self.assertEqual(job_submission.timeout_ms, 60000)
+        self.assertEqual(job_submission.job_priority, JobSubmission.JobPriority.HIGH)
+
+    def test__publish_job__queues_connected_once_when_publish_is_retried(self) -> None:
+        # Arrange
+        job_rest = JobRest(
+            job_id=uuid.uuid4(),
+            job_name="job",
+            workflow_type="workflow",
+            job_priority="medium",
+            timeout_after_s=60,
+            input_params_dict={},
+            input_esdl="esdl",
+        )
+        self.omotes_if.broker_if.send_message_to.side_effect = [ConnectionError(), None]
+        with self.assertRaises(ConnectionError):
+            self.rest_if.publish_job(job_rest)
+
+        # Act
+        self.rest_if.publish_job(job_rest)
+
+        # Assert
+        self.omotes_if.connect_to_submitted_job.assert_called_once()
+        self.assertEqual(self.omotes_if.broker_if.send_message_to.call_count, 2)
+
+    def test__submit_job__result_cache_disabled_does_not_hash(self) -> None:
+        # Arrange
+        self.rest_if.result_cache_config.enabled = False
+
+        # Act
+        self.rest_if.submit_job(JobInput())
+
+        # Assert
+        self.postgres_if.get_cached_result_job_id.assert_not_called()
+        self.assertIsNone(self.postgres_if.put_new_job.call_args.kwargs["result_hash"])
+
+    def test__get_params_validator__reused_until_workflow_type_is_replaced(self) -> None:
+        # Arrange
+        workflow_type = WorkflowType(
+            workflow_type_name="workflow", workflow_type_description_name="Workflow"
+        )
+        updated_workflow_type = WorkflowType(
+            workflow_type_name="workflow", workflow_type_description_name="Workflow"
+        )
+
+        # Act
+        first = self.rest_if.get_params_validator(workflow_type)
+        second = self.rest_if.get_params_validator(workflow_type)
+        updated = self.rest_if.get_params_validator(updated_workflow_type)
+
+        # Assert
+        self.assertIs(first, second)
+        self.assertIsNot(first, updated)
+        self.assertIs(updated.workflow_type, updated_workflow_type)
+
+    def test__get_job_stats__cached_within_ttl(self) -> None:
+        # Arrange
+        self.rest_if.job_stats_cache_ttl_s = 60
+
+        # Act
+        first = self.rest_if.get_job_stats()
+        second = self.rest_if.get_job_stats()
+
+        # Assert
+        self.assertIs(first, second)
+        self.postgres_if.get_job_stats.assert_called_once()
+
+    def test__get_job_stats__refreshed_after_ttl(self) -> None:
+        # Arrange
+        self.rest_if.job_stats_cache_ttl_s = -1
+
+        # Act
+        self.rest_if.get_job_stats()
+        self.rest_if.get_job_stats()
+
+        # Assert
+        self.assertEqual(self.postgres_if.get_job_stats.call_count, 2)
+
+    def test__get_job_statuses__unknown_job_ids_are_reported(self) -> None:
+        # Arrange
+        known_job_id = uuid.uuid4()
+        unknown_job_id = uuid.uuid4()
+        job_status = JobStatusProgress(
+            job_id=known_job_id,
+            status=JobRestStatus.RUNNING,
+            progress_fraction=0.5,
+            progress_message="Halfway.",
+        )
+        self.postgres_if.get_job_statuses.return_value = [job_status]
+
+        # Act
+        result = self.rest_if.get_job_statuses([known_job_id, unknown_job_id])
+
+        # Assert
+        self.assertEqual(result.jobs, [job_status])
+        self.assertEqual(result.unknown_job_ids, [unknown_job_id])
+
+    def test__get_job_output_esdl__served_from_payload_cache(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        self.postgres_if.get_job_status.return_value = JobRestStatus.SUCCEEDED
+        self.postgres_if.get_job_output_esdl.return_value = "output esdl"
+
+        # Act
+        first = self.rest_if.get_job_output_esdl(job_id)
+        second = self.rest_if.get_job_output_esdl(job_id)
+
+        # Assert
+        self.assertEqual(first, "output esdl")
+        self.assertEqual(second, "output esdl")
+        self.postgres_if.get_job_output_esdl.assert_called_once_with(job_id)
+        self.assertEqual(self.rest_if.payload_cache.hits, 1)
+        self.assertEqual(self.rest_if.payload_cache.misses, 1)
+
+    def test__get_job_logs__missing_logs_are_not_cached(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        self.postgres_if.get_job_logs.return_value = None
+
+        # Act
+        self.rest_if.get_job_logs(job_id)
+        self.rest_if.get_job_logs(job_id)
+
+        # Assert
+        self.assertEqual(self.postgres_if.get_job_logs.call_count, 2)
+
+    def test__delete_job__payload_cache_is_invalidated(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        self.postgres_if.get_job_status.return_value = JobRestStatus.ERROR
+        self.postgres_if.get_job_logs.return_value = "logs"
+        self.rest_if.get_job_logs(job_id)
+
+        # Act
+        self.rest_if.delete_job(job_id)
+
+        # Assert
+        self.assertIsNone(self.rest_if.payload_cache.get(f"{job_id}/logs"))
+
+    def test__get_job_output_esdl__cache_not_used_for_deleted_or_running_job(self) -> None:
+        # Arrange
+        job_id = uuid.uuid4()
+        self.postgres_if.get_job_status.return_value = JobRestStatus.SUCCEEDED
+        self.postgres_if.get_job_output_esdl.return_value = "output esdl"
+        self.rest_if.get_job_output_esdl(job_id)
+
+        # Act
+        self.postgres_if.get_job_status.return_value = JobRestStatus.RUNNING
+        running = self.rest_if.get_job_output_esdl(job_id)
+        self.postgres_if.get_job_status.return_value = None
+        deleted = self.rest_if.get_job_output_esdl(job_id)
+
+        # Assert
+        self.assertEqual(running, "output esdl")
+        self.assertEqual(self.postgres_if.get_job_output_esdl.call_count, 2)
+        self.assertIsNone(deleted)
+        self.assertIsNone(self.rest_if.payload_cache.get(f"{job_id}/output_esdl"))
+
+    def test__submit_job__job_id_encodes_registration_time(self) -> None:
+        # Arrange
+
+        # Act
+        result = self.rest_if.submit_job(JobInput())
+
+        # Assert
+        self.assertEqual(result.job_id.version, 7)
+
+    def test__submit_job__job_partitions_not_maintained(self) -> None:
+        # Arrange
+
+        # Act
+        self.rest_if.submit_job(JobInput())
+
+        # Assert
+        self.postgres_if.create_job_partitions.assert_not_called()
+
+    def test__maintain_job_partitions__coming_months_are_created(self) -> None:
+        # Arrange
+        self.rest_if.job_partition_config.months_ahead = 3
+
+        # Act
+        self.rest_if.maintain_job_partitions()
+
+        # Assert
+        self.postgres_if.create_job_partitions.assert_called_once()
+        first_month, last_month = self.postgres_if.create_job_partitions.call_args.args
+        self.assertEqual(first_month, month_start(datetime.now(timezone.utc)))
+        self.assertEqual(last_month, add_months(first_month, 3))
+        self.postgres_if.detach_job_partitions.assert_not_called()
+
+    def test__maintain_job_partitions__expired_partitions_are_dropped(self) -> None:
+        # Arrange
+        self.rest_if.job_partition_config.retention_months = 12
+        self.rest_if.job_partition_config.drop_expired = True
+
+        # Act
+        self.rest_if.maintain_job_partitions()
+
+        # Assert
+        self.postgres_if.detach_job_partitions.assert_called_once_with(
+            add_months(month_start(datetime.now(timezone.utc)), -12), drop=True
+        )
+
+    def test__handle_on_job_progress_update__progress_is_written_in_batch(self) -> None:
+        # Arrange
+        job = MagicMock(id=uuid.uuid4())
+
+        # Act
+        self.rest_if.handle_on_job_progress_update(job, MagicMock(progress=0.2, message="first"))
+        self.rest_if.handle_on_job_progress_update(job, MagicMock(progress=0.4, message="second"))
+        self.rest_if.job_progress_writer.flush()
+
+        # Assert
+        self.postgres_if.set_job_progress.assert_not_called()
+        self.postgres_if.set_jobs_progress.assert_called_once_with({job.id: (0.4, "second")})
+
+    def test__clone_job__parameters_and_input_are_merged(self) -> None:
+        # Arrange
+        self.postgres_if.get_job_clone_source.return_value = JobInput(
+            job_name="source",
+            workflow_type="workflow",
+            user_name="user",
+            input_params_dict={"a": 1, "b": 2},
+            timeout_after_s=60,
+            job_priority="low",
+        )
+        self.postgres_if.put_cloned_jobs.return_value = True
+        source_job_id = uuid.uuid4()
+
+        # Act
+        result = self.rest_if.clone_job(
+            source_job_id, JobCloneInput(job_name="clone", input_params_dict={"b": 3})
+        )
+
+        # Assert
+        assert result is not None
+        self.assertEqual(result.status, JobRestStatus.REGISTERED)
+        self.postgres_if.get_stored_esdl_result_hashes.assert_not_called()
+        ((job_id, job_input, result_hash),) = self.postgres_if.put_cloned_jobs.call_args.args[1]
+        self.assertEqual(job_id, result.job_id)
+        self.assertEqual(job_input.job_name, "clone")
+        self.assertEqual(job_input.user_name, "user")
+        self.assertEqual(job_input.input_params_dict, {"a": 1, "b": 3})
+        self.assertEqual(job_input.timeout_after_s, 60)
+        self.assertEqual(job_input.job_priority, "low")
+        self.assertIsNone(result_hash)
+
+    def test__clone_job__unknown_job_is_none(self) -> None:
+        # Arrange
+        self.postgres_if.get_job_clone_source.return_value = None
+
+        # Act
+        result = self.rest_if.clone_job(uuid.uuid4(), JobCloneInput())
+
+        # Assert
+        self.assertIsNone(result)
+        self.postgres_if.put_cloned_jobs.assert_not_called()
+
+    def test__sweep_job__job_per_combination_with_cache_hits(self) -> None:
+        # Arrange
+        self.rest_if.result_cache_config.enabled = True
+        self.postgres_if.get_job_clone_source.return_value = JobInput(
+            job_name="source", workflow_type="workflow", input_params_dict={"a": 0}
+        )
+        self.postgres_if.get_stored_esdl_result_hashes.return_value = ["h1", "h2", "h3", "h4"]
+        cached_job_id = uuid.uuid4()
+        self.postgres_if.get_cached_result_job_id.side_effect = [None, cached_job_id, None, None]
+        self.postgres_if.put_new_cached_job.return_value = True
+        self.postgres_if.put_cloned_jobs.return_value = True
+
+        # Act
+        result = self.rest_if.sweep_job(
+            JobSweepInput(
+                job_id=uuid.uuid4(),
+                parameter_grid={"a": [1, 2], "b": ["x", "y"]},
+                overrides=JobCloneInput(input_params_dict={"c": True}),
+            )
+        )
+
+        # Assert
+        assert result is not None
+        self.assertEqual(
+            [response.status for response in result],
+            [
+                JobRestStatus.REGISTERED,
+                JobRestStatus.SUCCEEDED,
+                JobRestStatus.REGISTERED,
+                JobRestStatus.REGISTERED,
+            ],
+        )
+        clones = self.postgres_if.put_cloned_jobs.call_args.args[1]
+        self.assertEqual(
+            [job_id for job_id, _, _ in clones],
+            [result[0].job_id] + [response.job_id for response in result[2:]],
+        )
+        self.assertEqual(
+            [job_input.job_name for _, job_input, _ in clones],
+            ["source (a=1, b=x)", "source (a=2, b=x)", "source (a=2, b=y)"],
+        )
+        self.assertEqual(clones[0][1].input_params_dict, {"a": 1, "b": "x", "c": True})
+        self.assertEqual([result_hash for _, _, result_hash in clones], ["h1", "h3", "h4"])
+
+    def test__sweep_job__too_many_combinations_are_rejected(self) -> None:
+        # Arrange
+        self.rest_if.job_sweep_config.max_jobs = 3
+
+        # Act / Assert
+        with self.assertRaises(InvalidJobParametersException):
+            self.rest_if.sweep_job(
+                JobSweepInput(job_id=uuid.uuid4(), parameter_grid={"a": [1, 2], "b": [1, 2]})
+            )
+        self.postgres_if.get_job_clone_source.assert_not_called()
+
+    def test__handle_on_job_finished__large_result_is_spilled_to_file(self) -> None:
+        # Arrange
+        self.rest_if.job_result_config.spill_threshold_bytes = 5
+        job = MagicMock(id=uuid.uuid4())
+        spilled: list[bytes] = []
+        in_flight_while_stored: list[int] = []
+
+        def set_job_stopped_with_result_file(result_file: BinaryIO, **kwargs: Any) -> None:
+            spilled.append(result_file.read())
+            in_flight_while_stored.append(self.rest_if.job_result_budget.in_flight)
+
+        self.postgres_if.set_job_stopped_with_result_file.side_effect = (
+            set_job_stopped_with_result_file
+        )
+
+        # Act
+        self.rest_if.handle_on_job_finished(
+            job, JobResult(result_type=JobResult.ResultType.SUCCEEDED, logs="short")
+        )
+        self.rest_if.handle_on_job_finished(
+            job,
+            JobResult(result_type=JobResult.ResultType.SUCCEEDED, output_esdl="large esdl"),
+        )
+
+        # Assert
+        self.postgres_if.set_job_stopped.assert_called_once()
+        self.assertEqual(spilled, [b"large esdl\t\n"])
+        self.assertEqual(in_flight_while_stored, [len("large esdl")])
+        self.assertEqual(self.rest_if.job_result_budget.in_flight, 0)
@@ -0,0 +1,48 @@
+import threading
+import unittest
+
+from omotes_rest.result_cache_eviction import ResultCacheEvictor
+
+
+class ResultCacheEvictorTest(unittest.TestCase):
+    def test__result_cache_evictor__evicts_at_start_and_each_interval_after_failure(self) -> None:
+        # Arrange
+        evicted = threading.Semaphore(0)
+        calls: list[int] = []
+
+        def evict() -> None:
+            calls.append(1)
+            evicted.release()
+            if len(calls) == 1:
+                raise ConnectionError("database unavailable")
+
+        evictor = ResultCacheEvictor(evict, interval_s=0.01)
+
+        # Act
+        with self.assertLogs("omotes_rest", level="ERROR"):
+            evictor.start()
+            evicted.acquire(timeout=5)
+            evicted_again = evicted.acquire(timeout=5)
+        evictor.stop()
+
+        # Assert
+        self.assertTrue(evicted_again)
+
+    def test__result_cache_evictor__evicts_once_before_first_interval(self) -> None:
+        # Arrange
+        evicted = threading.Event()
+        calls: list[int] = []
+
+        def evict() -> None:
+            calls.append(1)
+            evicted.set()
+
+        evictor = ResultCacheEvictor(evict, interval_s=60)
+
+        # Act
+        evictor.start()
+        evicted.wait(timeout=5)
+        evictor.stop()
+
+        # Assert
+        self.assertEqual(calls, [1])
@@ -0,0 +1,124 @@
+import unittest
+from datetime import datetime, timedelta
+
+from omotes_sdk.workflow_type import (
+    BooleanParameter,
+    DateTimeParameter,
+    DurationParameter,
+    FloatParameter,
+    IntegerParameter,
+    StringEnumOption,
+    StringParameter,
+    WorkflowType,
+)
+from omotes_sdk_protocol.workflow_pb2 import WorkflowParameter as WorkflowParameterPb
+
+from omotes_rest.workflow_params import InvalidJobParametersException, WorkflowParamsValidator
+
+
+def create_workflow_type() -> WorkflowType:
+    return WorkflowType(
+        workflow_type_name="workflow",
+        workflow_type_description_name="Workflow",
+        workflow_parameters=[
+            StringParameter(
+                key_name="solver",
+                enum_options=[
+                    StringEnumOption(key_name="highs", display_name="HiGHS"),
+                    StringEnumOption(key_name="gurobi", display_name="Gurobi"),
+                ],
+            ),
+            BooleanParameter(key_name="verbose"),
+            IntegerParameter(key_name="iterations", minimum=1, maximum=10),
+            FloatParameter(
+                key_name="lower",
+                minimum=0.0,
+                constraints=[
+                    WorkflowParameterPb.Constraint(
+                        other_key_name="upper",
+                        relation=WorkflowParameterPb.Constraint.RelationType.SMALLER,
+                    )
+                ],
+            ),
+            FloatParameter(key_name="upper", maximum=100.0),
+            DateTimeParameter(key_name="start"),
+            DurationParameter(key_name="horizon", maximum=timedelta(days=1)),
+        ],
+    )
+
+
+def create_valid_input() -> dict:
+    return {
+        "solver": "highs",
+        "verbose": False,
+        "iterations": 5.0,
+        "lower": 1,
+        "upper": 2.5,
+        "start": "2024-01-01T00:00:00",
+        "horizon": 3600,
+    }
+
+
+class WorkflowParamsValidatorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.validator = WorkflowParamsValidator(create_workflow_type())
+
+    def test__validate__valid_input_is_converted(self) -> None:
+        # Arrange
+        input_params = create_valid_input()
+
+        # Act
+        result = self.validator.validate(input_params)
+
+        # Assert
+        self.assertEqual(
+            result,
+            {
+                "solver": "highs",
+                "verbose": False,
+                "iterations": 5,
+                "lower": 1.0,
+                "upper": 2.5,
+                "start": datetime(2024, 1, 1),
+                "horizon": timedelta(hours=1),
+            },
+        )
+        self.assertIsInstance(result["iterations"], int)
+
+    def test__validate__invalid_input_is_rejected(self) -> None:
+        # Arrange
+        invalid_values = [
+            ("solver", "cplex"),
+            ("solver", 1),
+            ("verbose", "true"),
+            ("iterations", 11),
+            ("iterations", 1.5),
+            ("iterations", True),
+            ("lower", -1.0),
+            ("lower", 3.0),
+            ("upper", "2"),
+            ("start", "yesterday"),
+            ("horizon", 86401),
+            ("horizon", None),
+        ]
+
+        for key_name, value in invalid_values:
+            with self.subTest(key_name=key_name, value=value):
+                input_params = create_valid_input()
+                input_params[key_name] = value
+
+                # Act / Assert
+                with self.assertRaises(InvalidJobParametersException):
+                    self.validator.validate(input_params)
+
+    def test__validate__workflow_without_parameters(self) -> None:
+        # Arrange
+        validator = WorkflowParamsValidator(
+            WorkflowType(workflow_type_name="empty", workflow_type_description_name="Empty")
+        )
+
+        # Act
+        result = validator.validate({"ignored": 1})
+
+        # Assert
+        self.assertEqual(result, {})